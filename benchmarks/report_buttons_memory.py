@@ -0,0 +1,83 @@
+"""
+Memory used by the bot's view store for 10k report messages, before and after templated report buttons.
+
+Before: /loadreports registered one BugReportApprovalView per re-sent report.
+After: BugReportButton is registered once and report messages are sent with a stopped view.
+
+Run from the repository root: python -m benchmarks.report_buttons_memory
+"""
+import asyncio
+import gc
+import tracemalloc
+
+from discord.ui.view import ViewStore
+from cogs.bugreports import BugReportApprovalView, BugReportButton, report_buttons_view
+
+REPORT_COUNT = 10_000
+FIRST_MESSAGE_ID = 1_200_000_000_000_000_000
+
+
+def _fake_reports():
+    return [
+        {
+            "id": report_id,
+            "title": f"Report {report_id}",
+            "severity": "medium",
+            "status": "pending",
+            "category": "mining",
+            "reporterID": "123456789012345678",
+            "reportedAt": "2025-01-01",
+            "description": "Something went wrong " * 10,
+            "reproducesteps": "1. Do this\\n2. Do that",
+        }
+        for report_id in range(1, REPORT_COUNT + 1)
+    ]
+
+
+class _LegacyApprovalView(BugReportApprovalView):
+    """The per-report view as it was: each instance held its report ID and data."""
+
+    def __init__(self, report_id: int, report_data: dict):
+        super().__init__(None, None)
+        self.message = None
+        self.report_id = report_id
+        self.report_data = report_data
+
+
+def _measure(register_reports) -> int:
+    gc.collect()
+    tracemalloc.start()
+    store = ViewStore(None)
+    register_reports(store)
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    gc.collect()
+    return used
+
+
+async def main():
+    reports = _fake_reports()
+
+    def per_report_views(store):
+        for offset, report in enumerate(reports):
+            store.add_view(_LegacyApprovalView(report["id"], report), FIRST_MESSAGE_ID + offset)
+
+    def dynamic_items(store):
+        store.add_dynamic_items(BugReportButton)
+        for report in reports:
+            # What Messageable.send does with the view after sending: a stopped view is not stored
+            view = report_buttons_view("pending", report["id"])
+            if not view.is_finished():
+                store.add_view(view)
+
+    before = _measure(per_report_views)
+    after = _measure(dynamic_items)
+    print(f"{REPORT_COUNT} report messages")
+    print(f"  one registered view per report: {before / 1024 / 1024:.2f} MiB")
+    print(f"  templated BugReportButton:      {after / 1024:.2f} KiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Resident memory per bug report at 100k reports: stored documents as dicts versus BugReport records.
+
+Documents are decoded from JSON, like pymongo decodes BSON, so every report gets its own key-value strings
+("pending", "mining", the reporter ID, the date) as it does when loaded from storage.
+
+Run from the repository root: python -m benchmarks.report_records_memory
+"""
+import gc
+import json
+import random
+import tracemalloc
+
+from utils.records import BugReport
+
+REPORT_COUNT = 100_000
+CATEGORIES = ["mining", "foraging", "dungeons", "slayers", "island", "fishing", "others"]
+SEVERITIES = ["very high", "high", "medium", "low", "n/a"]
+STATUSES = ["pending", "approved", "fixed", "declined"]
+
+
+def _stored_documents() -> list:
+    rng = random.Random(0)
+    documents = []
+    for report_id in range(1, REPORT_COUNT + 1):
+        document = {
+            "id": report_id,
+            "title": f"Report {report_id}",
+            "severity": rng.choice(SEVERITIES),
+            "status": rng.choice(STATUSES),
+            "category": rng.choice(CATEGORIES),
+            "reporterID": str(rng.randrange(10**17, 10**18)),
+            "reportedAt": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "submittedAt": f"2025-01-01T00:00:{report_id % 60:02d}+00:00",
+            "statusChangedAt": f"2025-01-02T00:00:{report_id % 60:02d}+00:00",
+            "priorityKey": rng.random() * 20000,
+            "description": f"Something went wrong {report_id} " * 5,
+            "reproducesteps": "1. Do this\\n2. Do that",
+        }
+        documents.append(json.loads(json.dumps(document)))
+    return documents
+
+
+def _measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    resident = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resident
+    return current
+
+
+def _as_records():
+    # Only the records stay resident; the documents are dropped after conversion as in BugReportManager
+    return [BugReport.from_document(document) for document in _stored_documents()]
+
+
+def main():
+    dict_bytes = _measure(_stored_documents)
+    record_bytes = _measure(_as_records)
+    print(f"{REPORT_COUNT:,} reports")
+    print(f"  dicts:   {dict_bytes / 2**20:8.2f} MiB  ({dict_bytes / REPORT_COUNT:6.0f} bytes/report)")
+    print(f"  records: {record_bytes / 2**20:8.2f} MiB  ({record_bytes / REPORT_COUNT:6.0f} bytes/report)")
+    print(f"  saved:   {(dict_bytes - record_bytes) / REPORT_COUNT:6.0f} bytes/report ({1 - record_bytes / dict_bytes:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,87 +3,577 @@ import discord
 import datetime
 from collections import defaultdict
 from typing import Optional
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands, ui, Interaction
 from dotenv import load_dotenv
-from utils.loader import load_data, save_data, _get_db
-from utils.commands import get_admin_info
-from datetime import datetime, timezone
+from utils.loader import load_data, _get_db, upsert_data, upsert_many, delete_data, ensure_indexes, count_data
+from utils.permissions import permissions, admin_only
+from utils.search import BugSearchIndex
+from utils.similarity import DuplicateIndex, minhash_signature, NUM_PERMUTATIONS
+from utils.outbound import PRIORITY_INTERACTION, PRIORITY_BULK
+from utils import rollups, archive
+from utils.messages import MessageRegistry
+from utils.export import export_query, write_export
+from utils.pagination import fetch_page, sort_cursor
+from utils.records import BugReport
+from utils.priority import ReportPriorityQueue, ReporterStats, outcome_increments, persist_reporter_updates, priority_key
+from utils.triage import TriageProjection, METRIC_NAMES, DIMENSIONS, entered_state_at, persist_transition, persist_transitions, utcnow_iso, format_duration
+from datetime import datetime, timezone, timedelta
 import asyncio
+import time
+import tempfile
+
+# Only reports that can still be acted on are considered when looking for duplicates
+OPEN_STATUSES = ("pending", "approved")
+
+# /loadreports settings
+LOAD_REPORTS_CHECKPOINTS = "loadreports_checkpoint"
+BULK_DELETE_BATCH_SIZE = 100  # Discord's bulk delete limit
+BULK_DELETE_MAX_AGE_DAYS = 14  # Discord refuses to bulk delete anything older
+PROGRESS_UPDATE_INTERVAL = 5  # Seconds between progress message edits
+
+# /buglist pages straight from the hot collection. Each sort is a list of stored fields ending in the unique ID,
+# backed by the indexes below. sortDate and severityRank are written by BugReport.to_document; the manager keeps priorityKey current.
+BUGLIST_SORTS = {
+    "id_ascending": [("id", 1)],
+    "date_ascending": [("sortDate", 1), ("id", 1)],
+    "date_descending": [("sortDate", -1), ("id", 1)],
+    "severity_high": [("severityRank", 1), ("id", 1)],
+    "severity_low": [("severityRank", -1), ("id", 1)],
+    "priority": [("priorityKey", 1), ("id", 1)],
+}
+HOT_INDEXES = [
+    [("id", 1)],
+    [("status", 1), ("id", 1)],
+    [("category", 1), ("id", 1)],
+    [("status", 1), ("category", 1), ("id", 1)],
+] + [
+    keys
+    for field in ("sortDate", "severityRank", "priorityKey")
+    for keys in ([(field, 1), ("id", 1)], [("status", 1), (field, 1), ("id", 1)])
+]
+# priorityKey of reports that are not in the review queue, so they sort after every queued report
+NOT_QUEUED_PRIORITY = 1e18
+
+# /nextbug hands a report to one admin; others skip it until it is triaged or the claim runs out
+CLAIM_DURATION = timedelta(minutes=30)
+
+# /bulktriage settings
+MAX_BULK_TRIAGE = 100  # Reports per /bulktriage run
+# action -> (status the reports must have, status they move to). The report buttons check against it too.
+BULK_TRIAGE_ACTIONS = {
+    "approve": ("pending", "approved"),
+    "decline": ("pending", "declined"),
+    "fixed": ("approved", "fixed"),
+    "declined": ("approved", "declined"),  # Button only; /bulktriage offers the first three
+}
+
+
+def parse_report_ids(text: str) -> list:
+    """
+    Parses IDs and inclusive ranges separated by commas or spaces ("12, 15-20 31") into sorted unique IDs.
+    Raises ValueError on anything else.
+    """
+    report_ids = set()
+    for part in text.replace(",", " ").split():
+        if "-" in part:
+            start, end = (int(bound) for bound in part.split("-", 1))
+            if end < start or end - start >= MAX_BULK_TRIAGE:
+                raise ValueError(f"Invalid range: {part}")
+            report_ids.update(range(start, end + 1))
+        else:
+            report_ids.add(int(part))
+    return sorted(report_ids)
 
 class BugReportManager:
     def __init__(self, bot):
         self.bot = bot
-        self.reports = load_data("bugrep")
-        for report in self.reports:
+        # Only the hot set stays resident; closed reports move to the archive collection (see archive_closed_reports).
+        # Everything starts empty and is filled by load() during the cog's warm-up.
+        self.reports = []
+        self.next_id = 1
+        self._id_lock = asyncio.Lock()
+        # Bumped on every change to self.reports; cached sorted views are only valid for the version they were built at
+        self.version = 0
+        self._sorted_cache = {}  # (category, status, sort_by) -> (version, sorted list)
+        self._reports_by_id = {}
+        self.search_index = BugSearchIndex()
+        self.duplicate_index = DuplicateIndex()
+        self.triage = TriageProjection()
+        self.messages = MessageRegistry()
+        self.reporter_stats = ReporterStats()
+        self.priority_queue = ReportPriorityQueue()
+        self.claims = {}  # report ID -> (admin ID, claim expiry)
+        self.actions_in_flight = set()  # Report IDs with a button action running
+        self._stored_ids = set()  # Report IDs in the hot collection as of the last load or save
+        self._unsaved_ids = set()  # Report IDs changed in memory since the last save
+        self._save_lock = asyncio.Lock()
+
+    async def load(self):
+        """Reads the hot set and the stored projections. The reads are independent, so they run concurrently."""
+        documents, archived_max_id, stored_signatures, _, _, _, _, _, _ = await asyncio.gather(
+            asyncio.to_thread(load_data, archive.HOT_COLLECTION),
+            asyncio.to_thread(archive.max_archived_id),
+            asyncio.to_thread(load_data, "bugsig"),
+            asyncio.to_thread(self.triage.load),
+            self.messages.load(),
+            asyncio.to_thread(self.reporter_stats.load, archive.REPORT_COLLECTIONS),
+            asyncio.to_thread(rollups.ensure_rollups, archive.REPORT_COLLECTIONS),
+            asyncio.to_thread(ensure_indexes, archive.HOT_COLLECTION, HOT_INDEXES),
+            asyncio.to_thread(ensure_indexes, archive.ARCHIVE_COLLECTION, archive.ARCHIVE_INDEXES),
+        )
+        missing_sort_fields = [document.get("id", 0) for document in documents if "priorityKey" not in document or "sortDate" not in document]
+        self.reports = self._to_records(documents)
+        self._stored_ids = {report.get("id", 0) for report in self.reports}
+        del documents
+        # Archived reports keep their IDs, so new IDs have to start above both collections
+        hot_max_id = max([report.get("id", 0) for report in self.reports]) if self.reports else 0
+        self.next_id = max(hot_max_id, archived_max_id) + 1
+        self._rebuild_sort_keys()
+        if missing_sort_fields:
+            # Reports saved before the derived sort fields existed
+            self._unsaved_ids.update(missing_sort_fields)
+            await self._save_reports()
+        stored_signatures = {doc["id"]: doc["signature"] for doc in stored_signatures if "id" in doc and "signature" in doc}
+        await self._sync_duplicate_index(stored_signatures)
+
+    @staticmethod
+    def _to_records(documents: list) -> list:
+        """Stored documents -> BugReport records; reports saved before statuses existed are pending."""
+        reports = []
+        for document in documents:
+            report = BugReport.from_document(document)
             if "status" not in report:
                 report["status"] = "pending"
-        self.next_id = max([report.get("id", 0) for report in self.reports]) + 1 if self.reports else 1
-        self._id_lock = asyncio.Lock()
+            reports.append(report)
+        return reports
+
+    def _rebuild_sort_keys(self):
+        self._reports_by_id = {report.get("id", 0): report for report in self.reports}
+        self.search_index.rebuild(self.reports)
+        self.priority_queue = ReportPriorityQueue()
+        for report in self.reports:
+            self._queue_report(report)
+        self._mark_changed()
+
+    def _queue_report(self, report: BugReport):
+        """Puts a pending report in the priority queue (or refreshes its key); anything else is taken out."""
+        report_id = report.get("id", 0)
+        old_key = report.get("priorityKey")
+        if (report.get("status") or "pending").lower() != "pending":
+            self.priority_queue.remove(report_id)
+            self.claims.pop(report_id, None)
+            report["priorityKey"] = NOT_QUEUED_PRIORITY
+        else:
+            reporter_id = str(report.get("reporterID"))
+            report["priorityKey"] = priority_key(report, self.reporter_stats.approval_ratio(reporter_id))
+            self.priority_queue.push(report_id, report["priorityKey"], reporter_id)
+        if report["priorityKey"] != old_key:
+            self._unsaved_ids.add(report_id)  # /buglist sorts on the stored key
+
+    def _mark_changed(self):
+        self.version += 1
+        self._sorted_cache.clear()
 
     async def _load_reports(self):
-        reports = await asyncio.to_thread(load_data, "bugrep")
-        for report in reports:
-            if "status" not in report:
-                report["status"] = "pending"
+        documents = await asyncio.to_thread(load_data, archive.HOT_COLLECTION)
+        reports = self._to_records(documents)
+        self._stored_ids = {report.get("id", 0) for report in reports}
         return reports
 
-    async def _save_reports(self):
-        await asyncio.to_thread(save_data, "bugrep", self.reports)
+    @staticmethod
+    def _needs_signature(report) -> bool:
+        return report.get("status", "pending").lower() in OPEN_STATUSES
 
-    async def add_report(self, report_data: dict):
+    async def _sync_duplicate_index(self, stored_signatures: dict = None):
+        """
+        Makes the duplicate index hold exactly the open reports.
+        Uses stored signatures where available and stores newly computed ones as bugsig documents.
+        The index itself is only read and changed on the event loop; the worker thread gets copies of the
+        report text it has to hash and nothing else.
+        """
+        stored_signatures = stored_signatures or {}
+        to_hash = {}  # report ID -> copy of the fields minhash_signature reads
+        for report in self.reports:
+            report_id = report.get("id", 0)
+            if self._needs_signature(report) and report_id not in self.duplicate_index.signatures:
+                signature = stored_signatures.get(report_id)
+                if signature is None or len(signature) != NUM_PERMUTATIONS:
+                    to_hash[report_id] = {field: report.get(field, "") for field in ("title", "description", "reproducesteps")}
+        computed = {}
+        if to_hash:
+            computed = await asyncio.to_thread(lambda: {report_id: minhash_signature(fields) for report_id, fields in to_hash.items()})
+
+        # Back on the loop with no awaits until the index matches self.reports as it is now
+        for report in self.reports:
+            report_id = report.get("id", 0)
+            if self._needs_signature(report):
+                if report_id not in self.duplicate_index.signatures:
+                    signature = computed.get(report_id) or stored_signatures.get(report_id)
+                    if signature is None or len(signature) != NUM_PERMUTATIONS:
+                        signature = minhash_signature(report)  # Changed while the others were hashed
+                    self.duplicate_index.add(report_id, signature)
+            else:
+                self.duplicate_index.remove(report_id)
+        # Reports that no longer exist
+        for report_id in [rid for rid in self.duplicate_index.signatures if rid not in self._reports_by_id]:
+            self.duplicate_index.remove(report_id)
+        if computed:
+            await asyncio.to_thread(upsert_many, "bugsig", [{"id": report_id, "signature": signature} for report_id, signature in computed.items()])
+
+    async def reload_reports(self):
+        self.reports = await self._load_reports()
+        self._rebuild_sort_keys()
+        await self._sync_duplicate_index()
+
+    async def _save_reports(self):
+        """
+        Writes the hot set in place: replaces only the reports changed since the last save, then deletes the IDs
+        that left the set. The collection never goes empty mid-save, so /buglist pages read from it stay complete.
+        Saves run one at a time, so an older snapshot can never land after a newer one.
+        """
+        async with self._save_lock:
+            # Converted on the loop so the saved snapshot is consistent even if reports change while it is written
+            changed_ids, self._unsaved_ids = self._unsaved_ids, set()
+            documents = [self._reports_by_id[report_id].to_document() for report_id in sorted(changed_ids) if report_id in self._reports_by_id]
+            current_ids = set(self._reports_by_id)
+            removed_ids = self._stored_ids - current_ids
+            self._stored_ids = current_ids
+            await asyncio.to_thread(upsert_many, archive.HOT_COLLECTION, documents)
+            if removed_ids:
+                await asyncio.to_thread(delete_data, archive.HOT_COLLECTION, {"id": {"$in": sorted(removed_ids)}})
+
+    async def add_report(self, report_data: dict, signature: list = None):
         async with self._id_lock:
             report_data["id"] = self.next_id
             report_data["status"] = "pending"
-            self.reports.append(report_data)
+            report_data.setdefault("submittedAt", utcnow_iso())
+            report_data["statusChangedAt"] = report_data["submittedAt"]
+            report = BugReport.from_document(report_data)
+            self.reports.append(report)
+            self._reports_by_id[report.id] = report
+            self.search_index.add(report.id, report)
+            if signature is None:
+                signature = minhash_signature(report)
+            self.duplicate_index.add(report.id, signature)
+            self._queue_report(report)
+            self._unsaved_ids.add(report.id)
+            self._mark_changed()
             await self._save_reports()
+            await asyncio.to_thread(upsert_data, "bugsig", {"id": report_data["id"], "signature": list(signature)})
+            await asyncio.to_thread(rollups.record_increments, report_data.get("reportedAt"), rollups.report_increments(report_data))
+            submitted_event = {"report_id": report_data["id"], "from": None, "to": "pending", "at": report_data["submittedAt"], "actor": report_data.get("reporterID")}
+            await asyncio.to_thread(persist_transition, submitted_event, [])
             self.next_id += 1
             return report_data["id"]
 
     async def get_report_by_id(self, report_id: int):
-        return next((report for report in self.reports if report.get("id") == report_id), None)
+        return self._reports_by_id.get(report_id)
+
+    async def register_message(self, message, report_id: int):
+        await self.messages.register(message.id, report_id, message.channel.id)
+
+    async def delete_report_message(self, message, priority: int = PRIORITY_INTERACTION):
+        """
+        Deletes a report message through the outbound queue and drops it from the registry.
+        A message that is already gone is treated as deleted.
+        """
+        if message is None:
+            return
+        try:
+            await self.bot.outbound.delete(message, priority=priority)
+        except discord.NotFound:
+            pass
+        await self.messages.forget([message.id])
+
+    async def clear_report_messages(self, report_id: int, message=None, priority: int = PRIORITY_INTERACTION):
+        """
+        Deletes every registered channel message of the report, plus `message` if it is an unregistered report message.
+        Buttons can be pressed on an ephemeral /nextbug card, so the message clicked is not always the one to remove.
+        """
+        registered = self.messages.messages_for_report(report_id)
+        if message is not None and message.id not in registered.values() and not message.flags.ephemeral:
+            await self.delete_report_message(message, priority)
+        await self.delete_report_messages([report_id], priority)
+
+    async def resolve_interaction_report(self, interaction: Interaction, fallback_id: int = 0, fallback_data: dict = None):
+        """
+        Works out which report a button press belongs to.
+        Uses the message registry first, then the "Bug Report ID:" footer of older messages, then the view's own data.
+        """
+        if interaction.message:
+            report_id = self.messages.report_for_message(interaction.message.id)
+            if report_id is not None:
+                report_data = await self.get_report_by_id(report_id)
+                if report_data:
+                    return report_id, report_data
+
+            # Messages posted before the registry existed
+            if interaction.message.embeds:
+                footer_text = interaction.message.embeds[0].footer.text
+                if footer_text and "Bug Report ID:" in footer_text:
+                    try:
+                        # Extract ID from footer (e.g., "Bug Report ID: 123")
+                        report_id = int(footer_text.split("Bug Report ID:")[-1].strip())
+                        report_data = await self.get_report_by_id(report_id)
+                        if report_data:
+                            await self.register_message(interaction.message, report_id)
+                            return report_id, report_data
+                    except ValueError:
+                        print(f"Warning: Could not parse report ID from footer: {footer_text}")
+
+        # A fresh interaction on a newly sent message, or an old message with an unknown ID
+        if fallback_data:
+            return fallback_id, fallback_data
+        if fallback_id:
+            return fallback_id, await self.get_report_by_id(fallback_id)
+        return fallback_id, None
 
     async def delete_report(self, report_id: int):
+        deleted_report = self._reports_by_id.get(report_id)
         initial_count = len(self.reports)
         self.reports = [report for report in self.reports if report.get("id") != report_id]
         if len(self.reports) < initial_count:
+            self._reports_by_id.pop(report_id, None)
+            self.search_index.remove(report_id)
+            self.duplicate_index.remove(report_id)
+            self.priority_queue.remove(report_id)
+            self.claims.pop(report_id, None)
+            self._mark_changed()
             await self._save_reports()
+            await asyncio.to_thread(delete_data, "bugsig", {"id": report_id})
+            await asyncio.to_thread(rollups.record_increments, deleted_report.get("reportedAt"), rollups.report_increments(deleted_report, -1))
             return True
         return False
 
-    async def update_report_status(self, report_id: int, new_status: str):
-        report = await self.get_report_by_id(report_id)
-        if report:
+    async def update_report_status(self, report_id: int, new_status: str, actor_id: int = None):
+        return bool(await self.bulk_update_status([report_id], new_status, actor_id))
+
+    async def bulk_update_status(self, report_ids, new_status: str, actor_id: int = None):
+        """
+        Moves every given report to `new_status` with one report save, one rollup write and one event log write.
+        Returns the IDs that were updated; unknown IDs are skipped.
+        """
+        changed_at = datetime.now(timezone.utc)
+        events, projection_updates, day_increments, updated = [], [], {}, []
+        reporter_updates, rescored_reporters = [], set()
+        for report_id in report_ids:
+            report = self._reports_by_id.get(report_id)
+            if not report:
+                continue
+            old_status = report.get("status")
+            # Time spent in the old status feeds the triage latency histograms
+            projection_updates.extend(self.triage.apply(report, old_status, entered_state_at(report), changed_at))
+            events.append({"report_id": report_id, "from": old_status, "to": new_status, "at": changed_at.isoformat(), "actor": str(actor_id) if actor_id else None})
+
             report["status"] = new_status
-            await self._save_reports()
-            return True
-        return False
+            report["statusChangedAt"] = changed_at.isoformat()
+            if new_status.lower() not in OPEN_STATUSES:
+                self.duplicate_index.remove(report_id)
+            if report.get("reportedAt"):
+                day = day_increments.setdefault(report["reportedAt"], {})
+                for path, delta in rollups.status_change_increments(old_status, new_status).items():
+                    day[path] = day.get(path, 0) + delta
+            # An approval or decline changes the reporter's accuracy, which re-scores their other pending reports
+            accuracy_change = outcome_increments(old_status, new_status)
+            if accuracy_change and report.get("reporterID"):
+                reporter_updates.append(self.reporter_stats.apply(report["reporterID"], accuracy_change))
+                rescored_reporters.add(str(report["reporterID"]))
+            self._queue_report(report)
+            self._unsaved_ids.add(report_id)
+            updated.append(report_id)
+
+        if not updated:
+            return []
+        for reporter_id in rescored_reporters:
+            for queued_id in self.priority_queue.in_group(reporter_id):
+                self._queue_report(self._reports_by_id[queued_id])
+        self._mark_changed()
+        await self._save_reports()
+        await asyncio.to_thread(rollups.record_many, day_increments)
+        await asyncio.to_thread(persist_transitions, events, projection_updates)
+        await asyncio.to_thread(persist_reporter_updates, reporter_updates)
+        return updated
+
+    def requeue_pending_reports(self):
+        """Re-scores every pending report, e.g. after the reporter stats were rebuilt."""
+        for report in self.reports:
+            self._queue_report(report)
+        self._mark_changed()
+
+    def claim_next_report(self, admin_id: int):
+        """
+        Returns the highest priority pending report not claimed by another admin, and claims it for `admin_id`.
+        Claims end when the report leaves the pending state or after CLAIM_DURATION.
+        """
+        now = datetime.now(timezone.utc)
+
+        def claimed_by_other(report_id):
+            claim = self.claims.get(report_id)
+            return claim is not None and claim[0] != admin_id and claim[1] > now
+
+        report_id = self.priority_queue.first(skip=claimed_by_other)
+        if report_id is None:
+            return None
+        self.claims[report_id] = (admin_id, now + CLAIM_DURATION)
+        return self._reports_by_id.get(report_id)
+
+    async def delete_channel_messages(self, channel, message_ids, priority: int = PRIORITY_BULK, progress=None):
+        """
+        Deletes registered report messages in one channel and drops them from the registry.
+        Messages younger than 14 days are bulk deleted 100 at a time; older ones have to be deleted one by one.
+        """
+        bulk_cutoff = datetime.now(timezone.utc) - timedelta(days=BULK_DELETE_MAX_AGE_DAYS)
+        message_ids = sorted(message_ids, reverse=True)
+        recent = [discord.Object(id=message_id) for message_id in message_ids if discord.utils.snowflake_time(message_id) > bulk_cutoff]
+        old = [message_id for message_id in message_ids if discord.utils.snowflake_time(message_id) <= bulk_cutoff]
+        deleted_count = 0
+
+        for start in range(0, len(recent), BULK_DELETE_BATCH_SIZE):
+            batch = recent[start:start + BULK_DELETE_BATCH_SIZE]
+            try:
+                await self.bot.outbound.delete_messages(channel, batch, priority=priority)
+            except discord.NotFound:
+                pass # A single already-deleted message; bulk deletes ignore missing ones
+            await self.messages.forget([message.id for message in batch])
+            deleted_count += len(batch)
+            if progress:
+                await progress(deleted_count, len(message_ids))
+
+        for message_id in old:
+            await self.delete_report_message(channel.get_partial_message(message_id), priority=priority)
+            deleted_count += 1
+            if progress:
+                await progress(deleted_count, len(message_ids))
+
+        return deleted_count
+
+    async def delete_report_messages(self, report_ids, priority: int = PRIORITY_BULK):
+        """
+        Deletes every registered message of the given reports, batched per channel.
+        """
+        by_channel = defaultdict(list)
+        for report_id in report_ids:
+            for channel_id, message_id in self.messages.messages_for_report(report_id).items():
+                by_channel[channel_id].append(message_id)
+        for channel_id, message_ids in by_channel.items():
+            channel = self.bot.get_channel(channel_id)
+            if channel:
+                await self.delete_channel_messages(channel, message_ids, priority=priority)
+
+    async def archive_closed_reports(self):
+        """
+        Moves fixed and declined reports older than BUG_ARCHIVE_AFTER_DAYS to the archive collection.
+        The archive is written first, so an interruption leaves a report in both places rather than in neither.
+        Returns the number of reports moved.
+        """
+        due = archive.due_for_archive(self.reports)
+        if not due:
+            return 0
+        await asyncio.to_thread(archive.archive_reports, due)
+
+        archived_ids = {report.get("id", 0) for report in due}
+        self.reports = [report for report in self.reports if report.get("id", 0) not in archived_ids]
+        for report_id in archived_ids:
+            self._reports_by_id.pop(report_id, None)
+            self.search_index.remove(report_id)
+            self.duplicate_index.remove(report_id)
+        self._mark_changed()
+        await self._save_reports()
+        await asyncio.to_thread(delete_data, "bugsig", {"id": {"$in": list(archived_ids)}})
+        return len(due)
 
     async def get_filtered_and_sorted_reports(self, category_filter: str = "all", status_filter: str = "all", sort_by: str = "id_ascending"):
+        """
+        Returns the filtered and sorted reports for the given combination.
+        The result is cached until the manager version changes, so callers must treat it as read-only.
+        """
+        cache_key = (category_filter.lower(), status_filter.lower(), sort_by)
+        cached = self._sorted_cache.get(cache_key)
+        if cached and cached[0] == self.version:
+            return cached[1]
+
         filtered_reports = self.reports
 
         if category_filter != "all":
-            filtered_reports = [r for r in filtered_reports if r.get('category') and r['category'].lower() == category_filter.lower()]
+            filtered_reports = [r for r in filtered_reports if r.get('category') and r['category'].lower() == cache_key[0]]
         
         if status_filter != "all":
-            filtered_reports = [r for r in filtered_reports if r.get('status') and r['status'].lower() == status_filter.lower()]
-
+            filtered_reports = [r for r in filtered_reports if r.get('status') and r['status'].lower() == cache_key[1]]
 
         if sort_by == "id_ascending":
-            filtered_reports.sort(key=lambda x: x.get('id', 0))
+            filtered_reports = sorted(filtered_reports, key=lambda x: x.id)
         elif sort_by == "date_ascending":
-            filtered_reports.sort(key=lambda x: datetime.strptime(x.get('reportedAt', '1970-01-01'), "%Y-%m-%d"))
+            filtered_reports = sorted(filtered_reports, key=lambda x: x.sort_date)
         elif sort_by == "date_descending":
-            filtered_reports.sort(key=lambda x: datetime.strptime(x.get('reportedAt', '1970-01-01'), "%Y-%m-%d"), reverse=True)
+            filtered_reports = sorted(filtered_reports, key=lambda x: x.sort_date, reverse=True)
         elif sort_by == "severity_high":
-            severity_order = {"very high": 0, "high": 1, "medium": 2, "low": 3, "n/a": 4}
-            filtered_reports.sort(key=lambda x: severity_order.get(x.get('severity', 'n/a').lower(), 99))
+            filtered_reports = sorted(filtered_reports, key=lambda x: x.severity_rank)
         elif sort_by == "severity_low":
-            severity_order = {"very high": 0, "high": 1, "medium": 2, "low": 3, "n/a": 4}
-            filtered_reports.sort(key=lambda x: severity_order.get(x.get('severity', 'n/a').lower(), 99), reverse=True)
+            filtered_reports = sorted(filtered_reports, key=lambda x: x.severity_rank, reverse=True)
+        elif sort_by == "priority":
+            # Queue order for pending reports; reports that are not queued follow in ID order
+            ranks = {report_id: rank for rank, report_id in enumerate(self.priority_queue.ordered())}
+            filtered_reports = sorted(filtered_reports, key=lambda x: (ranks.get(x.id, len(ranks)), x.id))
+        else:
+            filtered_reports = list(filtered_reports)
 
+        self._sorted_cache[cache_key] = (self.version, filtered_reports)
         return filtered_reports
 
+    def find_duplicates(self, signature, threshold: float = 0.4, limit: int = 5):
+        """
+        Looks up open reports whose text is likely a near-duplicate of the given MinHash signature.
+        Returns a list of (report, estimated similarity) pairs, most similar first.
+        """
+        return [
+            (self._reports_by_id[report_id], similarity)
+            for report_id, similarity in self.duplicate_index.find_similar(signature, threshold=threshold, limit=limit)
+            if report_id in self._reports_by_id
+        ]
+
+    async def search_reports(self, query: str, status_filter: str = "all", category_filter: str = "all", date_from: str = None, date_to: str = None, limit: int = 10):
+        """
+        Full-text search over title, description and reproduce steps.
+        Returns a list of (report, score) pairs, best match first. Dates are inclusive YYYY-MM-DD strings.
+        The in-memory index covers the hot set; when it has fewer than `limit` hits, archived reports found
+        through the archive's text index fill the rest (after the hot ones, as the two scores do not compare).
+        """
+        from_key = datetime.strptime(date_from, "%Y-%m-%d").toordinal() if date_from else None
+        to_key = datetime.strptime(date_to, "%Y-%m-%d").toordinal() if date_to else None
+        status_filter = status_filter.lower()
+        category_filter = category_filter.lower()
+
+        def matches(report_id):
+            report = self._reports_by_id.get(report_id)
+            if not report:
+                return False
+            if status_filter != "all" and (report.get('status') or '').lower() != status_filter:
+                return False
+            if category_filter != "all" and (report.get('category') or '').lower() != category_filter:
+                return False
+            date_key = report.sort_date
+            if from_key is not None and date_key < from_key:
+                return False
+            if to_key is not None and date_key > to_key:
+                return False
+            return True
+
+        hits = self.search_index.search(query, limit=limit, doc_filter=matches)
+        results = [(self._reports_by_id[report_id], score) for report_id, score in hits]
+        if len(results) < limit and status_filter in ("all",) + archive.CLOSED_STATUSES:
+            archive_filter = archive.archive_query(
+                status=None if status_filter == "all" else status_filter,
+                category=None if category_filter == "all" else category_filter,
+            )
+            archived = await asyncio.to_thread(archive.search_archived, query, archive_filter, from_key, to_key, limit)
+            for document in archived:
+                if len(results) >= limit:
+                    break
+                if document.get("id") not in self._reports_by_id:
+                    results.append((document, document.pop("score", 0.0)))
+        return results
+
     
 
 # --- Modal for Bug Report Submission ---
@@ -159,7 +649,13 @@ class BugReportModal(ui.Modal, title='🐞 Bug Report'):
             if self.original_reporter_id: # Add original_reporter if provided 
                 report_data["original_reporter"] = self.original_reporter_id
 
-            report_id = await self.manager.add_report(report_data)
+            # The channel post waits its turn in the outbound queue, so acknowledge the modal first
+            await interaction.response.defer(ephemeral=True, thinking=True)
+
+            # Look up near-duplicates before adding so the new report does not match itself
+            signature = minhash_signature(report_data)
+            possible_duplicates = self.manager.find_duplicates(signature)
+            report_id = await self.manager.add_report(report_data, signature)
 
             # Create an embed to send to the Discord channel for administrators
             embed = discord.Embed(
@@ -179,231 +675,338 @@ class BugReportModal(ui.Modal, title='🐞 Bug Report'):
             embed.add_field(name="Status", value="`PENDING`", inline=True) # Display pending status 
             embed.add_field(name="Description", value=self.bug_description.value, inline=False)
             embed.add_field(name="Steps to Reproduce", value=self.steps_to_reproduce.value, inline=False)
+            if possible_duplicates:
+                embed.add_field(
+                    name="⚠️ Possible Duplicates",
+                    value="\n".join(f"#{report['id']} - {report['title'][:80]} ({round(similarity * 100)}% similar, `{report.get('status', 'pending').upper()}`)" for report, similarity in possible_duplicates),
+                    inline=False
+                )
             embed.set_footer(text=f"Bug Report ID: {report_id}", icon_url=self.bot.user.avatar.url if self.bot.user.avatar else None)
             
-            # Send with approval view 
-            view = BugReportApprovalView(self.bot, self.manager, report_id, report_data)
-            message = await report_channel.send(embed=embed, view=view)
-            view.message = message
-            self.bot.add_view(view)
+            # Send with approve / decline buttons 
+            message = await self.bot.outbound.send(report_channel, embed=embed, view=report_buttons_view("pending", report_id), priority=PRIORITY_INTERACTION)
+            await self.manager.register_message(message, report_id)
 
 
             # Confirm submission to the user
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"✅ Your bug report (ID: `{report_id}`) has been submitted! Thank you for helping us improve.",
                 ephemeral=True
             )
 
         except ValueError:
-            await interaction.response.send_message(
-                "🐛 An error occurred: Invalid BUG_REPORT_CHANNEL_ID. Please contact an administrator.",
-                ephemeral=True
+            await self._send_error(
+                interaction,
+                "🐛 An error occurred: Invalid BUG_REPORT_CHANNEL_ID. Please contact an administrator."
             )
             print("Error: BUG_REPORT_CHANNEL_ID is not a valid integer.")
         except Exception as e:
-            await interaction.response.send_message(
-                "🐛 An unexpected error occurred while submitting your bug report. Please try again later.",
-                ephemeral=True
+            await self._send_error(
+                interaction,
+                "🐛 An unexpected error occurred while submitting your bug report. Please try again later."
             )
             print(f"An unexpected error occurred in BugReportModal on_submit: {e}")
 
-class BugReportApprovalView(ui.View):
-    def __init__(self, bot: commands.Bot, manager: BugReportManager, report_id: int = 0, report_data: dict = None):
-        super().__init__(timeout=None)  # No timeout for persistence
-        self.message = None
-        self.bot = bot
-        self.manager = manager
+    @staticmethod
+    async def _send_error(interaction: Interaction, content: str):
+        # The response may already have been deferred by the time something fails
+        if interaction.response.is_done():
+            await interaction.followup.send(content, ephemeral=True)
+        else:
+            await interaction.response.send_message(content, ephemeral=True)
+
+# --- Report buttons ---
+# Every report button carries its action and report ID in its custom_id ("bugreport:<action>:<id>"),
+# so one BugReportButton class registered with the bot handles the buttons on every report message.
+REPORT_BUTTONS = {
+    "approve": ("Approve", discord.ButtonStyle.green),
+    "decline": ("Decline", discord.ButtonStyle.red),
+    "fixed": ("Fixed", discord.ButtonStyle.green),
+    "declined": ("Declined", discord.ButtonStyle.red),
+}
+BUTTONS_BY_STATUS = {
+    "pending": ("approve", "decline"),
+    "approved": ("fixed", "declined"),
+}
+# Discord's limits for the embeds on one message
+EMBEDS_PER_MESSAGE = 10
+EMBED_CHARACTERS_PER_MESSAGE = 6000
+# Archive embed title, colour and footer verb for the actions that close a report
+ARCHIVE_STYLES = {
+    "fixed": ("✅ FIXED", discord.Color.green(), "Fixed by"),
+    "declined": ("❌ DECLINED", discord.Color.red(), "Declined by"),
+}
+
+
+class BugReportButton(ui.DynamicItem[ui.Button], template=r"bugreport:(?P<action>approve|decline|fixed|declined):(?P<id>[0-9]+)"):
+    def __init__(self, action: str, report_id: int):
+        label, style = REPORT_BUTTONS[action]
+        super().__init__(ui.Button(label=label, style=style, custom_id=f"bugreport:{action}:{report_id}"))
+        self.action = action
         self.report_id = report_id
-        self._initial_report_id = report_id  # Store initial for first send
-        self._initial_report_data = report_data  # Store initial for first send
-        self.report_data = report_data 
-
-    # Helper method to dynamically get report_id and report_data
-    async def _get_current_report_info(self, interaction: Interaction):
-        report_id = self._initial_report_id
-        report_data = self._initial_report_data
-
-        if interaction.message and interaction.message.embeds:
-            footer_text = interaction.message.embeds[0].footer.text
-            if footer_text and "Bug Report ID:" in footer_text:
-                try:
-                    # Extract ID from footer (e.g., "Bug Report ID: 123")
-                    extracted_id_str = footer_text.split("Bug Report ID:")[-1].strip()
-                    report_id = int(extracted_id_str)
-                    # Now fetch the full report data from the manager
-                    report_data = await self.manager.get_report_by_id(report_id)
-                except ValueError:
-                    print(f"Warning: Could not parse report ID from footer: {footer_text}")
-                except Exception as e:
-                    print(f"Error fetching report data in BugReportApprovalView: {e}")
-        
-        # If no report_data found from embed, and initial data was set, use it.
-        # This covers cases where it's a fresh interaction on a newly sent message.
-        if not report_data and self._initial_report_data:
-            report_data = self._initial_report_data
-            report_id = self._initial_report_id
-
-        # If still no report_data (e.g., after bot restart and message is old), try to fetch using initial ID
-        if not report_data and report_id != 0:
-            report_data = await self.manager.get_report_by_id(report_id)
-
-        return report_id, report_data
 
-    @ui.button(label="Approve", style=discord.ButtonStyle.green, custom_id="bug_approve")
-    async def approve_button(self, interaction, button):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this button.", ephemeral=True)
-            return
-        await interaction.response.defer(ephemeral=True)
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: ui.Button, match):
+        return cls(match["action"], int(match["id"]))
 
-        report_id, report_data = await self._get_current_report_info(interaction)
-        self.report_id = report_id
-        self.report_data = report_data
-        if not report_data:
-            await interaction.followup.send("❌ Error: Could not retrieve report data.", ephemeral=True)
+    async def callback(self, interaction: Interaction):
+        cog = interaction.client.get_cog("bugreports")
+        if cog is None:
+            await interaction.response.send_message("❌ Bug reports are unavailable right now. Please try again later.", ephemeral=True)
             return
+        await handle_report_action(interaction.client, cog.bug_report_manager, interaction, self.action, self.report_id)
+
+
+def report_buttons_view(status: str, report_id: int) -> ui.View:
+    """
+    Builds the buttons for a pending or approved report message.
+    """
+    view = ui.View(timeout=None)
+    for action in BUTTONS_BY_STATUS[status]:
+        view.add_item(BugReportButton(action, report_id))
+    # Clicks are routed by custom_id to BugReportButton, so the view itself does not need to be
+    # kept in the view store once it has been sent
+    view.stop()
+    return view
+
+
+def build_approved_embed(bot, interaction: Interaction, report_id: int, report_data: dict, status: str):
+    embed = discord.Embed(
+        title=f"✅ Approved Bug Report: {report_data['title']}",
+        color=discord.Color.green(),
+        timestamp=interaction.created_at
+    )
+    embed.set_author(
+        name=f"Reported by {report_data['reporterID']}",
+        icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+    )
+    embed.add_field(name="Reporter", value=f"<@{report_data['reporterID']}> ({report_data['reporterID']})", inline=False)
+    if report_data.get("original_reporter"):
+        embed.add_field(name="Original Reporter", value=f"{report_data['original_reporter']}", inline=False)
+    embed.add_field(name="Category", value=report_data['category'].capitalize(), inline=True)
+    embed.add_field(name="Severity", value=report_data['severity'].capitalize(), inline=True)
+    embed.add_field(name="Status", value=f"`{status.upper()}`", inline=True)
+    embed.add_field(name="Description", value=report_data['description'], inline=False)
+    embed.add_field(name="Steps to Reproduce", value=report_data['reproducesteps'].replace('\\n', '\n'), inline=False)
+    embed.set_footer(text=f"Bug Report ID: {report_id}", icon_url=bot.user.avatar.url if bot.user.avatar else None)
+    return embed
+
+
+def build_reward_embed(report_id: int, report_data: dict, points: int, reporter_user, approver):
+    """
+    `reporter_user` may be None when the reporter is not cached; the embed then only mentions them.
+    """
+    reporter_mention = reporter_user.mention if reporter_user else f"<@{report_data.get('reporterID')}>"
+    reward_embed = discord.Embed(
+        title="🏆 Reward!",
+        description=f"Gave **{points}** {'point' if points == 1 else 'points'} to {reporter_mention} for reporting a bug.",
+        color=discord.Color.gold(),
+        timestamp=datetime.now(timezone.utc)
+    )
+    reward_embed.add_field(name="Bug Title", value=report_data.get("title", "N/A"), inline=False)
+    reward_embed.add_field(name="Bug ID", value=str(report_id), inline=True)
+    if reporter_user:
+        reward_embed.set_thumbnail(url=reporter_user.avatar.url if reporter_user.avatar else None)
+    reward_embed.set_footer(
+        text=f"Approved by {approver.display_name}",
+        icon_url=approver.avatar.url if approver.avatar else None
+    )
+    return reward_embed
 
-        eco = self.bot.get_cog("Economy")
-        points_recipient_id = int(report_data.get("reporterID"))
-
-        if report_data.get("original_reporter"):
-            if eco:
-                await eco._add_points_to_data(points_recipient_id, 1)
-                reporter_user = await self.bot.fetch_user(points_recipient_id)
-                reward_channel_id = os.getenv("BUG_POINT_REWARD_CHANNEL_ID")
-                if reward_channel_id:
-                    reward_channel = self.bot.get_channel(int(reward_channel_id))
-                    if reward_channel:
-                        reward_embed = discord.Embed(
-                            title="🏆 Reward!",
-                            description=f"Gave **1** point to {reporter_user.mention} for reporting a bug.",
-                            color=discord.Color.gold(),
-                            timestamp=datetime.now(timezone.utc)
-                        )
-                        reward_embed.add_field(name="Bug Title", value=report_data.get("title", "N/A"), inline=False)
-                        reward_embed.add_field(name="Bug ID", value=str(self.report_id), inline=True)
-                        reward_embed.set_thumbnail(url=reporter_user.avatar.url if reporter_user.avatar else None)
-                        reward_embed.set_footer(
-                            text=f"Approved by {interaction.user.display_name}",
-                            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
-                        )               
-                        await reward_channel.send(embed=reward_embed)
-            else:
-                await interaction.followup.send("⚠️ Points system unavailable.", ephemeral=True)
-                await self.manager.update_report_status(self.report_id, "approved")
-
-            approved_channel = self.bot.get_channel(int(os.getenv("BUG_APPROVED_CHANNEL_ID")))
-            if approved_channel:
-                approved_embed = self._create_approved_embed(interaction, "approved")
-                view = BugReportActionsView(self.bot, self.manager, self.report_id, self.report_data)
-                approved_message = await approved_channel.send(embed=approved_embed, view=view)
-                view.message = approved_message
-
-            if self.message:
-                try:
-                    await self.message.delete()
-                except discord.HTTPException:
-                    pass
 
-            await interaction.followup.send(f"✅ Bug report `{self.report_id}` approved.", ephemeral=True)
-            self.stop()
+def build_archive_embed(report_id: int, report_data: dict, status: str, actor, timestamp):
+    title, color, footer_verb = ARCHIVE_STYLES[status]
+    archive_embed = discord.Embed(
+        title=title,
+        color=color,
+        timestamp=timestamp
+    )
+    if status == "declined":
+        archive_embed.description = f"Bug Report #{report_id} has been declined by {actor.display_name}."
+    archive_embed.add_field(name="Title", value=report_data.get('title', 'N/A'), inline=False)
+    archive_embed.add_field(name="Status", value=status.upper(), inline=False)
+    archive_embed.add_field(name="Category", value=report_data.get('category', 'N/A').capitalize(), inline=True)
+    archive_embed.add_field(name="Severity", value=report_data.get('severity', 'N/A').capitalize(), inline=True)
+    archive_embed.add_field(name="Reporter", value=f"<@{report_data.get('reporterID', 'N/A')}>", inline=True)
+    if report_data.get("original_reporter"):
+        archive_embed.add_field(name="Original Reporter", value=f"{report_data.get('original_reporter')}", inline=True)
+    archive_embed.add_field(name="Reported At", value=report_data.get('reportedAt', 'N/A'), inline=True)
+    archive_embed.add_field(name="Description", value=report_data.get('description', 'N/A'), inline=False)
+    reproduce_steps_display = report_data.get('reproducesteps', 'N/A').replace('\\n', '\n')
+    archive_embed.add_field(name="Steps to Reproduce", value=reproduce_steps_display, inline=False)
+    archive_embed.set_footer(
+        text=f"{footer_verb}: {actor.display_name} - Bug Report ID: {report_id}",
+        icon_url=actor.avatar.url if actor.avatar else None
+    )
+    return archive_embed
+
+
+def batch_embeds(embeds: list) -> list:
+    """
+    Groups embeds into messages of at most 10, keeping each message under Discord's 6000 character total.
+    """
+    batches, current, current_size = [], [], 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (len(current) == EMBEDS_PER_MESSAGE or current_size + size > EMBED_CHARACTERS_PER_MESSAGE):
+            batches.append(current)
+            current, current_size = [], 0
+        current.append(embed)
+        current_size += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def send_approved_report(bot, manager: BugReportManager, interaction: Interaction, report_id: int, report_data: dict):
+    bug_approved_channel_id = os.getenv("BUG_APPROVED_CHANNEL_ID")
+    if not bug_approved_channel_id:
+        print("Error: BUG_APPROVED_CHANNEL_ID not set in environment variables.")
+        return
+    approved_channel = bot.get_channel(int(bug_approved_channel_id))
+    if approved_channel:
+        approved_embed = build_approved_embed(bot, interaction, report_id, report_data, "approved")
+        approved_message = await bot.outbound.send(approved_channel, embed=approved_embed, view=report_buttons_view("approved", report_id), priority=PRIORITY_INTERACTION)
+        await manager.register_message(approved_message, report_id)
+
+
+async def handle_report_action(bot, manager: BugReportManager, interaction: Interaction, action: str, report_id: int = 0):
+    """
+    Runs a report button press: approve, decline (pending reports) or fixed, declined (approved reports).
+    """
+    if not await permissions.check_admin(interaction, "❌ You don't have permission to use this button."):
+        return
+    await interaction.response.defer(ephemeral=True)
+    if not await bot.warmup.wait("bugreports"):
+        await interaction.followup.send("⏳ Bug reports are still loading. Please try again in a moment.", ephemeral=True)
+        return
+
+    if report_id:
+        # Templated buttons carry the report ID, so there is nothing to work out from the message
+        report_data = await manager.get_report_by_id(report_id)
+    else:
+        report_id, report_data = await manager.resolve_interaction_report(interaction)
+    if not report_data:
+        await interaction.followup.send("❌ Error: Could not retrieve report data for this interaction. The report might have been deleted or corrupted.", ephemeral=True)
+        return
+    blocked = report_action_blocked(manager, report_id, report_data, action)
+    if blocked:
+        await interaction.followup.send(blocked, ephemeral=True)
+        return
+
+    manager.actions_in_flight.add(report_id)
+    try:
+        if action == "approve":
+            await _approve_report(bot, manager, interaction, report_id, report_data)
         else:
-            point_selection_view = PointSelectionView(self.bot, self.manager, self.report_id, self.report_data, self.message, interaction.user.id)
-            points_msg = await interaction.followup.send(
-                embed=discord.Embed(title="🎁 Reward Points", description="Please select points.", color=discord.Color.blue()),
-                view=point_selection_view,
-                ephemeral=True
-            )
-            point_selection_view.original_message = points_msg
-
+            await _archive_report(bot, manager, interaction, report_id, report_data, "fixed" if action == "fixed" else "declined")
+    finally:
+        manager.actions_in_flight.discard(report_id)
+
+
+def report_action_blocked(manager: BugReportManager, report_id: int, report_data, action: str):
+    """
+    Why a button action cannot run on the report right now, or None. Templated buttons on old messages and
+    /nextbug cards stay clickable after a report was handled, so its current status is checked here.
+    """
+    status = (report_data.get("status") or "pending").lower()
+    if status != BULK_TRIAGE_ACTIONS[action][0]:
+        return f"⚠️ Bug report `{report_id}` is already {status}."
+    if report_id in manager.actions_in_flight:
+        return f"⚠️ Bug report `{report_id}` is already being handled."
+    return None
+
+
+async def _approve_report(bot, manager: BugReportManager, interaction: Interaction, report_id: int, report_data: dict):
+    if not report_data.get("original_reporter"):
+        point_selection_view = PointSelectionView(bot, manager, report_id, report_data, interaction.message, interaction.user.id)
+        points_msg = await interaction.followup.send(
+            embed=discord.Embed(title="🎁 Reward Points", description="Please select points.", color=discord.Color.blue()),
+            view=point_selection_view,
+            ephemeral=True
+        )
+        point_selection_view.original_message = points_msg
+        return
+
+    eco = bot.get_cog("Economy")
+    points_recipient_id = int(report_data.get("reporterID"))
+    if eco:
+        await eco._add_points_to_data(points_recipient_id, 1)
+        reporter_user = await bot.fetch_user(points_recipient_id)
+        reward_channel_id = os.getenv("BUG_POINT_REWARD_CHANNEL_ID")
+        if reward_channel_id:
+            reward_channel = bot.get_channel(int(reward_channel_id))
+            if reward_channel:
+                reward_embed = build_reward_embed(report_id, report_data, 1, reporter_user, interaction.user)
+                await bot.outbound.send(reward_channel, embed=reward_embed, priority=PRIORITY_INTERACTION)
+    else:
+        await interaction.followup.send("⚠️ Points system unavailable.", ephemeral=True)
+    await manager.update_report_status(report_id, "approved", interaction.user.id)
+
+    # Clear the pending message before the approved one is registered, so only the old one goes
+    try:
+        await manager.clear_report_messages(report_id, interaction.message)
+    except discord.HTTPException:
+        pass
+
+    await send_approved_report(bot, manager, interaction, report_id, report_data)
+
+    await interaction.followup.send(f"✅ Bug report `{report_id}` approved.", ephemeral=True)
+
+
+async def _archive_report(bot, manager: BugReportManager, interaction: Interaction, report_id: int, report_data: dict, status: str):
+    """
+    Posts the report to the archive channel as fixed or declined, updates its status and removes its message.
+    """
+    archive_channel_id = os.getenv("BUG_ARCHIVE_CHANNEL_ID")
+    if not archive_channel_id:
+        await interaction.followup.send(
+            "❌ Error: Bug archive channel not configured. Cannot archive.",
+            ephemeral=True
+        )
+        print("Error: BUG_ARCHIVE_CHANNEL_ID not set in environment variables.")
+        return
 
-    @ui.button(label="Decline", style=discord.ButtonStyle.red, custom_id="bug_decline")
-    async def decline_button(self, interaction: Interaction, button: ui.Button):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this button.", ephemeral=True)
-            return
-        await interaction.response.defer(ephemeral=True)
-        report_id, report_data = await self._get_current_report_info(interaction)
-        if not report_data:
-            await interaction.followup.send("❌ Error: Could not retrieve report data for this interaction. The report might have been deleted or corrupted.", ephemeral=True)
-            return
-        archive_channel_id = os.getenv("BUG_ARCHIVE_CHANNEL_ID")
-        if not archive_channel_id:
+    try:
+        archive_channel = bot.get_channel(int(archive_channel_id))
+        if not archive_channel:
             await interaction.followup.send(
-                "❌ Error: Bug archive channel not configured. Cannot archive.",
+                "❌ Error: Could not find the configured bug archive channel. Cannot archive.",
                 ephemeral=True
             )
-            print("Error: BUG_ARCHIVE_CHANNEL_ID not set in environment variables.")
+            print(f"Error: Could not find archive channel with ID {archive_channel_id}")
             return
 
-        try:
-            archive_channel = self.bot.get_channel(int(archive_channel_id))
-            if not archive_channel:
-                await interaction.followup.send(
-                    "❌ Error: Could not find the configured bug archive channel. Cannot archive.",
-                    ephemeral=True
-                )
-                print(f"Error: Could not find archive channel with ID {archive_channel_id}")
-                return
-            
-            archive_embed = discord.Embed(
-                title=f"❌ DECLINED",
-                description=f"Bug Report #{report_id} has been declined by {interaction.user.display_name}.",
-                color=discord.Color.red(),
-                timestamp=interaction.created_at
-            )
-            archive_embed.add_field(name="Title", value=self.report_data.get('title', 'N/A'), inline=False)
-            archive_embed.add_field(name="Status", value="DECLINED", inline=False)
-            archive_embed.add_field(name="Category", value=self.report_data.get('category', 'N/A').capitalize(), inline=True)
-            archive_embed.add_field(name="Severity", value=self.report_data.get('severity', 'N/A').capitalize(), inline=True)
-            archive_embed.add_field(name="Reporter", value=f"<@{self.report_data.get('reporterID', 'N/A')}>", inline=True)
-            if self.report_data.get("original_reporter"):
-                archive_embed.add_field(name="Original Reporter", value=f"{self.report_data.get('original_reporter')}", inline=True)
-            archive_embed.add_field(name="Reported At", value=self.report_data.get('reportedAt', 'N/A'), inline=True)
-            archive_embed.add_field(name="Description", value=self.report_data.get('description', 'N/A'), inline=False)
-            reproduce_steps_display = self.report_data.get('reproducesteps', 'N/A').replace('\\n', '\n')
-            archive_embed.add_field(name="Steps to Reproduce", value=reproduce_steps_display, inline=False)
-            archive_embed.set_footer(
-                text=f"Declined by: {interaction.user.display_name} - Bug Report ID: {self.report_id}",
-                icon_url=interaction.user.avatar.url if interaction.user.avatar else None
-            )
-            await archive_channel.send(embed=archive_embed)
-            
-            # Delete the report from the database and original message 
-            await self.manager.update_report_status(self.report_id, "declined")
-        
-            if self.message:
-                await self.message.delete()
+        archive_embed = build_archive_embed(report_id, report_data, status, interaction.user, interaction.created_at)
+        await bot.outbound.send(archive_channel, embed=archive_embed, priority=PRIORITY_INTERACTION)
 
-            await interaction.followup.send(f"❌ Bug report `{self.report_id}` marked as declined and archived.", ephemeral=True)
-            self.stop() # Stop the view
-        except Exception as e:
-            await interaction.followup.send(f"❌ An error occurred while marking report as declined: {e}", ephemeral=True)
+        await manager.update_report_status(report_id, status, interaction.user.id)
 
-    def _create_approved_embed(self, interaction: Interaction, status: str):
-        embed = discord.Embed(
-            title=f"✅ Approved Bug Report: {self.report_data['title']}",
-            color=discord.Color.green(),
-            timestamp=interaction.created_at
-        )
-        embed.set_author(
-            name=f"Reported by {self.report_data['reporterID']}",
-            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
-        )
-        embed.add_field(name="Reporter", value=f"<@{self.report_data['reporterID']}> ({self.report_data['reporterID']})", inline=False)
-        if self.report_data.get("original_reporter"):
-            embed.add_field(name="Original Reporter", value=f"{self.report_data['original_reporter']}", inline=False)
-        embed.add_field(name="Category", value=self.report_data['category'].capitalize(), inline=True)
-        embed.add_field(name="Severity", value=self.report_data['severity'].capitalize(), inline=True)
-        embed.add_field(name="Status", value=f"`{status.upper()}`", inline=True)
-        embed.add_field(name="Description", value=self.report_data['description'], inline=False)
-        embed.add_field(name="Steps to Reproduce", value=self.report_data['reproducesteps'].replace('\\n', '\n'), inline=False)
-        embed.set_footer(text=f"Bug Report ID: {self.report_id}", icon_url=self.bot.user.avatar.url if self.bot.user.avatar else None)
-        return embed
+        # Delete the report message from the pending or approved channel
+        await manager.clear_report_messages(report_id, interaction.message)
+
+        emoji = "✅" if status == "fixed" else "❌"
+        await interaction.followup.send(f"{emoji} Bug report `{report_id}` marked as {status} and archived.", ephemeral=True)
+    except Exception as e:
+        await interaction.followup.send(f"❌ An error occurred while marking report as {status}: {e}", ephemeral=True)
+
+
+# --- Legacy views ---
+# Messages sent before the templated buttons use the fixed custom_ids below. One instance of each view is
+# registered at startup and works out the report from the message itself.
+class BugReportApprovalView(ui.View):
+    def __init__(self, bot: commands.Bot, manager: BugReportManager):
+        super().__init__(timeout=None)  # No timeout for persistence
+        self.bot = bot
+        self.manager = manager
+
+    @ui.button(label="Approve", style=discord.ButtonStyle.green, custom_id="bug_approve")
+    async def approve_button(self, interaction: Interaction, button: ui.Button):
+        await handle_report_action(self.bot, self.manager, interaction, "approve")
+
+    @ui.button(label="Decline", style=discord.ButtonStyle.red, custom_id="bug_decline")
+    async def decline_button(self, interaction: Interaction, button: ui.Button):
+        await handle_report_action(self.bot, self.manager, interaction, "decline")
 
 # --- View for Point Selection (for unassigned original_reporter) ---
 class PointSelectionView(ui.View):
@@ -414,6 +1017,7 @@ class PointSelectionView(ui.View):
         self.report_id = report_id
         self.report_data = report_data
         self.original_message = original_message
+        self.report_message = original_message  # original_message is later replaced by the ephemeral points prompt
         self.approver_id = approver_id  # Store approver ID for checks
 
         for i in range(1, 6):
@@ -436,7 +1040,20 @@ class PointSelectionView(ui.View):
 
     async def _give_points_and_finalize(self, interaction: Interaction, points: int):
         await interaction.response.defer(ephemeral=True)
+        # The report may have been approved or declined elsewhere while this prompt was open
+        report = await self.manager.get_report_by_id(self.report_id)
+        blocked = report_action_blocked(self.manager, self.report_id, report, "approve") if report else f"❌ Bug report `{self.report_id}` no longer exists."
+        if blocked:
+            await interaction.followup.send(blocked, ephemeral=True)
+            self.stop()
+            return
+        self.manager.actions_in_flight.add(self.report_id)
+        try:
+            await self._finalize_approval(interaction, points)
+        finally:
+            self.manager.actions_in_flight.discard(self.report_id)
 
+    async def _finalize_approval(self, interaction: Interaction, points: int):
         reporter_id = int(self.report_data["reporterID"])
         eco = self.bot.get_cog("Economy")
         if eco:
@@ -448,206 +1065,44 @@ class PointSelectionView(ui.View):
                 try:
                     reward_channel = self.bot.get_channel(int(reward_channel_id))
                     if reward_channel:
-                        reward_embed = discord.Embed(
-                            title="🏆 Reward!",
-                            description=f"Gave **{points}** points to {reporter_user.mention} for reporting a bug.",
-                            color=discord.Color.gold(),
-                            timestamp=datetime.now(timezone.utc)
-                        )
-                        reward_embed.add_field(name="Bug Title", value=self.report_data.get("title", "N/A"), inline=False)
-                        reward_embed.add_field(name="Bug ID", value=str(self.report_id), inline=True)
-                        reward_embed.set_thumbnail(url=reporter_user.avatar.url if reporter_user.avatar else None)
-                        reward_embed.set_footer(
-                            text=f"Approved by {interaction.user.display_name}",
-                            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
-                        )
-                        await reward_channel.send(embed=reward_embed)
+                        reward_embed = build_reward_embed(self.report_id, self.report_data, points, reporter_user, interaction.user)
+                        await self.bot.outbound.send(reward_channel, embed=reward_embed, priority=PRIORITY_INTERACTION)
                 except Exception as e:
                     print(f"Error sending reward embed: {e}")
         else:
             print("Warning: Economy cog not found. Cannot add points.")
 
-        await self.manager.update_report_status(self.report_id, "approved")
-        
+        await self.manager.update_report_status(self.report_id, "approved", interaction.user.id)
+
+        # Delete original message from BUG_REPORT_CHANNEL_ID
+        await self.manager.clear_report_messages(self.report_id, self.report_message)
+
         # Send to approved channel
-        bug_approved_channel_id = os.getenv("BUG_APPROVED_CHANNEL_ID")
-        if bug_approved_channel_id:
-            approved_channel = self.bot.get_channel(int(bug_approved_channel_id))
-            if approved_channel:
-                approved_embed = self._create_approved_embed(interaction, "approved")
-                view = BugReportActionsView(self.bot, self.manager, self.report_id, self.report_data)
-                approved_message = await approved_channel.send(embed=approved_embed, view=view)
-                view.message = approved_message
-
-        if self.original_message: # Delete original message from BUG_REPORT_CHANNEL_ID
-            await self.original_message.delete()
+        await send_approved_report(self.bot, self.manager, interaction, self.report_id, self.report_data)
+
+        if self.original_message and self.original_message is not self.report_message:
+            try:
+                await self.original_message.delete()
+            except discord.HTTPException:
+                pass
         
         await interaction.followup.send(f"✅ Bug report `{self.report_id}` approved and {points} points given to reporter.", ephemeral=True)
         self.stop() # Stop this view after action
 
-    def _create_approved_embed(self, interaction: Interaction, status: str):
-        embed = discord.Embed(
-            title=f"✅ Approved Bug Report: {self.report_data['title']}",
-            color=discord.Color.green(),
-            timestamp=interaction.created_at
-        )
-        embed.set_author(
-            name=f"Reported by {self.report_data['reporterID']}",
-            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
-        )
-        embed.add_field(name="Reporter", value=f"<@{self.report_data['reporterID']}> ({self.report_data['reporterID']})", inline=False)
-        if self.report_data.get("original_reporter"):
-            embed.add_field(name="Original Reporter", value=f"{self.report_data['original_reporter']}", inline=False)
-        embed.add_field(name="Category", value=self.report_data['category'].capitalize(), inline=True)
-        embed.add_field(name="Severity", value=self.report_data['severity'].capitalize(), inline=True)
-        embed.add_field(name="Status", value=f"`{status.upper()}`", inline=True)
-        embed.add_field(name="Description", value=self.report_data['description'], inline=False)
-        embed.add_field(name="Steps to Reproduce", value=self.report_data['reproducesteps'].replace('\\n', '\n'), inline=False)
-        embed.set_footer(text=f"Bug Report ID: {self.report_id}", icon_url=self.bot.user.avatar.url if self.bot.user.avatar else None)
-        return embed
-
-# --- View for Bug Report Actions (Fixed/Decline) ---
+# --- Legacy view for Bug Report Actions (Fixed/Decline) ---
 class BugReportActionsView(ui.View):
-    def __init__(self, bot: commands.Bot, manager: BugReportManager, report_id: int, report_data: dict):
+    def __init__(self, bot: commands.Bot, manager: BugReportManager):
         super().__init__(timeout=None) # Timeout is None for persistence 
-        self.message = None
         self.bot = bot
         self.manager = manager
-        self.report_id = report_id
-        self.report_data = report_data # Store the full report data
-
-    async def on_timeout(self):
-        # Disable buttons when the view times out
-        for item in self.children:
-            item.disabled = True
-        if self.message:
-            await self.message.edit(view=self)
 
     @ui.button(label="Fixed", style=discord.ButtonStyle.green, custom_id="bug_fixed")
     async def fixed_button(self, interaction: Interaction, button: ui.Button):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this button.", ephemeral=True)
-            return
-        await interaction.response.defer(ephemeral=True)
-
-        archive_channel_id = os.getenv("BUG_ARCHIVE_CHANNEL_ID")
-        if not archive_channel_id:
-            await interaction.followup.send(
-                "❌ Error: Bug archive channel not configured. Cannot archive.",
-                ephemeral=True
-            )
-            print("Error: BUG_ARCHIVE_CHANNEL_ID not set in environment variables.")
-            return
-
-        try:
-            archive_channel = self.bot.get_channel(int(archive_channel_id))
-            if not archive_channel:
-                await interaction.followup.send(
-                    "❌ Error: Could not find the configured bug archive channel. Cannot archive.",
-                    ephemeral=True
-                )
-                print(f"Error: Could not find archive channel with ID {archive_channel_id}")
-                return
-            
-            archive_embed = discord.Embed(
-                title=f"✅ FIXED",
-                color=discord.Color.green(), # Green color for fixed
-                timestamp=interaction.created_at
-            )
-            archive_embed.add_field(name="Title", value=self.report_data.get('title', 'N/A'), inline=False)
-            archive_embed.add_field(name="Status", value="FIXED", inline=False)
-            archive_embed.add_field(name="Category", value=self.report_data.get('category', 'N/A').capitalize(), inline=True)
-            archive_embed.add_field(name="Severity", value=self.report_data.get('severity', 'N/A').capitalize(), inline=True)
-            archive_embed.add_field(name="Reporter", value=f"<@{self.report_data.get('reporterID', 'N/A')}>", inline=True)
-            if self.report_data.get("original_reporter"):
-                archive_embed.add_field(name="Original Reporter", value=f"{self.report_data.get('original_reporter')}", inline=True)
-            archive_embed.add_field(name="Reported At", value=self.report_data.get('reportedAt', 'N/A'), inline=True)
-            archive_embed.add_field(name="Description", value=self.report_data.get('description', 'N/A'), inline=False)
-            reproduce_steps_display = self.report_data.get('reproducesteps', 'N/A').replace('\\n', '\n')
-            archive_embed.add_field(name="Steps to Reproduce", value=reproduce_steps_display, inline=False)
-            # Add "Fixed by" to the footer with the fixer's logo
-            archive_embed.set_footer(
-                text=f"Fixed by: {interaction.user.display_name} - Bug Report ID: {self.report_id}",
-                icon_url=interaction.user.avatar.url if interaction.user.avatar else None # Use fixer's avatar
-            )
-            await archive_channel.send(embed=archive_embed)
-
-            # Delete the report after it's fixed and processed
-            await self.manager.update_report_status(self.report_id, "fixed")
-
-            if self.message: # Delete message from BUG_APPROVED_CHANNEL_ID 
-                await self.message.delete()
-
-            await interaction.followup.send(f"✅ Bug report `{self.report_id}` marked as fixed and archived.", ephemeral=True)
-            self.stop() # Stop the view
-        except Exception as e:
-            await interaction.followup.send(f"❌ An error occurred while marking report as fixed: {e}", ephemeral=True)
-
+        await handle_report_action(self.bot, self.manager, interaction, "fixed")
 
     @ui.button(label="Declined", style=discord.ButtonStyle.red, custom_id="bug_declined")
     async def declined_button(self, interaction: Interaction, button: ui.Button):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this button.", ephemeral=True)
-            return
-        await interaction.response.defer(ephemeral=True)
-
-        # Create an embed for the archive channel for declined reports
-        archive_channel_id = os.getenv("BUG_ARCHIVE_CHANNEL_ID")
-        if not archive_channel_id:
-            await interaction.followup.send(
-                "❌ Error: Bug archive channel not configured. Cannot archive.",
-                ephemeral=True
-            )
-            print("Error: BUG_ARCHIVE_CHANNEL_ID not set in environment variables.")
-            return
-
-        try:
-            archive_channel = self.bot.get_channel(int(archive_channel_id))
-            if not archive_channel:
-                await interaction.followup.send(
-                    "❌ Error: Could not find the configured bug archive channel. Cannot archive.",
-                    ephemeral=True
-                )
-                print(f"Error: Could not find archive channel with ID {archive_channel_id}")
-                return
-            
-            archive_embed = discord.Embed(
-                title=f"❌ DECLINED",
-                description=f"Bug Report #{self.report_id} has been declined by {interaction.user.display_name}.",
-                color=discord.Color.red(), # Red color for declined
-                timestamp=interaction.created_at
-            )
-            archive_embed.add_field(name="Title", value=self.report_data.get('title', 'N/A'), inline=False)
-            archive_embed.add_field(name="Status", value="DECLINED", inline=False)
-            archive_embed.add_field(name="Category", value=self.report_data.get('category', 'N/A').capitalize(), inline=True)
-            archive_embed.add_field(name="Severity", value=self.report_data.get('severity', 'N/A').capitalize(), inline=True)
-            archive_embed.add_field(name="Reporter", value=f"<@{self.report_data.get('reporterID', 'N/A')}>", inline=True)
-            if self.report_data.get("original_reporter"):
-                archive_embed.add_field(name="Original Reporter", value=f"{self.report_data.get('original_reporter')}", inline=True)
-            archive_embed.add_field(name="Reported At", value=self.report_data.get('reportedAt', 'N/A'), inline=True)
-            archive_embed.add_field(name="Description", value=self.report_data.get('description', 'N/A'), inline=False)
-            reproduce_steps_display = self.report_data.get('reproducesteps', 'N/A').replace('\\n', '\n')
-            archive_embed.add_field(name="Steps to Reproduce", value=reproduce_steps_display, inline=False)
-            archive_embed.set_footer(
-                text=f"Declined by: {interaction.user.display_name} - Bug Report ID: {self.report_id}",
-                icon_url=interaction.user.avatar.url if interaction.user.avatar else None
-            )
-            await archive_channel.send(embed=archive_embed)
-            
-            await self.manager.update_report_status(self.report_id, "declined")
-
-
-            if self.message: # Delete message from BUG_APPROVED_CHANNEL_ID 
-                await self.message.delete()
-
-            await interaction.followup.send(f"❌ Bug report `{self.report_id}` marked as declined and archived.", ephemeral=True)
-            self.stop() # Stop the view
-        except Exception as e:
-            await interaction.followup.send(f"❌ An error occurred while marking report as declined: {e}", ephemeral=True)
+        await handle_report_action(self.bot, self.manager, interaction, "declined")
 
 
 # --- Command Cog ---
@@ -657,8 +1112,36 @@ class bugreports(commands.Cog):
         self.bug_report_manager = BugReportManager(bot)
 
     async def setup_hook(self) -> None: # For persistent views 
-        self.bot.add_view(BugReportApprovalView(self.bot, self.bug_report_manager, 0, {}))
-        self.bot.add_view(BugReportActionsView(self.bot, self.bug_report_manager, 0, {}))
+        self.bot.add_dynamic_items(BugReportButton)
+        self.bot.add_view(BugReportApprovalView(self.bot, self.bug_report_manager))
+        self.bot.add_view(BugReportActionsView(self.bot, self.bug_report_manager))
+
+        self.archive_loop.start()
+
+    async def warm_up(self):
+        await self.bug_report_manager.load()
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        # Commands wait for the reports to be loaded instead of seeing an empty manager
+        return await self.bot.warmup.check(interaction, self.qualified_name)
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(BugReportButton)
+        self.archive_loop.cancel()
+
+    @tasks.loop(hours=24)
+    async def archive_loop(self):
+        try:
+            moved = await self.bug_report_manager.archive_closed_reports()
+            if moved:
+                print(f"Archived {moved} closed bug reports.")
+        except Exception as e:
+            print(f"An error occurred while archiving closed bug reports: {e}")
+
+    @archive_loop.before_loop
+    async def before_archive_loop(self):
+        await self.bot.wait_until_ready()
+        await self.bot.warmup.wait(self.qualified_name)
 
     @app_commands.command(
         name="submitbug",
@@ -703,49 +1186,317 @@ class bugreports(commands.Cog):
     @app_commands.command(name="buglist", description="Shows all pending bug reports with pagination and sorting (Admin only).")
     async def bug_list(self, interaction: Interaction):
         await interaction.response.defer(ephemeral=True)
-        self.bug_report_manager.reports = await self.bug_report_manager._load_reports()
+        # Every write goes through the manager, so its resident hot set is already current
         view = BugListPaginationView(self.bot, self.bug_report_manager, interaction.user)
         await view.initialize_and_send(interaction)
 
-    @app_commands.command(
-        name="dumpstats",
-        description="Shows bug report statistics for a specific date (Admin only)."
+    @app_commands.command(name="bugsearch", description="Search bug reports by title, description and steps to reproduce.")
+    @app_commands.describe(
+        query="Words to search for (e.g. dungeon door)",
+        status="Only show reports with this status",
+        category="Only show reports in this category",
+        from_date="Only show reports from this date on, in YYYY-MM-DD format",
+        to_date="Only show reports up to this date, in YYYY-MM-DD format"
     )
+    @app_commands.choices(
+        status=[
+            app_commands.Choice(name="Pending", value="pending"),
+            app_commands.Choice(name="Approved", value="approved"),
+            app_commands.Choice(name="Fixed", value="fixed"),
+            app_commands.Choice(name="Declined", value="declined"),
+        ],
+        category=[
+            app_commands.Choice(name="Mining", value="mining"),
+            app_commands.Choice(name="Foraging", value="foraging"),
+            app_commands.Choice(name="Dungeons", value="dungeons"),
+            app_commands.Choice(name="Slayers", value="slayers"),
+            app_commands.Choice(name="Island", value="island"),
+            app_commands.Choice(name="Fishing", value="fishing"),
+            app_commands.Choice(name="Others", value="others"),
+        ]
+    )
+    async def bug_search(self, interaction: Interaction, query: str, status: Optional[str] = None, category: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None):
+        try:
+            started = time.perf_counter()
+            results = await self.bug_report_manager.search_reports(
+                query,
+                status_filter=status or "all",
+                category_filter=category or "all",
+                date_from=from_date,
+                date_to=to_date
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        except ValueError:
+            await interaction.response.send_message("❌ Invalid date format. Please use YYYY-MM-DD (e.g., 2023-01-15).", ephemeral=True)
+            return
+
+        embed = discord.Embed(
+            title=f"🔎 Bug Search: {query[:200]}",
+            color=discord.Color.blue()
+        )
+        if not results:
+            embed.description = "No bug reports matched your search, including archived ones. Try fewer or different words."
+        else:
+            for report, score in results:
+                embed.add_field(
+                    name=f"#{report['id']} - {report['title']}",
+                    value=(
+                        f"**Status:** {report.get('status', 'N/A').capitalize()} | "
+                        f"**Severity:** {report.get('severity', 'N/A').capitalize()} | "
+                        f"**Category:** {report.get('category', 'N/A').capitalize()}\n"
+                        f"**Reported At:** {report.get('reportedAt', 'N/A')}\n"
+                        f"**Description:** {report.get('description', '')[:150]}{'...' if len(report.get('description', '')) > 150 else ''}"
+                    ),
+                    inline=False
+                )
+        archived_count = sum(1 for report, _ in results if report.get("id") not in self.bug_report_manager._reports_by_id)
+        embed.set_footer(text=f"{len(results)} result(s), {archived_count} from the archive, in {elapsed_ms:.1f}ms")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="bulktriage", description="Approve, decline or fix many bug reports at once (Admin only).")
     @app_commands.describe(
-        date="The date to check stats for in YYYY-MM-DD format."
+        report_ids="Report IDs and ranges, e.g. 12, 15-20, 31",
+        action="What to do with every listed report",
+        points="Points per approved report (reports filed for someone else get 1, as with the button)"
+    )
+    @app_commands.choices(
+        action=[
+            app_commands.Choice(name="Approve", value="approve"),
+            app_commands.Choice(name="Decline", value="decline"),
+            app_commands.Choice(name="Mark Fixed", value="fixed"),
+        ]
     )
-    async def dump_stats(self, interaction: Interaction, date: str):
+    @admin_only()
+    async def bulk_triage(self, interaction: Interaction, report_ids: str, action: str, points: app_commands.Range[int, 1, 5] = 1):
         """
-        Calculates and displays bug report statistics for a given date,
-        including total reports and reports per user.
+        Applies one action to many reports: one report save, one event log write, one points write,
+        then the channel posts, with archive and reward embeds packed up to 10 per message.
         """
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        if not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this command.", ephemeral=True)
+        try:
+            requested_ids = parse_report_ids(report_ids)
+        except ValueError:
+            await interaction.response.send_message("❌ Invalid report IDs. Use numbers and ranges, e.g. `12, 15-20, 31`.", ephemeral=True)
+            return
+        if not requested_ids:
+            await interaction.response.send_message("❌ No report IDs given.", ephemeral=True)
+            return
+        if len(requested_ids) > MAX_BULK_TRIAGE:
+            await interaction.response.send_message(f"❌ You can triage at most {MAX_BULK_TRIAGE} reports at once.", ephemeral=True)
             return
 
-        await interaction.response.defer() # Defer without ephemeral=True for a public response later
+        await interaction.response.defer(ephemeral=True)
+        manager = self.bug_report_manager
+        required_status, new_status = BULK_TRIAGE_ACTIONS[action]
+
+        eligible, skipped = [], []
+        for report_id in requested_ids:
+            report = await manager.get_report_by_id(report_id)
+            if not report:
+                skipped.append(f"`{report_id}` (not found)")
+            elif (report.get("status") or "pending").lower() != required_status:
+                skipped.append(f"`{report_id}` ({report.get('status', 'pending')})")
+            elif report_id in manager.actions_in_flight:
+                skipped.append(f"`{report_id}` (being handled)")
+            else:
+                eligible.append(report_id)
+                # Claimed right away, so a button click on the same report is turned away instead of paying out twice
+                manager.actions_in_flight.add(report_id)
+
+        if not eligible:
+            await interaction.followup.send(f"❌ None of the reports can be triaged with this action. Skipped: {', '.join(skipped)}", ephemeral=True)
+            return
 
         try:
-            # Validate date format
-            datetime.strptime(date, "%Y-%m-%d")
+            started = time.perf_counter()
+            updated = await manager.bulk_update_status(eligible, new_status, interaction.user.id)
+            reports = [await manager.get_report_by_id(report_id) for report_id in updated]
+
+            awarded = {}  # report ID -> points given
+            if action == "approve":
+                eco = self.bot.get_cog("Economy")
+                if eco:
+                    awarded = {report["id"]: 1 if report.get("original_reporter") else points for report in reports}
+                    # Several reports by the same user become a single increment
+                    totals = defaultdict(int)
+                    for report in reports:
+                        totals[str(report.get("reporterID"))] += awarded[report["id"]]
+                    await eco._add_points_bulk(totals)
+                else:
+                    await interaction.followup.send("⚠️ Points system unavailable.", ephemeral=True)
 
-            # Load all reports from the manager (ensures data is fresh)
-            all_reports = await self.bug_report_manager._load_reports()
+            # The old pending / approved messages go in one bulk delete per channel
+            await manager.delete_report_messages(updated, priority=PRIORITY_INTERACTION)
 
-            # Filter reports for the specified date
-            daily_reports = [
-                report for report in all_reports
-                if report.get('reportedAt') == date
-            ]
+            summary = f"✅ {len(updated)} report(s) marked as {new_status} in {time.perf_counter() - started:.1f}s."
+            if skipped:
+                summary += f"\nSkipped: {', '.join(skipped)}"
+            await interaction.followup.send(summary + "\n📤 Posting to channels...", ephemeral=True)
+
+            posted = await self._post_bulk_triage(interaction, reports, action, awarded)
+            await interaction.followup.send(f"📤 Posted {posted} message(s) for {len(updated)} report(s).", ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(f"❌ An error occurred during bulk triage: {e}", ephemeral=True)
+            print(f"An error occurred in /bulktriage command: {e}")
+        finally:
+            manager.actions_in_flight.difference_update(eligible)
+
+    async def _post_bulk_triage(self, interaction: Interaction, reports: list, action: str, awarded: dict):
+        """
+        Sends the archive or reward embeds in batches, plus one approved message per report (each needs its own buttons).
+        Returns the number of messages sent.
+        """
+        posted = 0
+        if action == "approve":
+            reward_channel_id = os.getenv("BUG_POINT_REWARD_CHANNEL_ID")
+            reward_channel = self.bot.get_channel(int(reward_channel_id)) if reward_channel_id else None
+            if reward_channel and awarded:
+                embeds = [
+                    build_reward_embed(report["id"], report, awarded[report["id"]], self.bot.get_user(int(report["reporterID"])), interaction.user)
+                    for report in reports
+                ]
+                for batch in batch_embeds(embeds):
+                    await self.bot.outbound.send(reward_channel, embeds=batch, priority=PRIORITY_INTERACTION)
+                    posted += 1
+            for report in reports:
+                await send_approved_report(self.bot, self.bug_report_manager, interaction, report["id"], report)
+                posted += 1
+            return posted
+
+        archive_channel_id = os.getenv("BUG_ARCHIVE_CHANNEL_ID")
+        archive_channel = self.bot.get_channel(int(archive_channel_id)) if archive_channel_id else None
+        if not archive_channel:
+            print("Error: BUG_ARCHIVE_CHANNEL_ID not set or channel not found; bulk triaged reports were not archived to a channel.")
+            return posted
+        status = BULK_TRIAGE_ACTIONS[action][1]
+        embeds = [build_archive_embed(report["id"], report, status, interaction.user, interaction.created_at) for report in reports]
+        for batch in batch_embeds(embeds):
+            await self.bot.outbound.send(archive_channel, embeds=batch, priority=PRIORITY_INTERACTION)
+            posted += 1
+        return posted
+
+    @app_commands.command(name="exportbugs", description="Export bug reports as a compressed CSV or NDJSON file (Admin only).")
+    @app_commands.describe(
+        file_format="CSV for spreadsheets, NDJSON (one JSON report per line) for scripts",
+        status="Only export reports with this status",
+        category="Only export reports in this category",
+        from_date="Only export reports from this date on, in YYYY-MM-DD format",
+        to_date="Only export reports up to this date, in YYYY-MM-DD format"
+    )
+    @app_commands.choices(
+        file_format=[
+            app_commands.Choice(name="CSV", value="csv"),
+            app_commands.Choice(name="NDJSON", value="ndjson"),
+        ],
+        status=[
+            app_commands.Choice(name="Pending", value="pending"),
+            app_commands.Choice(name="Approved", value="approved"),
+            app_commands.Choice(name="Fixed", value="fixed"),
+            app_commands.Choice(name="Declined", value="declined"),
+        ],
+        category=[
+            app_commands.Choice(name="Mining", value="mining"),
+            app_commands.Choice(name="Foraging", value="foraging"),
+            app_commands.Choice(name="Dungeons", value="dungeons"),
+            app_commands.Choice(name="Slayers", value="slayers"),
+            app_commands.Choice(name="Island", value="island"),
+            app_commands.Choice(name="Fishing", value="fishing"),
+            app_commands.Choice(name="Others", value="others"),
+        ]
+    )
+    @admin_only()
+    async def export_bugs(self, interaction: Interaction, file_format: str = "csv", status: Optional[str] = None, category: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None):
+        """
+        Streams reports from both the hot and archive collections into gzip files on disk, one batch at a time,
+        and uploads them as attachments. Exports bigger than the server's upload limit are split into parts.
+        """
+        try:
+            for value in (from_date, to_date):
+                if value:
+                    datetime.strptime(value, "%Y-%m-%d")
+        except ValueError:
+            await interaction.response.send_message("❌ Invalid date format. Please use YYYY-MM-DD (e.g., 2023-01-15).", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        part_limit = interaction.guild.filesize_limit if interaction.guild else discord.utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+        query = export_query(status, category, from_date, to_date)
+
+        try:
+            started = time.perf_counter()
+            with tempfile.TemporaryDirectory(prefix="bugexport_") as directory:
+                paths, total = await asyncio.to_thread(write_export, query, file_format, directory, part_limit)
+                if not total:
+                    await interaction.followup.send("ℹ️ No bug reports match these filters.", ephemeral=True)
+                    return
+                elapsed = time.perf_counter() - started
+                for number, path in enumerate(paths, start=1):
+                    part_text = f" (part {number}/{len(paths)})" if len(paths) > 1 else ""
+                    await interaction.followup.send(
+                        f"📦 Exported {total} bug report(s) in {elapsed:.1f}s{part_text}." if number == 1 else f"📦 Part {number}/{len(paths)}",
+                        file=discord.File(path),
+                        ephemeral=True
+                    )
+        except Exception as e:
+            await interaction.followup.send(f"❌ An error occurred while exporting bug reports: {e}", ephemeral=True)
+            print(f"An error occurred in /exportbugs command: {e}")
+
+    @app_commands.command(name="bugarchive", description="Browse archived (closed) bug reports.")
+    @app_commands.describe(
+        status="Only show reports with this status",
+        category="Only show reports in this category",
+        reporter="Only show reports filed by this user"
+    )
+    @app_commands.choices(
+        status=[
+            app_commands.Choice(name="Fixed", value="fixed"),
+            app_commands.Choice(name="Declined", value="declined"),
+        ],
+        category=[
+            app_commands.Choice(name="Mining", value="mining"),
+            app_commands.Choice(name="Foraging", value="foraging"),
+            app_commands.Choice(name="Dungeons", value="dungeons"),
+            app_commands.Choice(name="Slayers", value="slayers"),
+            app_commands.Choice(name="Island", value="island"),
+            app_commands.Choice(name="Fishing", value="fishing"),
+            app_commands.Choice(name="Others", value="others"),
+        ]
+    )
+    async def bug_archive(self, interaction: Interaction, status: Optional[str] = None, category: Optional[str] = None, reporter: Optional[discord.User] = None):
+        await interaction.response.defer(ephemeral=True)
+        query = archive.archive_query(status, category, reporter.id if reporter else None)
+        view = BugArchivePaginationView(interaction.user, query)
+        await view.initialize_and_send(interaction)
 
-            report_counts = len(daily_reports)
-            reporter_counts = defaultdict(int)
+    @app_commands.command(
+        name="dumpstats",
+        description="Shows bug report statistics for a date or date range (Admin only)."
+    )
+    @app_commands.describe(
+        date="The date to check stats for in YYYY-MM-DD format (start of the range if end_date is given).",
+        end_date="Optional: Last date of the range in YYYY-MM-DD format."
+    )
+    @admin_only()
+    async def dump_stats(self, interaction: Interaction, date: str, end_date: Optional[str] = None):
+        """
+        Displays bug report statistics for a given date or inclusive date range,
+        including total reports, reports per user, per category and per status.
+        Reads the pre-aggregated daily rollups, so the cost depends on the number of days, not reports.
+        """
+        await interaction.response.defer() # Defer without ephemeral=True for a public response later
 
-            for report in daily_reports:
-                reporter_id = report.get('reporterID')
-                if reporter_id:
-                    reporter_counts[reporter_id] += 1
+        try:
+            # Validate date format
+            start = datetime.strptime(date, "%Y-%m-%d")
+            end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else start
+            if end < start:
+                await interaction.followup.send("❌ end_date must not be before date.", ephemeral=True)
+                return
+            start_str, end_str = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+            summary = await asyncio.to_thread(rollups.load_range, start_str, end_str)
+            report_counts = summary["total"]
+            reporter_counts = {reporter_id: count for reporter_id, count in summary["reporters"].items() if count > 0}
+            period_text = f"On **{start_str}**" if start_str == end_str else f"From **{start_str}** to **{end_str}**"
 
             # Prepare the embed message
             embed = discord.Embed(
@@ -756,7 +1507,7 @@ class bugreports(commands.Cog):
 
             embed.add_field(
                 name="\u200b", # Zero width space for spacing
-                value=f"On **{date}**, **{report_counts}** bugs were reported.",
+                value=f"{period_text}, **{report_counts}** bugs were reported.",
                 inline=False
             )
 
@@ -782,10 +1533,15 @@ class bugreports(commands.Cog):
                         value="\n".join(reporter_list_str) if reporter_list_str else "No specific reporters found for this date.",
                         inline=False
                     )
+
+                category_lines = [f"{category.capitalize()}: `{count}`" for category, count in sorted(summary["categories"].items(), key=lambda item: item[1], reverse=True) if count > 0]
+                status_lines = [f"{status.capitalize()}: `{count}`" for status, count in sorted(summary["statuses"].items(), key=lambda item: item[1], reverse=True) if count > 0]
+                embed.add_field(name="Categories:", value="\n".join(category_lines) or "N/A", inline=True)
+                embed.add_field(name="Current Status:", value="\n".join(status_lines) or "N/A", inline=True)
             else:
                 embed.add_field(
                     name="Reporters:",
-                    value="No bug reports found for this date.",
+                    value="No bug reports found for this period.",
                     inline=False
                 )
 
@@ -807,12 +1563,155 @@ class bugreports(commands.Cog):
             )
             print(f"An error occurred in /dumpstats command: {e}")
 
+    @app_commands.command(name="nextbug", description="Hands you the highest priority pending bug report to review (Admin only).")
+    @admin_only()
+    async def next_bug(self, interaction: Interaction):
+        """
+        Pops the top of the review queue (severity, time waiting and the reporter's approval ratio),
+        skipping reports another admin has claimed, and shows it with its approve / decline buttons.
+        """
+        manager = self.bug_report_manager
+        report = manager.claim_next_report(interaction.user.id)
+        if not report:
+            await interaction.response.send_message("🎉 No pending bug reports left to review.", ephemeral=True)
+            return
+
+        report_id = report["id"]
+        ratio = manager.reporter_stats.approval_ratio(report.get("reporterID"))
+        embed = discord.Embed(
+            title=f"🚨 Next Bug Report: {report['title']}",
+            description=f"Claimed by you for {int(CLAIM_DURATION.total_seconds() // 60)} minutes; other admins will be given the next report.",
+            color=discord.Color.red()
+        )
+        embed.add_field(name="Reporter", value=f"<@{report['reporterID']}> ({report['reporterID']})", inline=False)
+        if report.get("original_reporter"):
+            embed.add_field(name="Original Reporter", value=f"{report['original_reporter']}", inline=False)
+        embed.add_field(name="Category", value=report.get('category', 'N/A').capitalize(), inline=True)
+        embed.add_field(name="Severity", value=report.get('severity', 'N/A').capitalize(), inline=True)
+        embed.add_field(name="Reported At", value=report.get('reportedAt', 'N/A'), inline=True)
+        embed.add_field(name="Description", value=report.get('description', 'N/A'), inline=False)
+        embed.add_field(name="Steps to Reproduce", value=report.get('reproducesteps', 'N/A').replace('\\n', '\n'), inline=False)
+        embed.add_field(name="Reporter Approval Ratio", value=f"{round(ratio * 100)}%", inline=True)
+        embed.add_field(name="Pending Queue", value=f"{len(manager.priority_queue)} report(s)", inline=True)
+        embed.set_footer(text=f"Bug Report ID: {report_id}")
+        await interaction.response.send_message(embed=embed, view=report_buttons_view("pending", report_id), ephemeral=True)
+
+    @app_commands.command(
+        name="triagestats",
+        description="Shows how long bug reports wait to be triaged and fixed (Admin only)."
+    )
+    @admin_only()
+    async def triage_stats(self, interaction: Interaction):
+        triage = self.bug_report_manager.triage
+        embed = discord.Embed(
+            title="⏱️ Bug Triage Latency",
+            description="Percentiles are bucket upper bounds: the real value is at most the number shown.",
+            color=discord.Color.purple(),
+            timestamp=datetime.now(timezone.utc)
+        )
+
+        for metric, metric_name in METRIC_NAMES.items():
+            overall = triage.get(metric)
+            if not overall or not overall.total:
+                embed.add_field(name=metric_name, value="No transitions recorded yet.", inline=False)
+                continue
+
+            lines = [
+                f"**Overall:** p50 `{format_duration(overall.percentile(0.5))}`, p90 `{format_duration(overall.percentile(0.9))}`, "
+                f"p99 `{format_duration(overall.percentile(0.99))}` over `{overall.total}` reports"
+            ]
+            for dimension in DIMENSIONS:
+                rows = sorted(
+                    ((key[2], histogram) for key, histogram in triage.histograms.items() if key[0] == metric and key[1] == dimension and histogram.total),
+                    # Slowest first so the rotting categories are at the top
+                    key=lambda row: row[1].percentile(0.5),
+                    reverse=True
+                )
+                for value, histogram in rows:
+                    lines.append(f"{dimension.capitalize()} **{value.capitalize()}:** p50 `{format_duration(histogram.percentile(0.5))}`, p90 `{format_duration(histogram.percentile(0.9))}` (`{histogram.total}`)")
+            embed.add_field(name=metric_name, value="\n".join(lines)[:1024], inline=False)
+
+        embed.set_footer(text=f"Issued by {interaction.user.display_name}",
+                         icon_url=interaction.user.avatar.url if interaction.user.avatar else None)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(
+        name="rebuildstats",
+        description="Regenerates the daily bug report stats from the raw reports (Admin only)."
+    )
+    @admin_only()
+    async def rebuild_stats(self, interaction: Interaction):
+        await interaction.response.defer(ephemeral=True)
+        try:
+            started = time.perf_counter()
+            counted = await asyncio.to_thread(rollups.rebuild_rollups, archive.REPORT_COLLECTIONS)
+            reporters = await asyncio.to_thread(self.bug_report_manager.reporter_stats.rebuild, archive.REPORT_COLLECTIONS)
+            self.bug_report_manager.requeue_pending_reports()
+            await self.bug_report_manager._save_reports()  # /buglist sorts on the stored priority keys
+            await interaction.followup.send(f"✅ Rebuilt daily stats from {counted} reports and approval ratios for {reporters} reporters in {time.perf_counter() - started:.1f}s.", ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(f"❌ An error occurred while rebuilding stats: {e}", ephemeral=True)
+            print(f"An error occurred in /rebuildstats command: {e}")
+
+    async def _load_checkpoint(self, report_type: str):
+        checkpoints = await asyncio.to_thread(load_data, LOAD_REPORTS_CHECKPOINTS)
+        return next((checkpoint for checkpoint in checkpoints if checkpoint.get("report_type") == report_type), None)
+
+    async def _save_checkpoint(self, checkpoint: dict):
+        await asyncio.to_thread(upsert_data, LOAD_REPORTS_CHECKPOINTS, dict(checkpoint), "report_type")
+
+    async def _purge_registered_messages(self, target_channel, progress):
+        """
+        Deletes the report messages the registry knows about in the channel, without reading its history.
+        """
+        async def report_progress(deleted_count, total):
+            await progress(f"🔄 Clearing {target_channel.mention}... {deleted_count}/{total} messages deleted so far.")
+
+        message_ids = self.bug_report_manager.messages.messages_in_channel(target_channel.id)
+        return await self.bug_report_manager.delete_channel_messages(target_channel, message_ids, progress=report_progress)
+
+    async def _purge_bot_messages(self, target_channel, progress):
+        """
+        Deletes every message the bot sent in the channel by walking its history.
+        Only needed for channels with messages posted before the message registry existed.
+        """
+        bulk_cutoff = datetime.now(timezone.utc) - timedelta(days=BULK_DELETE_MAX_AGE_DAYS)
+        batch = []
+        deleted_count = 0
+
+        async for message in target_channel.history(limit=None):
+            if message.author != self.bot.user: # Only delete messages sent by the bot
+                continue
+            if message.created_at > bulk_cutoff:
+                batch.append(message)
+                if len(batch) == BULK_DELETE_BATCH_SIZE:
+                    await self.bot.outbound.delete_messages(target_channel, batch, priority=PRIORITY_BULK)
+                    deleted_count += len(batch)
+                    batch = []
+                    await progress(f"🔄 Clearing {target_channel.mention}... {deleted_count} messages deleted so far.")
+            else:
+                try:
+                    await self.bot.outbound.delete(message, priority=PRIORITY_BULK)
+                    deleted_count += 1
+                except discord.NotFound:
+                    pass
+
+        if batch:
+            await self.bot.outbound.delete_messages(target_channel, batch, priority=PRIORITY_BULK)
+            deleted_count += len(batch)
+
+        # Everything the registry had for this channel is gone now
+        await self.bug_report_manager.messages.forget(self.bug_report_manager.messages.messages_in_channel(target_channel.id))
+        return deleted_count
+
     @app_commands.command(
         name="loadreports",
         description="Clears a bug report channel and re-sends all reports of a specific status (Admin only)."
     )
     @app_commands.describe(
-        report_type="Select which type of reports to load."
+        report_type="Select which type of reports to load.",
+        restart="Ignore any interrupted run and start over from clearing the channel.",
+        scan_history="Also scan the channel history for bot messages the registry does not know about."
     )
     @app_commands.choices(
         report_type=[
@@ -820,27 +1719,20 @@ class bugreports(commands.Cog):
             app_commands.Choice(name="Approved Reports", value="approved"),
         ]
     )
-    async def load_reports(self, interaction: Interaction, report_type: str):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        if not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this command.", ephemeral=True)
-            return
-
+    @admin_only()
+    async def load_reports(self, interaction: Interaction, report_type: str, restart: bool = False, scan_history: bool = False):
         await interaction.response.defer(ephemeral=True) # Defer to prevent timeout
 
         channel_id_env_var = ""
         embed_color = discord.Color.blue() # Default color
-        view_class = None # To hold the view class (Approval or Actions)
 
         if report_type == "pending":
             channel_id_env_var = "BUG_REPORT_CHANNEL_ID"
             embed_color = discord.Color.red()
-            view_class = BugReportApprovalView
             status_text = "`PENDING`"
         elif report_type == "approved":
             channel_id_env_var = "BUG_APPROVED_CHANNEL_ID"
             embed_color = discord.Color.green()
-            view_class = BugReportActionsView
             status_text = "`APPROVED`"
         else:
             await interaction.followup.send("Invalid report type selected.", ephemeral=True)
@@ -857,37 +1749,69 @@ class bugreports(commands.Cog):
                 await interaction.followup.send(f"❌ Error: Could not find the configured channel with ID {channel_id}.", ephemeral=True)
                 return
 
-            # Step 1: Clear existing messages in the channel
-            await interaction.followup.send(f"🔄 Clearing existing logs in {target_channel.mention}...")
-            deleted_count = 0
-            # Fetch messages and delete those sent by the bot
-            # Using a loop to handle potential large number of messages
-            async for message in target_channel.history(limit=None):
-                if message.author == self.bot.user: # Only delete messages sent by the bot
+            progress_message = await interaction.followup.send(f"🔄 Preparing to load {report_type} reports into {target_channel.mention}...")
+            last_progress_update = 0.0
+
+            async def progress(content: str, force: bool = False):
+                # Progress edits share the rate limit with everything else, so they are throttled
+                nonlocal last_progress_update
+                now = time.monotonic()
+                if force or now - last_progress_update >= PROGRESS_UPDATE_INTERVAL:
+                    last_progress_update = now
                     try:
-                        await message.delete()
-                        deleted_count += 1
-                    except discord.Forbidden:
-                        print(f"Error: Bot does not have permissions to delete message {message.id} in {target_channel.name}. Please grant 'Manage Messages'.")
-                        await interaction.followup.send(f"❌ Error: Missing permissions to delete messages in {target_channel.mention}. Please grant 'Manage Messages'.", ephemeral=True)
-                        return # Exit if permissions are missing
-                    except discord.HTTPException as http_exc:
-                        print(f"HTTP error deleting message {message.id}: {http_exc}")
-                        # Continue or break depending on the severity of the HTTP error
-                await asyncio.sleep(1) # Small delay to respect rate limits during bulk deletion
-
-            await interaction.followup.send(f"✅ Cleared {deleted_count} bot messages from {target_channel.mention}.")
+                        await progress_message.edit(content=content)
+                    except discord.HTTPException:
+                        pass
+
+            # A checkpoint lets an interrupted run pick up where it stopped instead of starting from zero
+            checkpoint = None if restart else await self._load_checkpoint(report_type)
+            if checkpoint and checkpoint.get("channel_id") != target_channel.id:
+                checkpoint = None
+            if checkpoint is None:
+                checkpoint = {"report_type": report_type, "channel_id": target_channel.id, "stage": "purge", "last_sent_id": 0, "sent_count": 0, "failed_ids": []}
+                await self._save_checkpoint(checkpoint)
+
+            # Step 1: Clear existing messages in the channel
+            if checkpoint["stage"] == "purge":
+                await progress(f"🔄 Clearing existing logs in {target_channel.mention}...", force=True)
+                try:
+                    # Channels the registry has never seen (e.g. from before it existed) still need a history scan
+                    if scan_history or not self.bug_report_manager.messages.messages_in_channel(target_channel.id):
+                        deleted_count = await self._purge_bot_messages(target_channel, progress)
+                    else:
+                        deleted_count = await self._purge_registered_messages(target_channel, progress)
+                except discord.Forbidden:
+                    print(f"Error: Bot does not have permissions to delete messages in {target_channel.name}. Please grant 'Manage Messages'.")
+                    await interaction.followup.send(f"❌ Error: Missing permissions to delete messages in {target_channel.mention}. Please grant 'Manage Messages'.", ephemeral=True)
+                    return # Exit if permissions are missing
+                checkpoint["stage"] = "resend"
+                await self._save_checkpoint(checkpoint)
+                await interaction.followup.send(f"✅ Cleared {deleted_count} bot messages from {target_channel.mention}.")
+            else:
+                await interaction.followup.send(f"⏩ Resuming interrupted run after report ID {checkpoint['last_sent_id']} ({checkpoint['sent_count']} already sent).")
 
             # Step 2: Load all reports of the specified type
-            await self.bug_report_manager._load_reports() # Ensure reports are up-to-date from your data source
-            reports_to_resend = await self.bug_report_manager.get_filtered_and_sorted_reports(status_filter=report_type)
+            await self.bug_report_manager.reload_reports() # Ensure reports are up-to-date from your data source
+            all_of_type = await self.bug_report_manager.get_filtered_and_sorted_reports(status_filter=report_type)
+            # Reports past the checkpoint, plus any whose send failed. Reports already registered in the channel
+            # were posted after the last checkpoint write (the run died in between) and are not posted twice.
+            failed_ids = set(checkpoint.setdefault("failed_ids", []))
+            reports_to_resend = [
+                report for report in all_of_type
+                if (report.get('id', 0) > checkpoint["last_sent_id"] or report.get('id', 0) in failed_ids)
+                and target_channel.id not in self.bug_report_manager.messages.messages_for_report(report.get('id', 0))
+            ]
 
             if not reports_to_resend:
-                await interaction.followup.send(f"ℹ️ No {report_type} reports found to re-send.", ephemeral=True)
+                await asyncio.to_thread(delete_data, LOAD_REPORTS_CHECKPOINTS, {"report_type": report_type})
+                await progress(f"ℹ️ No {report_type} reports left to re-send.", force=True)
                 return
 
-            # Step 3: Resend reports to the channel
-            sent_count = 0
+            # Step 3: Resend reports to the channel.
+            # No fixed sleeps here: sends go through the shared outbound scheduler at bulk priority, and
+            # discord.py still waits on the real rate limit headers if a bucket runs dry.
+            sent_count = checkpoint["sent_count"]
+            total = sent_count + len(reports_to_resend)
             for report in reports_to_resend:
                 try:
                     embed = discord.Embed(
@@ -911,32 +1835,121 @@ class bugreports(commands.Cog):
                     embed.add_field(name="Steps to Reproduce", value=reproduce_steps_display, inline=False)
                     embed.set_footer(text=f"Bug Report ID: {report['id']}", icon_url=self.bot.user.avatar.url if self.bot.user.avatar else None)
 
-                    # Create and link the appropriate view
-                    if view_class:
-                        # Ensure report_data is passed correctly, as views need it for their actions
-                        view_instance = view_class(self.bot, self.bug_report_manager, report['id'], report)
-                        message = await target_channel.send(embed=embed, view=view_instance)
-                        view_instance.message = message 
-                        self.bot.add_view(view_instance)
-                    else:
-                        await target_channel.send(embed=embed) # Fallback if no view is needed (though for pending/approved, views are crucial)
-
-                    sent_count += 1
-                    await asyncio.sleep(1) 
+                    # The buttons carry the report ID, so nothing per report has to be registered with the bot
+                    message = await self.bot.outbound.send(target_channel, embed=embed, view=report_buttons_view(report_type, report['id']), priority=PRIORITY_BULK)
+                    await self.bug_report_manager.register_message(message, report['id'])
                 except Exception as e:
                     print(f"Error re-sending report {report.get('id', 'N/A')}: {e}")
                     await interaction.followup.send(f"❌ Error re-sending report ID {report.get('id', 'N/A')}: {e}", ephemeral=True)
+                    # Kept in the checkpoint so a resumed run tries it again
+                    failed_ids.add(report.get('id', 0))
+                    checkpoint["failed_ids"] = sorted(failed_ids)
+                    await self._save_checkpoint(checkpoint)
                     continue # Continue to next report even if one fails
 
+                # Only a posted and registered report moves the checkpoint; one upsert per report
+                sent_count += 1
+                failed_ids.discard(report['id'])
+                checkpoint["last_sent_id"] = max(checkpoint["last_sent_id"], report['id'])
+                checkpoint["sent_count"] = sent_count
+                checkpoint["failed_ids"] = sorted(failed_ids)
+                await self._save_checkpoint(checkpoint)
+                await progress(f"📤 Re-sending {report_type} reports to {target_channel.mention}... {sent_count}/{total}")
+
+            if failed_ids:
+                # The checkpoint stays, so running /loadreports again retries only the failed reports
+                await progress(f"⚠️ Re-sent {sent_count}/{total} {report_type} reports to {target_channel.mention}; {len(failed_ids)} failed. Run /loadreports again to retry them.", force=True)
+            else:
+                await asyncio.to_thread(delete_data, LOAD_REPORTS_CHECKPOINTS, {"report_type": report_type})
+                await progress(f"✅ Re-sent {sent_count}/{total} {report_type} reports to {target_channel.mention}.", force=True)
             await interaction.followup.send(f"✅ Successfully re-sent {sent_count} {report_type} reports to {target_channel.mention}.")
 
         except ValueError:
             await interaction.followup.send(f"❌ An error occurred: Invalid channel ID for {channel_id_env_var}.", ephemeral=True)
             print(f"Error: Channel ID from {channel_id_env_var} is not a valid integer.")
         except Exception as e:
-            await interaction.followup.send(f"❌ An unexpected error occurred: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ An unexpected error occurred: {e}. Run /loadreports again to resume.", ephemeral=True)
             print(f"An unexpected error occurred in load_reports command: {e}")
 
+class BugArchivePaginationView(ui.View):
+    """
+    Pages through the archive collection straight from storage, newest first.
+    Only the current page is held; earlier pages are found again from the IDs they started below.
+    """
+
+    def __init__(self, author: discord.User, query: dict):
+        super().__init__(timeout=300)
+        self.author = author
+        self.query = query
+        self.reports_per_page = 4
+        self.page_starts = [None]  # before_id of every page visited so far; the last one is the current page
+        self.page_reports = []
+        self.has_next = False
+        self.total = 0
+
+    async def _load_page(self):
+        # One extra report tells us whether there is a next page without counting
+        reports = await asyncio.to_thread(archive.archived_page, self.query, self.page_starts[-1], self.reports_per_page + 1)
+        self.has_next = len(reports) > self.reports_per_page
+        self.page_reports = reports[:self.reports_per_page]
+        self.previous_button.disabled = len(self.page_starts) == 1
+        self.next_button.disabled = not self.has_next
+
+    async def initialize_and_send(self, interaction: Interaction):
+        self.total = await asyncio.to_thread(archive.count_archived, self.query)
+        await self._load_page()
+        self.message = await interaction.followup.send(embed=self._create_embed(), view=self, ephemeral=True)
+
+    async def interaction_check(self, interaction: Interaction):
+        if interaction.user.id != self.author.id:
+            await interaction.response.send_message("You are not the requester of this interaction.", ephemeral=True)
+            return False
+        return True
+
+    @ui.button(label="◀", style=discord.ButtonStyle.blurple)
+    async def previous_button(self, interaction: Interaction, button: ui.Button):
+        if len(self.page_starts) > 1:
+            self.page_starts.pop()
+        await self._load_page()
+        await interaction.response.edit_message(embed=self._create_embed(), view=self)
+
+    @ui.button(label="▶", style=discord.ButtonStyle.blurple)
+    async def next_button(self, interaction: Interaction, button: ui.Button):
+        if self.has_next and self.page_reports:
+            self.page_starts.append(self.page_reports[-1]["id"])
+        await self._load_page()
+        await interaction.response.edit_message(embed=self._create_embed(), view=self)
+
+    def _create_embed(self):
+        total_pages = max(1, (self.total + self.reports_per_page - 1) // self.reports_per_page)
+        embed = discord.Embed(
+            title="🗄️ Archived Bug Reports",
+            description=f"Page {len(self.page_starts)}/{total_pages} ({self.total} archived reports)",
+            color=discord.Color.dark_grey()
+        )
+        if not self.page_reports:
+            embed.description += "\nNo archived reports match these filters."
+        for report in self.page_reports:
+            embed.add_field(
+                name=f"#{report.get('id', 'N/A')} - {report.get('title', 'N/A')}",
+                value=(
+                    f"**Status:** {report.get('status', 'N/A').capitalize()}\n"
+                    f"**Severity:** {report.get('severity', 'N/A').capitalize()}\n"
+                    f"**Category:** {report.get('category', 'N/A').capitalize()}\n"
+                    f"**Reporter:** <@{report.get('reporterID', 'N/A')}>\n"
+                    f"**Reported At:** {report.get('reportedAt', 'N/A')}\n"
+                    f"**Description:** {report.get('description', '')[:200]}{'...' if len(report.get('description', '')) > 200 else ''}"
+                ),
+                inline=False
+            )
+        return embed
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if hasattr(self, 'message'):
+            await self.message.edit(view=self)
+
 class BugListPaginationView(ui.View):
     def __init__(self, bot: commands.Bot, manager, author: discord.User):
         super().__init__(timeout=300)
@@ -973,10 +1986,14 @@ class BugListPaginationView(ui.View):
             discord.SelectOption(label="Sort by Date (Descending)", value="date_descending"),
             discord.SelectOption(label="Sort by Severity (High to Low)", value="severity_high"),
             discord.SelectOption(label="Sort by Severity (Low to High)", value="severity_low"),
+            discord.SelectOption(label="Sort by Priority (Review Queue)", value="priority"),
         ]
 
-        # Initialize reports and total_pages
-        self.reports = []  # ← temporary until loaded async
+        # Only the page on screen is held; the cursors are the sort keys of its first and last report
+        self.page_reports = []
+        self.first_cursor = None
+        self.last_cursor = None
+        self.total_reports = 0
         self.total_pages = 1
 
         self._add_navigation_buttons()  # Add buttons initially
@@ -1057,14 +2074,8 @@ class BugListPaginationView(ui.View):
             elif selected_value.startswith("sort_"):
                 self.parent_view.current_sort_by = selected_value.replace("sort_", "")
 
-            # Re-filter and re-sort reports 
-            self.parent_view.reports = await self.parent_view.manager.get_filtered_and_sorted_reports(
-                self.parent_view.current_category_filter,
-                self.parent_view.current_status_filter,
-                self.parent_view.current_sort_by
-            )
-            self.parent_view.current_page = 0
-            self.parent_view.total_pages = max(1, (len(self.parent_view.reports) + self.parent_view.reports_per_page - 1) // self.parent_view.reports_per_page)
+            # Start over from the first page of the new filter/sort
+            await self.parent_view._load_page(0)
             
             self.parent_view._refresh_select_menu() # Re-add select menu with updated default
             await self.parent_view._send_current_page(interaction)
@@ -1078,15 +2089,41 @@ class BugListPaginationView(ui.View):
         self.add_item(self.SortSelect(self))
 
 
-    async def initialize_and_send(self, interaction: Interaction):
-        # Always re-fetch reports and calculate total_pages before initial send
-        self.reports = await self.manager.get_filtered_and_sorted_reports(
-            self.current_category_filter,
-            self.current_status_filter, # Pass status filter 
-            self.current_sort_by
+    def _query(self) -> dict:
+        query = {}
+        if self.current_category_filter != "all":
+            query["category"] = self.current_category_filter
+        if self.current_status_filter != "all":
+            query["status"] = self.current_status_filter
+        return query
+
+    async def _load_page(self, page: int, after: dict = None, before: dict = None, from_end: bool = False):
+        """
+        Fetches one page straight from storage, seeking from a cursor instead of skipping, so the last page
+        costs the same as the first. The total is re-counted each time so the page count follows new reports.
+        """
+        sort = BUGLIST_SORTS.get(self.current_sort_by, BUGLIST_SORTS["id_ascending"])
+        query = self._query()
+        self.total_reports = await asyncio.to_thread(count_data, archive.HOT_COLLECTION, query)
+        self.total_pages = max(1, (self.total_reports + self.reports_per_page - 1) // self.reports_per_page)
+        # The last page holds the remainder, so pages line up with the numbering whichever end they were reached from
+        limit = self.total_reports - (self.total_pages - 1) * self.reports_per_page if from_end else self.reports_per_page
+        page_reports = await asyncio.to_thread(
+            fetch_page, archive.HOT_COLLECTION, query, sort, max(1, limit),
+            after=after, before=before, from_end=from_end,
         )
-        self.total_pages = max(1, (len(self.reports) + self.reports_per_page - 1) // self.reports_per_page)
-        self.current_page = 0 # Ensure we always start on the first page
+
+        if not page_reports and (after is not None or before is not None):
+            # Reports were closed or archived under the cursor; fall back to the nearest end
+            return await self._load_page(self.total_pages - 1, from_end=True) if after is not None else await self._load_page(0)
+
+        self.page_reports = page_reports
+        self.current_page = max(0, min(page, self.total_pages - 1))
+        self.first_cursor = sort_cursor(page_reports[0], sort) if page_reports else None
+        self.last_cursor = sort_cursor(page_reports[-1], sort) if page_reports else None
+
+    async def initialize_and_send(self, interaction: Interaction):
+        await self._load_page(0) # Always start on the first page
 
         self._add_navigation_buttons()  # Re-add navigation buttons to ensure their presence and correct callbacks
         self._refresh_select_menu()     # Re-add the select menu with updated defaults
@@ -1100,14 +2137,6 @@ class BugListPaginationView(ui.View):
         )
 
     async def _send_current_page(self, interaction: Interaction):
-        # Always re-fetch reports and calculate total_pages before sending updated page
-        self.reports = await self.manager.get_filtered_and_sorted_reports(
-            self.current_category_filter, 
-            self.current_status_filter, # Pass status filter 
-            self.current_sort_by
-        )
-        self.total_pages = max(1, (len(self.reports) + self.reports_per_page - 1) // self.reports_per_page)
-        
         self._add_navigation_buttons() # Re-add buttons on every page change
         self._update_buttons()         # Update button states after page change
         embed = self._create_bug_list_embed()
@@ -1133,34 +2162,38 @@ class BugListPaginationView(ui.View):
         if interaction.user.id != self.author.id:
             await interaction.response.send_message("You are not the requester of this interaction.", ephemeral=True)
             return
-        self.current_page = 0
+        await self._load_page(0)
         await self._send_current_page(interaction)
 
     async def previous_button_callback(self, interaction: Interaction):
         if interaction.user.id != self.author.id:
             await interaction.response.send_message("You are not the requester of this interaction.", ephemeral=True)
             return
-        self.current_page = max(0, self.current_page - 1)
+        if self.current_page <= 1 or self.first_cursor is None:
+            await self._load_page(0)
+        else:
+            await self._load_page(self.current_page - 1, before=self.first_cursor)
         await self._send_current_page(interaction)
 
     async def next_button_callback(self, interaction: Interaction):
         if interaction.user.id != self.author.id:
             await interaction.response.send_message("You are not the requester of this interaction.", ephemeral=True)
             return
-        self.current_page = min(self.total_pages - 1, self.current_page + 1)
+        if self.last_cursor is None:
+            await self._load_page(0)
+        else:
+            await self._load_page(self.current_page + 1, after=self.last_cursor)
         await self._send_current_page(interaction)
 
     async def last_page_button_callback(self, interaction: Interaction):
         if interaction.user.id != self.author.id:
             await interaction.response.send_message("You are not the requester of this interaction.", ephemeral=True)
             return
-        self.current_page = self.total_pages - 1
+        await self._load_page(self.total_pages - 1, from_end=True)
         await self._send_current_page(interaction)
 
     def _create_bug_list_embed(self):
-        start_index = self.current_page * self.reports_per_page
-        end_index = start_index + self.reports_per_page
-        page_reports = self.reports[start_index:end_index]
+        page_reports = self.page_reports
 
         embed = discord.Embed(
             title="🐞 Bug Reports",
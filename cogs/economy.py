@@ -3,8 +3,9 @@ import discord
 import asyncio
 from discord.ext import commands
 from discord import app_commands, Interaction, ui, Embed
-from utils.loader import load_data, save_data
-from utils.commands import get_admin_info
+from utils.loader import load_data, update_data, delete_data, increment_many
+from utils.permissions import admin_only
+from utils import archive
 
 
 class LeaderboardView(ui.View):
@@ -31,7 +32,6 @@ class LeaderboardView(ui.View):
 
 class Economy(commands.Cog):
     def __init__(self, bot):
-        self.data = load_data("economy")
         self.bot = bot
 
     async def get_balance(self, user_id):
@@ -39,42 +39,29 @@ class Economy(commands.Cog):
         data = {entry["id"]: entry["balance"] for entry in data_list}
         return data.get(str(user_id), 0)
 
+    # Every balance write is a single atomic update of the user's own document, so concurrent
+    # approvals, purchases and admin commands can never overwrite each other
     async def _add_points_to_data(self, user_id, amount):
-        data_list = await asyncio.to_thread(load_data, "economy")
-        data = {entry["id"]: entry["balance"] for entry in data_list}
+        document = await asyncio.to_thread(update_data, "economy", {"id": str(user_id)}, {"$inc": {"balance": amount}})
+        return document.get("balance", 0) if document else 0
 
-        uid = str(user_id)
-        data[uid] = data.get(uid, 0) + amount
-
-        updated = [{"id": k, "balance": v} for k, v in data.items()]
-        await asyncio.to_thread(save_data, "economy", updated)
-        return data[uid]
+    async def _add_points_bulk(self, amounts: dict):
+        """
+        Adds points to many users in one bulk write. `amounts` maps user ID to the points to add.
+        """
+        updates = [({"id": str(user_id)}, {"balance": amount}) for user_id, amount in amounts.items() if amount]
+        await asyncio.to_thread(increment_many, "economy", updates)
 
 
     async def _remove_points_from_data(self, user_id, amount):
-        data_list = await asyncio.to_thread(load_data, "economy")
-        data = {entry["id"]: entry["balance"] for entry in data_list}
-
-        uid = str(user_id)
-        current = data.get(uid, 0)
-        new_balance = max(current - amount, 0)
-        data[uid] = new_balance
-
-        updated = [{"id": k, "balance": v} for k, v in data.items()]
-        await asyncio.to_thread(save_data, "economy", updated)
-        return new_balance
+        # Update pipeline, so the balance is floored at 0 in the same atomic write
+        floored = [{"$set": {"balance": {"$max": [{"$subtract": [{"$ifNull": ["$balance", 0]}, amount]}, 0]}}}]
+        document = await asyncio.to_thread(update_data, "economy", {"id": str(user_id)}, floored)
+        return document.get("balance", 0) if document else 0
 
 
     async def _reset_balance_in_data(self, user_id):
-        data_list = await asyncio.to_thread(load_data, "economy")
-        data = {entry["id"]: entry["balance"] for entry in data_list}
-
-        uid = str(user_id)
-        if uid in data:
-            del data[uid]
-
-        updated = [{"id": k, "balance": v} for k, v in data.items()]
-        await asyncio.to_thread(save_data, "economy", updated)
+        await asyncio.to_thread(delete_data, "economy", {"id": str(user_id)})
 
     async def get_userstats(self, user_id):
         data_list = await asyncio.to_thread(load_data, "btdb")
@@ -100,15 +87,6 @@ class Economy(commands.Cog):
     async def on_ready(self):
         print("--- Economy cog is ready! ---")
 
-    def is_admin():
-        async def predicate(interaction: discord.Interaction) -> bool:
-            if get_admin_info(interaction.user.id):
-                return True
-            else:
-                await interaction.response.send_message("❌ Only admins can use this command.", ephemeral=True)
-                return False
-        return app_commands.check(predicate)
-
     @app_commands.command(name="balance", description="Check your current balance.")
     async def balance(self, interaction: Interaction):
         user_id = interaction.user.id
@@ -123,16 +101,15 @@ class Economy(commands.Cog):
         await interaction.response.defer()
 
         balance = await self.get_balance(user.id)
-        all_reports = await asyncio.to_thread(load_data, "bugrep")
-        user_id = str(user.id)
+        # Only this user's reports, from both the hot and the archive collection
+        user_reports = await asyncio.to_thread(archive.reports_by_reporter, user.id)
 
         stats = {"approved": 0, "fixed": 0, "pending": 0, "declined": 0}
 
-        for report in all_reports:
-            if report.get("reporterID") == user_id:
-                status = report.get("status", "pending").lower()
-                if status in stats:
-                    stats[status] += 1
+        for report in user_reports:
+            status = report.get("status", "pending").lower()
+            if status in stats:
+                stats[status] += 1
 
         total = sum(stats.values())
 
@@ -158,7 +135,7 @@ class Economy(commands.Cog):
     points_group = app_commands.Group(name="points", description="Commands for managing user points.")
 
     @points_group.command(name="add", description="Add points to a user.")
-    @is_admin()
+    @admin_only("❌ Only admins can use this command.")
     @app_commands.describe(user="The user to add points to", value="Amount of points to add")
     async def add_points(self, interaction: Interaction, user: discord.User, value: int):
         # Call the renamed internal method to add points
@@ -174,7 +151,7 @@ class Economy(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     @points_group.command(name="remove", description="Remove points from a user.")
-    @is_admin()
+    @admin_only("❌ Only admins can use this command.")
     @app_commands.describe(user="The user to remove points from", value="Amount of points to remove")
     async def remove_points(self, interaction: Interaction, user: discord.User, value: int):
         # Call the renamed internal method to remove points
@@ -190,7 +167,7 @@ class Economy(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     @points_group.command(name="reset", description="Reset a user's balance to 0")
-    @is_admin()
+    @admin_only("❌ Only admins can use this command.")
     @app_commands.describe(user="The user to reset points for")
     async def reset_points(self, interaction: Interaction, user: discord.User):
         embed = discord.Embed(
@@ -234,13 +211,8 @@ class Economy(commands.Cog):
                 pages.append(embed)
 
         elif choice.value == "bugs":
-            bug_data = await asyncio.to_thread(load_data, "bugrep")
-            bug_counts = {}
-
-            for report in bug_data:
-                uid = report.get("reporterID")
-                if uid:
-                    bug_counts[uid] = bug_counts.get(uid, 0) + 1
+            # Streams both the hot and the archive collection, keeping only the per-user counts
+            bug_counts = await asyncio.to_thread(archive.report_counts_by_reporter)
 
             sorted_bugs = sorted(bug_counts.items(), key=lambda x: x[1], reverse=True)
 
@@ -2,14 +2,19 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands, Interaction, Embed
 import os
-import asyncio
+import time
 from dotenv import load_dotenv
-from utils.loader import load_data, save_data
 from datetime import datetime, timezone
-from utils.commands import GROUPS, COMMANDS_REFERENCE, get_admin_info
+from utils.permissions import permissions, admin_only
+from utils.outbound import PRIORITY_INTERACTION
+from utils.membership import MembershipSync, RECONCILE_INTERVAL_MINUTES, SYNC_STATES, MAX_BULK_MODIFY_ENTRIES, parse_status_list
+from utils.rolelog import RoleLogAggregator
+from utils.commandsync import sync_commands
 
 
 ABSENCE_ROLE_ID = int(os.getenv("ABSENCE_ROLE_ID"))
+BULK_MODIFY_MAX_BYTES = 512 * 1024  # Largest /bulkmodify upload accepted
+MAX_ABSENCE_DAYS = 90
 
 
 EMBED_CONTENTS = {
@@ -81,16 +86,14 @@ class CogReloadSelect(discord.ui.Select):
                          max_values=1)
 
     async def callback(self, interaction: discord.Interaction):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
+        if not await permissions.check_admin(interaction):
             return
-         
 
         selected_cog = self.values[0]
         try:
             await self.bot.reload_extension(selected_cog)
+            # The fresh cog instance loads its state again; its interactions wait for it meanwhile
+            self.bot.warmup.start([cog for cog in self.bot.cogs.values() if cog.__module__ == selected_cog])
             await interaction.response.edit_message(
                 content=f"✅ Reloaded `{selected_cog}` successfully.",
                 view=None)
@@ -111,17 +114,36 @@ class misc(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.bt_listener.start()
+        # btdb changes are applied as they happen; the reconcile loop is only a slow safety net
+        # ROLE UPDATE lines are batched so a verification wave does not flood the log channel
+        self.role_log = RoleLogAggregator(bot, int(os.getenv("MEM_BOT_LOG_CHANNEL_ID", "0")) or None)
+        self.membership = MembershipSync(bot, self.role_log)
+        self.btdb_reconcile.start()
+        bot.timers.register("absence", self.end_absence)
+
+    async def cog_unload(self):
+        self.btdb_reconcile.cancel()
+        await self.membership.close()
+        await self.role_log.close()  # Bot.close() unloads cogs first, so this also flushes on shutdown
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.bot.member_lookup.member_joined(member.id)
+        self.membership.enqueue(member.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.bot.member_lookup.member_left(member.id)
+        permissions.invalidate(member.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            permissions.invalidate(after.id)
 
     @app_commands.command(name="reload", description="Reload a specific cog.")
+    @admin_only()
     async def reload_command(self, interaction: Interaction):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
-            return
-         
-
         await interaction.response.send_message(
             content="Please select a cog to reload:",
             view=CogReloadView(self.bot),
@@ -142,13 +164,8 @@ class misc(commands.Cog):
         # Add choices for any new embed types you add to EMBED_CONTENTS
         # app_commands.Choice(name="Another Embed", value="anotherembed")
     ])
+    @admin_only()
     async def sendembed(self, interaction: discord.Interaction, embed_type: app_commands.Choice[str], channel: discord.TextChannel):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
-            return
-
         # Get embed data from the dictionary
         embed_info = EMBED_CONTENTS.get(embed_type.value)
 
@@ -175,7 +192,7 @@ class misc(commands.Cog):
         if target_channel:
             try:
                 await interaction.response.defer(thinking=True)
-                await target_channel.send(embed=embed)
+                await self.bot.outbound.send(target_channel, embed=embed, priority=PRIORITY_INTERACTION)
                 await interaction.followup.send(f"✅ `{embed_type.name}` sent successfully to {target_channel.mention}.", ephemeral=True)
 
             except discord.Forbidden:
@@ -188,14 +205,16 @@ class misc(commands.Cog):
 
     @app_commands.command(name="absence",
                           description="Give or remove the absence role")
-    @app_commands.describe(option="Choose to get or remove the absence role")
+    @app_commands.describe(option="Choose to get or remove the absence role",
+                           duration="Days until the absence role is removed automatically (get only)")
     @app_commands.choices(option=[
         app_commands.Choice(name="Gives you the absence role", value="get"),
         app_commands.Choice(name="Removes the absence role from you",
                             value="remove")
     ])
     async def absence(self, interaction: Interaction,
-                      option: app_commands.Choice[str]):
+                      option: app_commands.Choice[str],
+                      duration: app_commands.Range[int, 1, MAX_ABSENCE_DAYS] = None):
         role = interaction.guild.get_role(ABSENCE_ROLE_ID)
         if not role:
             await interaction.response.send_message(
@@ -203,40 +222,69 @@ class misc(commands.Cog):
             return
 
         member = interaction.user
+        timer_id = f"absence:{interaction.guild.id}:{member.id}"
+        # Role changes wait in the outbound queue and timers write to storage, so answer Discord first
+        await interaction.response.defer(ephemeral=True)
 
         if option.value == "get":
+            ends_at = time.time() + duration * 86400 if duration else None
             if role in member.roles:
-                await interaction.response.send_message(
-                    "⚠️ You already have the absence role.", ephemeral=True)
+                if ends_at:
+                    await self.schedule_absence_end(timer_id, interaction.guild.id, member.id, ends_at)
+                    await interaction.followup.send(
+                        f"✅ Your absence now ends <t:{int(ends_at)}:R>.", ephemeral=True)
+                elif await self.bot.timers.cancel(timer_id):
+                    # Asking again without a duration makes a timed absence open-ended
+                    await interaction.followup.send(
+                        "✅ Your absence no longer has an end date.", ephemeral=True)
+                else:
+                    await interaction.followup.send(
+                        "⚠️ You already have the absence role.", ephemeral=True)
             else:
-                await member.add_roles(role,
-                                       reason="User requested absence role.")
-                await interaction.response.send_message(
-                    "✅ Absence role has been given.", ephemeral=True)
+                await self.bot.outbound.add_roles(member, role,
+                                                  reason="User requested absence role.",
+                                                  priority=PRIORITY_INTERACTION)
+                if ends_at:
+                    await self.schedule_absence_end(timer_id, interaction.guild.id, member.id, ends_at)
+                    await interaction.followup.send(
+                        f"✅ Absence role has been given. It will be removed <t:{int(ends_at)}:R>.", ephemeral=True)
+                else:
+                    # A timer left over from an earlier absence must not end this one
+                    await self.bot.timers.cancel(timer_id)
+                    await interaction.followup.send(
+                        "✅ Absence role has been given.", ephemeral=True)
 
         elif option.value == "remove":
+            await self.bot.timers.cancel(timer_id)
             if role not in member.roles:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "⚠️ You don't have the absence role.", ephemeral=True)
             else:
-                await member.remove_roles(role,
-                                          reason="User removed absence role.")
-                await interaction.response.send_message(
+                await self.bot.outbound.remove_roles(member, role,
+                                                     reason="User removed absence role.",
+                                                     priority=PRIORITY_INTERACTION)
+                await interaction.followup.send(
                     "✅ Absence role has been removed.", ephemeral=True)
 
+    async def schedule_absence_end(self, timer_id: str, guild_id: int, user_id: int, ends_at: float):
+        await self.bot.timers.schedule(timer_id, "absence", ends_at, {"guild_id": guild_id, "user_id": user_id})
+
+    async def end_absence(self, timer: dict):
+        """Timer handler: takes the absence role back once the requested duration is over."""
+        guild = self.bot.get_guild(timer["payload"]["guild_id"])
+        if not guild:
+            return
+        role = guild.get_role(ABSENCE_ROLE_ID)
+        member = await self.bot.member_lookup.get(guild, timer["payload"]["user_id"])
+        if role and member and role in member.roles:
+            # Errors propagate so the scheduler retries the timer
+            await self.bot.outbound.remove_roles(member, role, reason="Absence duration ended.")
+
     @app_commands.command(
         name="help", description="Shows a list of commands available to you")
     async def help(self, interaction: Interaction):
-        user_role_ids = [role.id for role in interaction.user.roles]
-
-        # Filter commands based on user's role access
-        visible_commands = []
-        for cmd in COMMANDS_REFERENCE:
-            required_role_id = GROUPS.get(cmd["group"].lower())
-            if required_role_id in user_role_ids or required_role_id == GROUPS[
-                    "none"]:
-                visible_commands.append(
-                    f"• **/{cmd['name']}** — {cmd['description']}")
+        # Built once per combination of groups and cached by the permission service
+        visible_commands = permissions.help_lines(interaction.user)
 
         if not visible_commands:
             await interaction.response.send_message(
@@ -247,6 +295,60 @@ class misc(commands.Cog):
         await interaction.response.send_message(help_text, ephemeral=True)
 
 
+    @app_commands.command(name="queuestats", description="Shows outbound queue wait times and throughput (Admin only).")
+    @admin_only()
+    async def queuestats(self, interaction: Interaction):
+        metrics = self.bot.outbound.metrics()
+        embed = Embed(title="📬 Outbound Queue", color=discord.Color.blurple())
+        embed.add_field(name="Queued", value=f"`{metrics['queued']}`", inline=True)
+        embed.add_field(name="Workers", value=f"`{metrics['workers']}`", inline=True)
+        embed.add_field(name="Throughput", value=f"`{metrics['throughput_per_second']:.2f}/s`", inline=True)
+
+        wait_lines = [
+            f"**{priority}:** avg `{stats['average_seconds']:.2f}s`, max `{stats['max_seconds']:.2f}s` over `{stats['jobs']}` jobs"
+            for priority, stats in metrics["wait"].items()
+        ]
+        embed.add_field(name="Queue Wait", value="\n".join(wait_lines) or "No jobs yet.", inline=False)
+
+        route_lines = [
+            f"**{route}:** `{count}` done, `{metrics['failed'].get(route, 0)}` failed"
+            for route, count in sorted(metrics["completed"].items())
+        ]
+        embed.add_field(name="Routes", value="\n".join(route_lines) or "No jobs yet.", inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="synccommands", description="Pushes the slash commands to Discord (Admin only).")
+    @app_commands.describe(force="Sync even if no command changed since the last sync")
+    @admin_only()
+    async def synccommands(self, interaction: Interaction, force: bool = False):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            synced = await sync_commands(self.bot, force=force)
+        except Exception as e:
+            await interaction.followup.send(f"❌ Failed to sync commands: ```{e}```", ephemeral=True)
+            return
+        if synced is None:
+            await interaction.followup.send("✅ Commands are unchanged since the last sync. Use `force` to sync anyway.", ephemeral=True)
+        else:
+            await interaction.followup.send(f"✅ Synced {len(synced)} command(s).", ephemeral=True)
+
+    @app_commands.command(name="syncstatus", description="Shows progress of the tester role sync (Admin only).")
+    @admin_only()
+    async def syncstatus(self, interaction: Interaction):
+        progress = self.membership.progress()
+        if not progress["total"]:
+            await interaction.response.send_message("✅ No role sync has run since the bot started.", ephemeral=True)
+            return
+
+        finished = progress["states"]["done"] + progress["states"]["failed"]
+        title = "🔄 Role Sync In Progress" if self.membership.active() else "✅ Role Sync Finished"
+        embed = Embed(title=title, description=f"`{finished}/{progress['total']}` members handled in `{progress['elapsed_seconds']:.1f}s`", color=discord.Color.blurple())
+        for state in SYNC_STATES:
+            embed.add_field(name=state.capitalize(), value=f"`{progress['states'][state]}`", inline=True)
+        embed.add_field(name="Retries", value=f"`{progress['retries']}`", inline=True)
+        embed.add_field(name="Workers", value=f"`{progress['workers']}`", inline=True)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(
         name="modify",
         description="Modify a user by ID (verified / unverified)")
@@ -256,103 +358,83 @@ class misc(commands.Cog):
         app_commands.Choice(name="verified", value="verified"),
         app_commands.Choice(name="unverified", value="unverified")
     ])
+    @admin_only()
     async def modify_slash(self, interaction: Interaction, user_id: str,
                            status: app_commands.Choice[str]):
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
-            return
-         
-
         status_value = status.value
 
-        # Load current btdb
-        data_list = load_data("btdb")
-        data = {entry["id"]: entry for entry in data_list}
-
-        # Modify the entry
-        data[user_id] = {"id": user_id, "status": status_value}
-
-        # Save updated data
-        save_data("btdb", list(data.values()))
+        # Only this entry is written, and the member is checked straight away
+        await self.membership.set_status(user_id, status_value)
+        # Logged with the next batch, ahead of the role change it triggers
+        self.role_log.log(f"Marked <@{user_id}> as `{status_value}` in DB.", discord.Color.orange())
 
         await interaction.response.send_message(
             f"✅ `{user_id}` marked as `{status_value}`.", ephemeral=True)
 
-        # Send log to log channel
-        log_channel_id = int(os.getenv("MEM_BOT_LOG_CHANNEL_ID"))
-        channel = self.bot.get_channel(log_channel_id)
-        if channel:
-            embed = Embed(title="ROLE UPDATE:",
-                          description=f"Marked <@{user_id}> as `{status_value}` in DB.",
-                          color=discord.Color.orange())
-            await channel.send(embed=embed)
-
-    @tasks.loop(seconds=5)
-    async def bt_listener(self):
-        guild = discord.utils.get(self.bot.guilds)
-        if not guild:
+    @app_commands.command(
+        name="bulkmodify",
+        description="Mark many users verified / unverified from a CSV or list of IDs")
+    @app_commands.describe(file="CSV or text file with one `user_id,status` per line",
+                           default_status="Status for lines that only have a user ID")
+    @app_commands.choices(default_status=[
+        app_commands.Choice(name="verified", value="verified"),
+        app_commands.Choice(name="unverified", value="unverified")
+    ])
+    @admin_only()
+    async def bulk_modify(self, interaction: Interaction, file: discord.Attachment,
+                          default_status: app_commands.Choice[str] = None):
+        if file.size > BULK_MODIFY_MAX_BYTES:
+            await interaction.response.send_message(f"❌ The file is too large (max {BULK_MODIFY_MAX_BYTES // 1024} KB).", ephemeral=True)
             return
 
-        data_list = load_data("btdb")
-        data = {entry["id"]: entry for entry in data_list}
-
-        updated = False
-        log_channel_id = int(os.getenv("MEM_BOT_LOG_CHANNEL_ID"))
-        log_channel = self.bot.get_channel(log_channel_id)
-
-        verified_role = guild.get_role(int(os.getenv("BT_ROLE_ID")))
-
-        # Make a copy for updates
-        new_data = data.copy()
-
-        for user_id, info in data.items():
-            member = guild.get_member(int(user_id))  # Check cache first
-
-            if member is None:
-                try:
-                    member = await guild.fetch_member(int(user_id))
-                    await asyncio.sleep(1)  # Sleep after API hit
-                except discord.HTTPException as e:
-                    continue
-
-            status = info.get("status")
+        await interaction.response.defer(ephemeral=True)
+        try:
+            text = (await file.read()).decode("utf-8-sig")
+        except (discord.HTTPException, UnicodeDecodeError) as e:
+            await interaction.followup.send(f"❌ Could not read `{file.filename}`: {e}", ephemeral=True)
+            return
 
-            try:
-                if status == "verified" and verified_role and verified_role not in member.roles:
-                    await member.add_roles(verified_role, reason="Auto-verified from DB")
-                    updated = True
-                    if log_channel:
-                        await log_channel.send(embed=Embed(
-                            title="ROLE UPDATE:",
-                            description=f"Gave verified role to <@{user_id}>",
-                            color=discord.Color.green()))
-
-                elif status == "unverified":
-                    await member.kick(reason="Marked as unverified")
-                    new_data.pop(user_id, None)
-                    updated = True
-                    if log_channel:
-                        await log_channel.send(embed=Embed(
-                            title="ROLE UPDATE:",
-                            description=f"Kicked unverified user <@{user_id}>",
-                            color=discord.Color.dark_gray()))
-            except discord.Forbidden:
-                print(f"[WARN] Missing permissions to modify {user_id}")
-                continue
+        statuses, errors = parse_status_list(text, default_status.value if default_status else None)
+        if len(statuses) > MAX_BULK_MODIFY_ENTRIES:
+            await interaction.followup.send(f"❌ Too many users ({len(statuses)}); the limit is {MAX_BULK_MODIFY_ENTRIES} per file.", ephemeral=True)
+            return
 
-            await asyncio.sleep(1)  # Space out actions to reduce risk of rate limit
+        counts = {status: list(statuses.values()).count(status) for status in ("verified", "unverified")}
+        if statuses:
+            # One bulk upsert, then every member is queued for the sync workers together
+            await self.membership.set_statuses(statuses)
+            self.role_log.log(f"Bulk import by <@{interaction.user.id}>: marked `{counts['verified']}` users as `verified` "
+                              f"and `{counts['unverified']}` as `unverified` in DB.", discord.Color.orange())
+
+        embed = Embed(title="📥 Bulk Modify", color=discord.Color.green() if statuses and not errors else discord.Color.orange())
+        embed.add_field(name="Updated", value=f"`{len(statuses)}`", inline=True)
+        for status in ("verified", "unverified"):
+            embed.add_field(name=status.capitalize(), value=f"`{counts[status]}`", inline=True)
+        if errors:
+            error_lines = [f"Line {line_number}: {problem}" for line_number, problem in errors[:10]]
+            if len(errors) > 10:
+                error_lines.append(f"...and {len(errors) - 10} more")
+            embed.add_field(name=f"Skipped ({len(errors)})", value="\n".join(error_lines), inline=False)
+        if statuses:
+            embed.set_footer(text="Role changes are being applied; see /syncstatus for progress.")
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @tasks.loop(minutes=RECONCILE_INTERVAL_MINUTES)
+    async def btdb_reconcile(self):
+        try:
+            await self.membership.reconcile()
+        except Exception as e:
+            print(f"[ERROR] btdb reconciliation failed: {e}")
 
-        if updated:
+    @btdb_reconcile.before_loop
+    async def before_btdb_reconcile(self):
+        await self.bot.wait_until_ready()
+        # Fill the member cache before the first sweep so it resolves members without any API calls
+        for guild in self.bot.guilds:
             try:
-                save_data("btdb", list(new_data.values()))
+                await self.bot.member_lookup.warm_up(guild)
             except Exception as e:
-                print(f"[ERROR] Failed to save btdb: {e}")
-
-    @bt_listener.before_loop
-    async def before_bt_listener(self):
-        await self.bot.wait_until_ready()
+                print(f"[WARN] Could not cache members of {guild.name}: {e}")
 
 
 async def setup(bot):
@@ -3,8 +3,9 @@ import asyncio
 from discord.ext import commands
 from discord import app_commands, ui
 from cogs.economy import Economy
-from utils.commands import get_group_role_id, get_admin_info
+from utils.permissions import permissions, admin_only
 from utils.loader import load_data
+from utils.outbound import PRIORITY_INTERACTION
 import os
 from dotenv import load_dotenv
 
@@ -93,7 +94,7 @@ class UsernameModal(discord.ui.Modal, title="Fakepixel Beta Tester Store"):
                     )
                     embed.set_thumbnail(url=interaction_modal.user.avatar.url if interaction_modal.user.avatar else None)
                     embed.set_footer(text=f"User ID: {self.user_id}")
-                    await receipt_channel.send(embed=embed)
+                    await self.bot.outbound.send(receipt_channel, embed=embed, priority=PRIORITY_INTERACTION)
         else:
             # If not enough points, edit the original message to reflect that
             await self.interaction_original.edit_original_response(
@@ -329,12 +330,7 @@ class MainGUIButtons(ui.View):
         self.bot = bot
 
     def has_access(self, member: discord.Member) -> bool:
-        allowed_roles = {
-            get_group_role_id("admin"),
-            get_group_role_id("beta tester"),
-            get_group_role_id("verified")
-        }
-        return any(role.id in allowed_roles for role in member.roles if isinstance(role.id, int))
+        return permissions.in_group(member, "admin", "beta tester", "verified")
 
     @ui.button(label="Check the Shop", style=discord.ButtonStyle.blurple, custom_id="main_gui_check_shop")
     async def check_shop_button(self, interaction: discord.Interaction, button: ui.Button):
@@ -380,18 +376,8 @@ class shop(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    async def is_admin(interaction: discord.Interaction) -> bool:
-        is_hardcoded_admin = get_admin_info(interaction.user.id)
-        member = interaction.guild.get_member(interaction.user.id)
-
-        if not member or not is_hardcoded_admin:
-            await interaction.response.send_message("❌ You don't have permission to use this.", ephemeral=True)
-            return False
-
-        return True
-
     @app_commands.command(name="setup", description="Open the main GUI interface.")
-    @app_commands.check(is_admin) # Apply the check directly
+    @admin_only()
     async def setup_gui(self, interaction: discord.Interaction):
         embed = discord.Embed(
             title="Beta Tester Shop",
@@ -2,40 +2,44 @@ import discord
 from dotenv import load_dotenv
 from discord.ext import commands
 import os
-from flask import Flask
-from threading import Thread
 from discord import Interaction
 import asyncio
 from utils.loader import _initialize_mongo_connection, close_mongo_connection, load_data, save_data
-
-app = Flask('')
-
-
-@app.route('/', methods=['GET', 'HEAD'])
-def home():
-    print("⚡ Ping received on / route")
-    return "This is a keep-alive server.", 200
-
-
-def run():
-    port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port)
-
-
-def keep_alive():
-    t = Thread(target=run)
-    t.start()
-    print("Keep-alive server is running.")
+from utils.outbound import OutboundScheduler
+from utils.members import MemberLookup
+from utils.timers import TimerScheduler
+from utils.commandsync import sync_commands
+from utils.warmup import WarmUp
+from utils.health import HealthServer
 
 
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
-keep_alive()
 intents = discord.Intents.default()
 intents.members = True
 intents.message_content = True
 
-bot = commands.Bot(command_prefix="/", intents=intents)
+
+class Bot(commands.Bot):
+    async def close(self):
+        # Stop the background services first so pending work fails fast instead of hanging on a closed session
+        await self.health.close()
+        await self.timers.close()
+        await self.outbound.close()
+        await super().close()
+
+
+bot = Bot(command_prefix="/", intents=intents)
+# Every cog sends, edits, deletes and changes roles through this shared, rate-limit-aware queue
+bot.outbound = OutboundScheduler()
+# Shared member cache lookups with batched gateway queries for misses
+bot.member_lookup = MemberLookup()
+# Persistent delayed actions (absence expiry, ...); cogs register a handler per timer kind
+bot.timers = TimerScheduler()
+# Loads cog state concurrently after startup; interactions wait for the cog they need
+bot.warmup = WarmUp()
+# /healthz, /readyz and /metrics, served from the bot's own event loop
+bot.health = HealthServer(bot)
 
 
 # --- Async Wrappers for loader functions (can be defined here or in a common utils file) ---
@@ -51,10 +55,16 @@ async def async_save_data(name: str, data):
 
 
 @bot.event
-async def on_ready():
+async def setup_hook():
+    # Runs once after login and before the gateway connects, so none of this repeats on reconnects
+    try:
+        await bot.health.start()
+    except OSError as e:
+        print(f"❌ Failed to start the health server: {e}")
+
     print("Connecting to MongoDB and setting up cogs...")
     try:
-        _initialize_mongo_connection()
+        await asyncio.to_thread(_initialize_mongo_connection)
     except Exception as e:
         print(f"CRITICAL ERROR: Failed to connect to MongoDB on startup: {e}")
         await bot.close()
@@ -62,9 +72,6 @@ async def on_ready():
 
     from cogs.shop import MainGUIButtons
     bot.add_view(MainGUIButtons(bot))
-    activity = discord.Game(name="Beta Testers 👀")
-    await bot.change_presence(status=discord.Status.dnd, activity=activity)
-    print(f"🌐 Logged in as {bot.user} (ID: {bot.user.id})\n")
 
     # Loading cogs
     for cog_name in ['economy', 'shop', 'bugreports', 'misc']:
@@ -74,14 +81,32 @@ async def on_ready():
         except Exception as e:
             print(f"❌ Failed to load cogs.{cog_name}: {e}")
 
-    # Now sync commands
+    # Cog state loads in the background while the bot connects and syncs
+    bot.warmup.run_in_background(bot.cogs.values())
+
+    # After the cogs so every handler is registered before overdue timers fire
     try:
-        synced = await bot.tree.sync()
-        print(f"✅ Synced {len(synced)} command(s) from main on_ready.\n")
+        await bot.timers.load()
     except Exception as e:
-        print(f"❌ Failed to sync commands from main on_ready: {e}\n")
-    names = ", ".join(f"/{cmd.name}" for cmd in synced)
-    print(f"🔗 Synced: {names}")
+        print(f"❌ Failed to load pending timers: {e}")
+
+    # Only push commands when their signatures changed since the last sync (/synccommands forces one)
+    try:
+        synced = await sync_commands(bot)
+        if synced is None:
+            print("✅ Commands unchanged since the last sync; skipped syncing.\n")
+        else:
+            print(f"✅ Synced {len(synced)} command(s): {', '.join(f'/{cmd.name}' for cmd in synced)}\n")
+    except Exception as e:
+        print(f"❌ Failed to sync commands: {e}\n")
+
+
+@bot.event
+async def on_ready():
+    activity = discord.Game(name="Beta Testers 👀")
+    await bot.change_presence(status=discord.Status.dnd, activity=activity)
+    print(f"🌐 Logged in as {bot.user} (ID: {bot.user.id})\n")
+
     update_log_channel_id = os.getenv("UPDATE_LOG_CHANNEL_ID")
     if update_log_channel_id:
         try:
@@ -94,7 +119,7 @@ async def on_ready():
                 )
                 embed.set_footer(text=f"Updated by _Suspected_")
                 embed.timestamp = discord.utils.utcnow()
-                await update_channel.send(embed=embed)
+                await bot.outbound.send(update_channel, embed=embed)
         except Exception as e:
             print(f"❌ Failed to send startup message: {e}")
 
@@ -0,0 +1,119 @@
+import os
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from utils.loader import upsert_many, find_data, count_data, iter_data, text_search
+from utils.triage import parse_timestamp
+
+HOT_COLLECTION = "bugrep"
+ARCHIVE_COLLECTION = "bugrep_archive"
+# Every report lives in one of these: open and recently closed ones in the hot collection, the rest archived
+REPORT_COLLECTIONS = (HOT_COLLECTION, ARCHIVE_COLLECTION)
+
+CLOSED_STATUSES = ("fixed", "declined")
+# Every query on the archive seeks or filters on these: paging by ID (optionally per status), the
+# newest archived ID, and per-reporter lookups for /profile. The text index serves /bugsearch.
+ARCHIVE_INDEXES = [
+    [("id", -1)],
+    [("status", 1), ("id", -1)],
+    [("reporterID", 1)],
+    [("title", "text"), ("description", "text"), ("reproducesteps", "text")],
+]
+# Closed reports stay in the hot collection this many days after their last status change
+ARCHIVE_AFTER_DAYS = int(os.getenv("BUG_ARCHIVE_AFTER_DAYS", "30"))
+
+
+def closed_at(report: dict):
+    timestamp = parse_timestamp(report.get("statusChangedAt"))
+    if timestamp is None and report.get("reportedAt"):
+        timestamp = parse_timestamp(report["reportedAt"])
+    return timestamp
+
+
+def due_for_archive(reports, now: datetime = None, after_days: int = ARCHIVE_AFTER_DAYS) -> list:
+    """
+    The closed reports whose last status change is older than `after_days`.
+    """
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=after_days)
+    due = []
+    for report in reports:
+        if (report.get("status") or "pending").lower() not in CLOSED_STATUSES:
+            continue
+        changed = closed_at(report)
+        if changed is not None and changed <= cutoff:
+            due.append(report)
+    return due
+
+
+def archive_reports(reports: list):
+    """
+    Copies BugReport records into the archive collection. Blocking; run in a thread.
+    Upserts by ID, so re-running after an interrupted move is harmless.
+    """
+    upsert_many(ARCHIVE_COLLECTION, [report.to_document() for report in reports])
+
+
+def max_archived_id() -> int:
+    newest = find_data(ARCHIVE_COLLECTION, sort=[("id", -1)], limit=1)
+    return newest[0].get("id", 0) if newest else 0
+
+
+def archive_query(status: str = None, category: str = None, reporter_id: str = None) -> dict:
+    query = {}
+    if status:
+        query["status"] = status
+    if category:
+        query["category"] = category
+    if reporter_id:
+        query["reporterID"] = str(reporter_id)
+    return query
+
+
+def archived_page(query: dict, before_id: int = None, limit: int = 5) -> list:
+    """
+    One page of archived reports, newest first, starting below `before_id`.
+    Seeks on the report ID rather than skipping, so deep pages cost the same as the first.
+    """
+    if before_id is not None:
+        query = {**query, "id": {"$lt": before_id}}
+    return find_data(ARCHIVE_COLLECTION, query, sort=[("id", -1)], limit=limit)
+
+
+def search_archived(text: str, query: dict = None, from_key: int = None, to_key: int = None, limit: int = 10) -> list:
+    """
+    Archived reports matching `text` through the archive's text index, best match first. Blocking.
+    `from_key` / `to_key` bound the report date as inclusive date ordinals (the stored sortDate).
+    """
+    query = dict(query or {})
+    if from_key is not None or to_key is not None:
+        query["sortDate"] = {}
+        if from_key is not None:
+            query["sortDate"]["$gte"] = from_key
+        if to_key is not None:
+            query["sortDate"]["$lte"] = to_key
+    return text_search(ARCHIVE_COLLECTION, text, query, limit)
+
+
+def count_archived(query: dict = None) -> int:
+    return count_data(ARCHIVE_COLLECTION, query)
+
+
+def reports_by_reporter(reporter_id: str) -> list:
+    """
+    Every report filed by one user across the hot and archive collections. Blocking.
+    """
+    reports = []
+    for name in REPORT_COLLECTIONS:
+        reports.extend(find_data(name, {"reporterID": str(reporter_id)}))
+    return reports
+
+
+def report_counts_by_reporter() -> Counter:
+    """
+    Number of reports per reporter ID across both collections, streamed. Blocking.
+    """
+    counts = Counter()
+    for name in REPORT_COLLECTIONS:
+        for report in iter_data(name):
+            if report.get("reporterID"):
+                counts[report["reporterID"]] += 1
+    return counts
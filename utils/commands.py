@@ -43,11 +43,23 @@ COMMANDS_REFERENCE = [
     # bug reports commands
     { "name": "buglist", "description": "Gets list of all pending bugs", "group": "none" },
     { "name": "submitbug", "description": "Submits a bug ", "group": "none" },
+    { "name": "bugsearch", "description": "Search bug reports by keywords", "group": "none" },
+    { "name": "bugarchive", "description": "Browse archived (closed) bug reports", "group": "none" },
+    { "name": "nextbug", "description": "Hands you the highest priority pending bug report", "group": "admin" },
+    { "name": "bulktriage", "description": "Approve, decline or fix many bug reports at once", "group": "admin" },
+    { "name": "exportbugs", "description": "Export bug reports as a compressed CSV or NDJSON file", "group": "admin" },
+    { "name": "dumpstats", "description": "Shows bug report stats for a date range", "group": "admin" },
+    { "name": "rebuildstats", "description": "Regenerates the daily bug report stats", "group": "admin" },
+    { "name": "triagestats", "description": "Shows bug triage and fix latency percentiles", "group": "admin" },
     # misc commands
     { "name": "modify", "description": "Update Beta Tester's Data on the bot", "group": "admin" },
-    { "name": "absence", "description": "Give or remove the absence role", "group": "none" },
+    { "name": "bulkmodify", "description": "Update many Beta Testers' Data from a file", "group": "admin" },
+    { "name": "absence", "description": "Give or remove the absence role, optionally for a number of days", "group": "none" },
     { "name": "help", "description": "Shows a list of commands available to you", "group": "none" },
     { "name": "ping", "description": "Check the bot's latency", "group": "none" },
+    { "name": "queuestats", "description": "Shows outbound queue wait times and throughput", "group": "admin" },
+    { "name": "syncstatus", "description": "Shows progress of the tester role sync", "group": "admin" },
+    { "name": "synccommands", "description": "Pushes the slash commands to Discord if they changed (force to always sync)", "group": "admin" },
     { "name": "stop", "description": "Stops the bot", "group": "admin" },
     { "name": "update", "description": "Send the update log of bot", "group": "admin" },
 ]
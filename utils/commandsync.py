@@ -0,0 +1,46 @@
+import asyncio
+import hashlib
+import json
+import os
+
+# Local, untracked file holding the hash of the command tree last pushed to Discord
+SYNC_HASH_FILE = os.getenv("COMMAND_SYNC_HASH_FILE", ".command_sync_hash")
+
+
+def command_tree_hash(bot) -> str:
+    """
+    Hash of every registered global command's payload (names, descriptions, options, choices, permissions)
+    for this application. It changes exactly when a sync would change what Discord has.
+    """
+    payload = sorted((command.to_dict(bot.tree) for command in bot.tree.get_commands()), key=lambda command: (command.get("type", 1), command["name"]))
+    encoded = json.dumps({"application_id": bot.application_id, "commands": payload}, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _read_hash():
+    try:
+        with open(SYNC_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_hash(value: str):
+    try:
+        with open(SYNC_HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(value)
+    except OSError as e:
+        print(f"[WARN] Could not store the command sync hash: {e}")
+
+
+async def sync_commands(bot, force: bool = False):
+    """
+    Pushes the command tree to Discord if it differs from the last successful sync, or always when `force` is set.
+    Returns the synced commands, or None when nothing had changed. Errors from the sync are re-raised.
+    """
+    current = command_tree_hash(bot)
+    if not force and current == await asyncio.to_thread(_read_hash):
+        return None
+    synced = await bot.tree.sync()
+    await asyncio.to_thread(_write_hash, current)
+    return synced
@@ -0,0 +1,119 @@
+import csv
+import gzip
+import heapq
+import io
+import json
+import os
+from utils.loader import iter_data
+from utils.archive import REPORT_COLLECTIONS
+
+# Columns of the CSV export, in order; NDJSON rows carry every stored field except the internal ones
+CSV_FIELDS = [
+    "id", "title", "status", "severity", "category", "reporterID", "original_reporter",
+    "reportedAt", "submittedAt", "statusChangedAt", "description", "reproducesteps",
+]
+# Sort and queue keys the bot derives and stores for its own indexes; not part of a report
+INTERNAL_FIELDS = ("sortDate", "severityRank", "priorityKey")
+EXPORT_FORMATS = ("csv", "ndjson")
+# The compressor holds back some output before it reaches the file, so parts are closed a little early
+PART_SAFETY_MARGIN = 512 * 1024
+EXPORT_BATCH_SIZE = 500
+
+
+def export_query(status: str = None, category: str = None, date_from: str = None, date_to: str = None) -> dict:
+    """
+    Storage query for the export filters. Dates are inclusive YYYY-MM-DD strings, which sort like dates.
+    """
+    query = {}
+    if status:
+        query["status"] = status
+    if category:
+        query["category"] = category
+    if date_from or date_to:
+        query["reportedAt"] = {}
+        if date_from:
+            query["reportedAt"]["$gte"] = date_from
+        if date_to:
+            query["reportedAt"]["$lte"] = date_to
+    return query
+
+
+def iter_reports(query: dict):
+    """
+    Streams matching reports from the hot and archive collections in ID order. Blocking generator.
+    A report caught mid-archive can briefly exist in both; it is only yielded once.
+    """
+    streams = [iter_data(name, query, sort=[("id", 1)], batch_size=EXPORT_BATCH_SIZE) for name in REPORT_COLLECTIONS]
+    last_id = None
+    for report in heapq.merge(*streams, key=lambda report: report.get("id", 0)):
+        if report.get("id") == last_id:
+            continue
+        last_id = report.get("id")
+        yield report
+
+
+class _PartWriter:
+    """
+    One gzip-compressed export file. Knows how much compressed data has reached the disk so far.
+    """
+
+    def __init__(self, path: str, fmt: str):
+        self.path = path
+        self.raw = open(path, "wb")
+        self.text = io.TextIOWrapper(gzip.GzipFile(fileobj=self.raw, mode="wb"), encoding="utf-8", newline="")
+        self.fmt = fmt
+        self.rows = 0
+        if fmt == "csv":
+            self.csv = csv.DictWriter(self.text, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            self.csv.writeheader()
+
+    def write(self, report: dict):
+        if self.fmt == "csv":
+            row = dict(report)
+            # Stored with escaped newlines; CSV quoting handles real ones
+            row["reproducesteps"] = (row.get("reproducesteps") or "").replace("\\n", "\n")
+            self.csv.writerow(row)
+        else:
+            row = {key: value for key, value in report.items() if key not in INTERNAL_FIELDS}
+            self.text.write(json.dumps(row, ensure_ascii=False, default=str))
+            self.text.write("\n")
+        self.rows += 1
+
+    def compressed_size(self) -> int:
+        return self.raw.tell()
+
+    def close(self):
+        self.text.close()  # Also flushes and closes the gzip stream
+        self.raw.close()
+
+
+def write_export(query: dict, fmt: str, directory: str, part_limit: int, base_name: str = "bug_reports"):
+    """
+    Writes the matching reports to gzip files in `directory`, starting a new part before one would pass `part_limit` bytes.
+    Only one batch of reports is in memory at a time. Blocking; run in a thread.
+    Returns (list of file paths, number of reports written).
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    threshold = max(part_limit - PART_SAFETY_MARGIN, part_limit // 2)
+    paths, total = [], 0
+    writer = None
+    try:
+        for report in iter_reports(query):
+            if writer is None or (writer.rows and writer.compressed_size() >= threshold):
+                if writer is not None:
+                    writer.close()
+                path = os.path.join(directory, f"{base_name}.part{len(paths) + 1}.{fmt}.gz")
+                writer = _PartWriter(path, fmt)
+                paths.append(path)
+            writer.write(report)
+            total += 1
+    finally:
+        if writer is not None:
+            writer.close()
+    if len(paths) == 1:
+        # No need for a part number when everything fit in one file
+        single = os.path.join(directory, f"{base_name}.{fmt}.gz")
+        os.replace(paths[0], single)
+        paths = [single]
+    return paths, total
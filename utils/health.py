@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+from aiohttp import web
+from utils.loader import ping_storage
+
+HEALTH_PORT = int(os.getenv("PORT", "8080"))
+STORAGE_PING_TIMEOUT_SECONDS = 3.0
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(bot) -> str:
+    """The bot's metrics in the Prometheus text exposition format."""
+    lines = []
+
+    def metric(name: str, kind: str, help_text: str, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        # A sample is (labels, value), or (suffix, labels, value) for the _sum/_count series of a summary
+        for sample in samples:
+            suffix, labels, value = sample if len(sample) == 3 else ("", *sample)
+            label_text = ",".join(f'{key}="{_label(val)}"' for key, val in labels.items())
+            lines.append(f"{name}{suffix}{{{label_text}}} {value}" if label_text else f"{name}{suffix} {value}")
+
+    metric("bot_up", "gauge", "1 while the gateway connection is ready.", [({}, int(bot.is_ready() and not bot.is_closed()))])
+    latency = bot.latency
+    if latency == latency and latency != float("inf"):  # NaN or inf until the first heartbeat
+        metric("bot_gateway_latency_seconds", "gauge", "Gateway heartbeat latency.", [({}, latency)])
+    metric("bot_guilds", "gauge", "Guilds the bot is in.", [({}, len(bot.guilds))])
+
+    outbound = bot.outbound.metrics()
+    metric("outbound_queued_jobs", "gauge", "Outbound Discord API calls waiting to run.", [({}, outbound["queued"])])
+    metric("outbound_workers", "gauge", "Outbound queue workers.", [({}, outbound["workers"])])
+    metric("outbound_throughput_per_second", "gauge", "Outbound jobs completed per second over the last minute.", [({}, outbound["throughput_per_second"])])
+    metric("outbound_jobs_completed_total", "counter", "Outbound jobs finished, per route.", [({"route": route}, count) for route, count in sorted(outbound["completed"].items())])
+    metric("outbound_jobs_failed_total", "counter", "Outbound jobs that raised, per route.", [({"route": route}, count) for route, count in sorted(outbound["failed"].items())])
+    waits = sorted(outbound["wait"].items())
+    metric("outbound_queue_wait_seconds", "summary", "Time outbound jobs spent queued, per priority.",
+           [("_sum", {"priority": priority}, stats["average_seconds"] * stats["jobs"]) for priority, stats in waits]
+           + [("_count", {"priority": priority}, stats["jobs"]) for priority, stats in waits])
+    metric("outbound_queue_wait_max_seconds", "gauge", "Longest time an outbound job spent queued, per priority.",
+           [({"priority": priority}, stats["max_seconds"]) for priority, stats in waits])
+
+    metric("timers_pending", "gauge", "Persistent timers waiting to fire.", [({}, bot.timers.pending())])
+    metric("cog_warmup_seconds", "gauge", "Duration of each cog's last warm-up.", [({"cog": name}, seconds) for name, seconds in sorted(bot.warmup.timings.items())])
+    metric("cog_warmup_failed", "gauge", "1 if the cog's last warm-up failed.", [({"cog": name}, int(name in bot.warmup.failed)) for name in sorted(bot.warmup.timings)])
+
+    misc = bot.get_cog("misc")
+    if misc is not None:
+        progress = misc.membership.progress()
+        metric("membership_sync_members", "gauge", "Members in the current (or last) role sync wave, per state.",
+               [({"state": state}, count) for state, count in progress["states"].items()])
+        metric("membership_sync_retries", "gauge", "Retries in the current (or last) role sync wave.", [({}, progress["retries"])])
+    return "\n".join(lines) + "\n"
+
+
+class HealthServer:
+    """
+    Small HTTP server on the bot's own event loop for uptime pings and monitoring:
+    /healthz (the process and loop are alive), /readyz (gateway connected, MongoDB reachable, cogs warmed up)
+    and /metrics (Prometheus text format). "/" still answers the old keep-alive pings.
+    """
+
+    def __init__(self, bot, port: int = HEALTH_PORT):
+        self.bot = bot
+        self.port = port
+        self._runner = None
+
+    async def start(self):
+        if self._runner:
+            return
+        app = web.Application()
+        app.add_routes([
+            web.get("/", self.keep_alive),
+            web.get("/healthz", self.healthz),
+            web.get("/readyz", self.readyz),
+            web.get("/metrics", self.metrics),
+        ])
+        # No access log: uptime monitors ping every few seconds
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "0.0.0.0", self.port).start()
+        print(f"Health server is listening on port {self.port}.")
+
+    async def close(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def keep_alive(self, request):
+        return web.Response(text="This is a keep-alive server.")
+
+    async def healthz(self, request):
+        return web.Response(text="ok")
+
+    async def readyz(self, request):
+        try:
+            storage = await asyncio.wait_for(asyncio.to_thread(ping_storage), STORAGE_PING_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            storage = False
+        checks = {
+            "gateway": self.bot.is_ready() and not self.bot.is_closed(),
+            "storage": storage,
+            "warmup": self.bot.warmup.is_ready(),
+        }
+        return web.Response(
+            text=json.dumps({"ready": all(checks.values()), "checks": checks}),
+            status=200 if all(checks.values()) else 503,
+            content_type="application/json",
+        )
+
+    async def metrics(self, request):
+        return web.Response(text=render_metrics(self.bot), headers={
+            "Content-Type": "text/plain; version=0.0.4; charset=utf-8",
+            "Cache-Control": "no-store",
+        })
@@ -1,5 +1,5 @@
 import os
-from pymongo import MongoClient
+from pymongo import MongoClient, ReplaceOne, UpdateOne, ReturnDocument
 from pymongo.errors import ConnectionFailure, OperationFailure
 
 # Global variables to hold the MongoDB client and database instances
@@ -80,6 +80,201 @@ def save_data(name: str, data):
     except Exception as e:
         print(f"An error occurred saving data to MongoDB collection '{name}': {e}")
 
+def insert_data(name: str, data):
+    """
+    Append one document or a list of documents to a MongoDB collection without touching existing ones.
+    """
+    db = _get_db()
+    try:
+        if isinstance(data, list):
+            if data:
+                # insert_many adds an '_id' to each dict, so hand it copies
+                db[name].insert_many([dict(document) for document in data])
+        else:
+            db[name].insert_one(dict(data))
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during insert: {e}")
+    except Exception as e:
+        print(f"An error occurred inserting data into MongoDB collection '{name}': {e}")
+
+def upsert_data(name: str, document: dict, key: str = "id"):
+    """
+    Insert or replace a single document in a MongoDB collection, matched on `key`.
+    Unlike save_data, this only touches the one document.
+    """
+    db = _get_db()
+    try:
+        db[name].replace_one({key: document[key]}, document, upsert=True)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during upsert: {e}")
+    except Exception as e:
+        print(f"An error occurred upserting data into MongoDB collection '{name}': {e}")
+
+def upsert_many(name: str, documents: list, key: str = "id"):
+    """
+    Insert or replace many documents in a MongoDB collection in one bulk write, matched on `key`.
+    """
+    if not documents:
+        return
+    db = _get_db()
+    try:
+        db[name].bulk_write([ReplaceOne({key: document[key]}, document, upsert=True) for document in documents], ordered=False)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during bulk upsert: {e}")
+    except Exception as e:
+        print(f"An error occurred bulk upserting data into MongoDB collection '{name}': {e}")
+
+def delete_data(name: str, query: dict):
+    """
+    Delete every document matching `query` from a MongoDB collection.
+    """
+    db = _get_db()
+    try:
+        db[name].delete_many(query)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during delete: {e}")
+    except Exception as e:
+        print(f"An error occurred deleting data from MongoDB collection '{name}': {e}")
+
+def increment_data(name: str, query: dict, increments: dict):
+    """
+    Atomically add the given amounts to fields of the document matching `query`, creating it if needed.
+    """
+    if not increments:
+        return
+    db = _get_db()
+    try:
+        db[name].update_one(query, {"$inc": increments}, upsert=True)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during increment: {e}")
+    except Exception as e:
+        print(f"An error occurred incrementing data in MongoDB collection '{name}': {e}")
+
+def update_data(name: str, query: dict, update, upsert: bool = True):
+    """
+    Atomically apply `update` (an update document or pipeline) to the document matching `query`,
+    creating it if needed. Returns the document as it is after the update, or None on failure.
+    """
+    db = _get_db()
+    try:
+        return db[name].find_one_and_update(query, update, projection={"_id": False}, upsert=upsert, return_document=ReturnDocument.AFTER)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during update: {e}")
+        return None
+    except Exception as e:
+        print(f"An error occurred updating data in MongoDB collection '{name}': {e}")
+        return None
+
+def increment_many(name: str, updates: list):
+    """
+    Apply many (query, increments) pairs in one bulk write, creating missing documents as needed.
+    """
+    operations = [UpdateOne(query, {"$inc": increments}, upsert=True) for query, increments in updates if increments]
+    if not operations:
+        return
+    db = _get_db()
+    try:
+        db[name].bulk_write(operations, ordered=False)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during bulk increment: {e}")
+    except Exception as e:
+        print(f"An error occurred bulk incrementing data in MongoDB collection '{name}': {e}")
+
+def find_data(name: str, query: dict = None, sort: list = None, limit: int = 0):
+    """
+    Load only the documents matching `query` from a MongoDB collection, optionally sorted and limited.
+    `sort` is a list of (field, direction) pairs as pymongo expects.
+    """
+    db = _get_db()
+    try:
+        cursor = db[name].find(query or {}, {"_id": False})
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during find: {e}")
+        return []
+    except Exception as e:
+        print(f"An error occurred finding data in MongoDB collection '{name}': {e}")
+        return []
+
+def text_search(name: str, text: str, query: dict = None, limit: int = 10):
+    """
+    Documents matching a $text search for `text` (the collection needs a text index) plus `query`,
+    best match first. Each document carries its relevance under "score".
+    """
+    db = _get_db()
+    try:
+        cursor = db[name].find(
+            {**(query or {}), "$text": {"$search": text}},
+            {"_id": False, "score": {"$meta": "textScore"}},
+        ).sort([("score", {"$meta": "textScore"})])
+        if limit:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during text search: {e}")
+        return []
+    except Exception as e:
+        print(f"An error occurred searching MongoDB collection '{name}': {e}")
+        return []
+
+def ensure_indexes(name: str, indexes: list):
+    """
+    Create the given indexes on a MongoDB collection if they do not exist yet.
+    Each index is a list of (field, direction) pairs as pymongo expects.
+    """
+    db = _get_db()
+    try:
+        for keys in indexes:
+            db[name].create_index(keys)
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' while creating indexes: {e}")
+    except Exception as e:
+        print(f"An error occurred creating indexes on MongoDB collection '{name}': {e}")
+
+def count_data(name: str, query: dict = None) -> int:
+    """
+    Count the documents matching `query` in a MongoDB collection without loading them.
+    """
+    db = _get_db()
+    try:
+        return db[name].count_documents(query or {})
+    except OperationFailure as e:
+        print(f"MongoDB operation failed for collection '{name}' during count: {e}")
+        return 0
+    except Exception as e:
+        print(f"An error occurred counting data in MongoDB collection '{name}': {e}")
+        return 0
+
+def iter_data(name: str, query: dict = None, sort: list = None, batch_size: int = 500):
+    """
+    Stream documents from a MongoDB collection without loading the whole result into memory.
+    This is a blocking generator, so iterate it from a worker thread.
+    """
+    db = _get_db()
+    cursor = db[name].find(query or {}, {"_id": False}).batch_size(batch_size)
+    if sort:
+        cursor = cursor.sort(sort)
+    try:
+        for document in cursor:
+            yield document
+    finally:
+        cursor.close()
+
+def ping_storage() -> bool:
+    """
+    Whether MongoDB answers a ping right now. Blocking; used by the readiness check.
+    """
+    try:
+        _get_db().client.admin.command('ping')
+        return True
+    except Exception as e:
+        print(f"MongoDB ping failed: {e}")
+        return False
+
 def close_mongo_connection():
     """
     Closes the MongoDB client connection.
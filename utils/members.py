@@ -0,0 +1,111 @@
+import asyncio
+import time
+import discord
+
+QUERY_BATCH_SIZE = 100  # Most user IDs the gateway member query accepts at once
+QUERY_BATCH_WINDOW = 0.05  # Seconds single lookups wait for others to share their query
+# How long a user known not to be in the guild is answered from memory; joining clears it early
+MISSING_MEMBER_TTL_SECONDS = 6 * 60 * 60
+
+
+class MemberLookup:
+    """
+    Shared member lookup. Answers from the guild cache, resolves cache misses through the gateway
+    member query (up to 100 IDs per request) instead of one REST fetch per user, and remembers
+    users who are not in the guild so they are not queried again.
+    """
+
+    def __init__(self):
+        self._missing = {}  # user ID -> monotonic time the negative entry expires
+        self._waiting = {}  # guild ID -> {user ID: future}, lookups waiting for the next batch
+        self._flush_tasks = {}  # guild ID -> task that sends the waiting batch
+
+    async def warm_up(self, guild: discord.Guild):
+        """Fills the member cache for the guild if discord.py has not chunked it already."""
+        if not guild.chunked:
+            started = time.perf_counter()
+            await guild.chunk(cache=True)
+            print(f"✅ Cached {guild.member_count} members of {guild.name} in {time.perf_counter() - started:.1f}s")
+
+    def is_missing(self, user_id: int) -> bool:
+        expires = self._missing.get(user_id)
+        if expires is None:
+            return False
+        if expires <= time.monotonic():
+            del self._missing[user_id]
+            return False
+        return True
+
+    def member_joined(self, user_id: int):
+        self._missing.pop(user_id, None)
+
+    def member_left(self, user_id: int):
+        self._missing[user_id] = time.monotonic() + MISSING_MEMBER_TTL_SECONDS
+
+    async def resolve(self, guild: discord.Guild, user_ids) -> dict:
+        """
+        Members for the given IDs, as {user ID: member}. IDs of users who are not in the guild are left out.
+        """
+        found, unknown = {}, []
+        for user_id in {int(user_id) for user_id in user_ids}:
+            member = guild.get_member(user_id)
+            if member is not None:
+                found[user_id] = member
+            elif not self.is_missing(user_id):
+                unknown.append(user_id)
+        for start in range(0, len(unknown), QUERY_BATCH_SIZE):
+            found.update(await self._query(guild, unknown[start:start + QUERY_BATCH_SIZE]))
+        return found
+
+    async def get(self, guild: discord.Guild, user_id: int):
+        """
+        One member, or None if they are not in the guild. Concurrent cache misses within
+        QUERY_BATCH_WINDOW are answered by a single gateway query.
+        """
+        user_id = int(user_id)
+        member = guild.get_member(user_id)
+        if member is not None or self.is_missing(user_id):
+            return member
+
+        waiting = self._waiting.setdefault(guild.id, {})
+        future = waiting.get(user_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            waiting[user_id] = future
+            if len(waiting) >= QUERY_BATCH_SIZE:
+                self._flush(guild)
+            elif guild.id not in self._flush_tasks:
+                self._flush_tasks[guild.id] = asyncio.create_task(self._flush_later(guild))
+        return await future
+
+    async def _flush_later(self, guild: discord.Guild):
+        await asyncio.sleep(QUERY_BATCH_WINDOW)
+        self._flush(guild)
+
+    def _flush(self, guild: discord.Guild):
+        task = self._flush_tasks.pop(guild.id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        batch = self._waiting.pop(guild.id, {})
+        if batch:
+            asyncio.create_task(self._answer(guild, batch))
+
+    async def _answer(self, guild: discord.Guild, batch: dict):
+        try:
+            found = await self._query(guild, list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for user_id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(user_id))
+
+    async def _query(self, guild: discord.Guild, user_ids: list) -> dict:
+        members = await guild.query_members(user_ids=user_ids, limit=len(user_ids), cache=True)
+        found = {member.id: member for member in members}
+        for user_id in user_ids:
+            if user_id not in found:
+                self.member_left(user_id)
+        return found
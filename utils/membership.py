@@ -0,0 +1,236 @@
+import asyncio
+import csv
+import os
+import random
+import time
+import discord
+from utils.loader import find_data, upsert_data, upsert_many, delete_data
+
+BTDB_COLLECTION = "btdb"
+# The sweep only catches what no event reported, such as entries edited straight in the database
+RECONCILE_INTERVAL_MINUTES = int(os.getenv("BT_RECONCILE_MINUTES", "30"))
+# Members handled at once. Role grants and kicks still go through the outbound scheduler's rate limits.
+SYNC_CONCURRENCY = int(os.getenv("BT_SYNC_CONCURRENCY", "4"))
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# Per-member states within a sync wave
+STATE_PENDING = "pending"
+STATE_IN_FLIGHT = "in-flight"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+SYNC_STATES = (STATE_PENDING, STATE_IN_FLIGHT, STATE_DONE, STATE_FAILED)
+
+BTDB_STATUSES = ("verified", "unverified")
+MAX_BULK_MODIFY_ENTRIES = 5000
+
+
+def needs_action(entry: dict, member: discord.Member, verified_role: discord.Role) -> bool:
+    """Whether a btdb entry asks for something the member does not have yet."""
+    status = entry.get("status")
+    if status == "verified":
+        return verified_role is not None and verified_role not in member.roles
+    return status == "unverified"
+
+
+def parse_status_list(text: str, default_status: str = None):
+    """
+    Parses a bulk /modify upload: one user per line as "user_id,status" (CSV, a header row is allowed)
+    or just "user_id" when `default_status` is given. Spaces or tabs may stand in for the comma.
+    Returns ({user ID: status}, [(line number, problem)]); a user listed twice keeps their last status.
+    """
+    statuses, errors = {}, []
+    for line_number, row in enumerate(csv.reader(text.splitlines()), start=1):
+        fields = [field.strip() for field in row if field.strip()]
+        if len(fields) == 1 and (" " in fields[0] or "\t" in fields[0]):
+            fields = fields[0].split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        if line_number == 1 and not fields[0].isdigit() and fields[0].lower() in ("id", "user_id", "userid", "user"):
+            continue  # Header row
+        user_id = fields[0]
+        status = fields[1].lower() if len(fields) > 1 else default_status
+        if not user_id.isdigit() or not 15 <= len(user_id) <= 20:
+            errors.append((line_number, f"`{user_id[:30]}` is not a Discord user ID"))
+        elif status is None:
+            errors.append((line_number, f"no status for `{user_id}`"))
+        elif status not in BTDB_STATUSES:
+            errors.append((line_number, f"unknown status `{status[:30]}`"))
+        elif len(fields) > 2:
+            errors.append((line_number, "too many columns"))
+        else:
+            statuses[user_id] = status
+    return statuses, errors
+
+
+def is_retryable(error: discord.HTTPException) -> bool:
+    """Rate limits and Discord-side errors are worth another try; anything else will fail the same way again."""
+    return error.status == 429 or error.status >= 500
+
+
+def backoff_delay(attempt: int, retry_after: float = None) -> float:
+    """Seconds to wait before retry number `attempt` (0-based): Retry-After if Discord sent one, else exponential with jitter."""
+    if retry_after:
+        return min(retry_after, BACKOFF_MAX_SECONDS)
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** attempt, BACKOFF_MAX_SECONDS)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class MembershipSync:
+    """
+    Applies btdb verification statuses to guild members when they change instead of polling.
+    Writers call enqueue() with the user ID they touched and a small pool of workers checks just
+    those entries, giving the tester role or kicking. Nothing runs while the queue is empty.
+
+    Every member queued since the pool was last idle makes up one wave; `states` tracks each of them
+    as pending, in-flight, done or failed so a large verification wave can report its progress.
+    """
+
+    def __init__(self, bot, role_log, concurrency: int = SYNC_CONCURRENCY):
+        self.bot = bot
+        self.role_log = role_log  # RoleLogAggregator for the ROLE UPDATE log lines
+        self.concurrency = max(1, concurrency)
+        self._queue = None
+        self._workers = []
+        self.states = {}  # user ID -> state in the current wave
+        self._rerun = set()  # Queued again while in flight; checked once more when the current run ends
+        self.wave_started = None
+        self.retries = 0
+
+    def start(self):
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self.states.clear()
+        self._rerun.clear()
+
+    def enqueue(self, user_id):
+        user_id = str(user_id)
+        state = self.states.get(user_id)
+        if state == STATE_PENDING:
+            return  # Repeated events collapse into one check
+        if state == STATE_IN_FLIGHT:
+            self._rerun.add(user_id)  # Never run the same member on two workers at once
+            return
+        self.start()
+        if not self.active():
+            # The previous wave is over; start counting a new one
+            self.states = {}
+            self.wave_started = time.monotonic()
+            self.retries = 0
+        self.states[user_id] = STATE_PENDING
+        self._queue.put_nowait(user_id)
+
+    def active(self) -> bool:
+        return any(state in (STATE_PENDING, STATE_IN_FLIGHT) for state in self.states.values())
+
+    def progress(self) -> dict:
+        """Counts per state for the current (or last) wave, plus retries and elapsed seconds."""
+        counts = {state: 0 for state in SYNC_STATES}
+        for state in self.states.values():
+            counts[state] += 1
+        return {
+            "states": counts,
+            "total": len(self.states),
+            "retries": self.retries,
+            "workers": len(self._workers),
+            "elapsed_seconds": time.monotonic() - self.wave_started if self.wave_started else 0.0,
+        }
+
+    async def set_status(self, user_id, status: str):
+        """Writes one btdb entry and checks the member right away."""
+        await asyncio.to_thread(upsert_data, BTDB_COLLECTION, {"id": str(user_id), "status": status})
+        self.enqueue(user_id)
+
+    async def set_statuses(self, statuses: dict):
+        """Writes many btdb entries in one bulk upsert and queues all of their members at once."""
+        await asyncio.to_thread(upsert_many, BTDB_COLLECTION, [{"id": user_id, "status": status} for user_id, status in statuses.items()])
+        for user_id in statuses:
+            self.enqueue(user_id)
+
+    async def reconcile(self) -> int:
+        """
+        Safety net: queues every member whose entry has not been applied. Members missing from the cache
+        are resolved in batches; users who are not in the guild are left to on_member_join.
+        Returns the number of members queued.
+        """
+        guild = discord.utils.get(self.bot.guilds)
+        if not guild:
+            return 0
+        verified_role = guild.get_role(int(os.getenv("BT_ROLE_ID")))
+        entries = await asyncio.to_thread(find_data, BTDB_COLLECTION)
+        entries = [entry for entry in entries if str(entry.get("id", "")).isdigit()]
+        members = await self.bot.member_lookup.resolve(guild, [entry["id"] for entry in entries])
+        queued = 0
+        for entry in entries:
+            member = members.get(int(entry["id"]))
+            if member is not None and needs_action(entry, member, verified_role):
+                self.enqueue(member.id)
+                queued += 1
+        return queued
+
+    async def _run(self):
+        while True:
+            user_id = await self._queue.get()
+            self.states[user_id] = STATE_IN_FLIGHT
+            try:
+                await self._apply_with_retry(user_id)
+                self.states[user_id] = STATE_DONE
+            except Exception as e:
+                self.states[user_id] = STATE_FAILED
+                print(f"[ERROR] Failed to sync membership of {user_id}: {e}")
+            if user_id in self._rerun:
+                self._rerun.discard(user_id)
+                self.enqueue(user_id)
+            elif not self.active():
+                progress = self.progress()
+                print(f"Membership sync finished {progress['total']} member(s) in {progress['elapsed_seconds']:.1f}s "
+                      f"({progress['states'][STATE_FAILED]} failed, {progress['retries']} retries)")
+
+    async def _apply_with_retry(self, user_id: str):
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return await self._apply(user_id)
+            except discord.HTTPException as e:
+                if not is_retryable(e) or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                self.retries += 1
+                delay = backoff_delay(attempt, getattr(e, "retry_after", None))
+                print(f"[WARN] Syncing {user_id} failed with HTTP {e.status}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _apply(self, user_id: str):
+        guild = discord.utils.get(self.bot.guilds)
+        if not guild:
+            return
+        entries = await asyncio.to_thread(find_data, BTDB_COLLECTION, {"id": user_id}, None, 1)
+        if not entries:
+            return
+
+        # Cache first, then a batched gateway query shared with the other workers; never a REST fetch
+        member = await self.bot.member_lookup.get(guild, int(user_id))
+        if member is None:
+            return  # Not in the guild; on_member_join queues them when they arrive
+
+        verified_role = guild.get_role(int(os.getenv("BT_ROLE_ID")))
+        entry = entries[0]
+        if not needs_action(entry, member, verified_role):
+            return
+        try:
+            if entry.get("status") == "verified":
+                await self.bot.outbound.add_roles(member, verified_role, reason="Auto-verified from DB")
+                self.role_log.log(f"Gave verified role to <@{user_id}>", discord.Color.green())
+            else:
+                await self.bot.outbound.kick(member, reason="Marked as unverified")
+                await asyncio.to_thread(delete_data, BTDB_COLLECTION, {"id": user_id})
+                self.role_log.log(f"Kicked unverified user <@{user_id}>", discord.Color.dark_gray())
+        except discord.Forbidden:
+            print(f"[WARN] Missing permissions to modify {user_id}")
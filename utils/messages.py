@@ -0,0 +1,73 @@
+import asyncio
+from utils.loader import load_data, upsert_data, delete_data
+
+REGISTRY_COLLECTION = "bugmsgs"
+
+
+class MessageRegistry:
+    """
+    Persistent map between bot messages and the bug reports they show.
+    Indexed by message ID, by report ID and by channel ID, so a button click or a channel
+    clean-up can find what it needs without parsing embeds or scanning channel history.
+    The indexes are only touched on the event loop; just the storage reads and writes go to a thread.
+    """
+
+    def __init__(self):
+        self.by_message = {}  # message ID -> (report ID, channel ID)
+        self.by_report = {}  # report ID -> {channel ID: message ID}
+        self.by_channel = {}  # channel ID -> set of message IDs
+
+    def __len__(self):
+        return len(self.by_message)
+
+    async def load(self):
+        """Reads the whole registry from storage."""
+        documents = await asyncio.to_thread(load_data, REGISTRY_COLLECTION)
+        self.by_message, self.by_report, self.by_channel = {}, {}, {}
+        for doc in documents:
+            if {"message_id", "report_id", "channel_id"} <= doc.keys():
+                self._index(doc["message_id"], doc["report_id"], doc["channel_id"])
+
+    def _index(self, message_id: int, report_id: int, channel_id: int):
+        self.by_message[message_id] = (report_id, channel_id)
+        self.by_report.setdefault(report_id, {})[channel_id] = message_id
+        self.by_channel.setdefault(channel_id, set()).add(message_id)
+
+    def _unindex(self, message_id: int):
+        entry = self.by_message.pop(message_id, None)
+        if entry is None:
+            return False
+        report_id, channel_id = entry
+        channels = self.by_report.get(report_id)
+        if channels and channels.get(channel_id) == message_id:
+            del channels[channel_id]
+            if not channels:
+                del self.by_report[report_id]
+        messages = self.by_channel.get(channel_id)
+        if messages:
+            messages.discard(message_id)
+            if not messages:
+                del self.by_channel[channel_id]
+        return True
+
+    def report_for_message(self, message_id: int):
+        entry = self.by_message.get(message_id)
+        return entry[0] if entry else None
+
+    def messages_for_report(self, report_id: int) -> dict:
+        return dict(self.by_report.get(report_id, {}))
+
+    def messages_in_channel(self, channel_id: int) -> set:
+        return set(self.by_channel.get(channel_id, ()))
+
+    async def register(self, message_id: int, report_id: int, channel_id: int):
+        """Records the message in memory and in storage."""
+        self._index(message_id, report_id, channel_id)
+        await asyncio.to_thread(upsert_data, REGISTRY_COLLECTION, {"message_id": message_id, "report_id": report_id, "channel_id": channel_id}, "message_id")
+
+    async def forget(self, message_ids):
+        """Drops the given message IDs from memory and storage."""
+        removed = [message_id for message_id in message_ids if self._unindex(message_id)]
+        if removed:
+            await asyncio.to_thread(delete_data, REGISTRY_COLLECTION, {"message_id": {"$in": removed}})
+        return removed
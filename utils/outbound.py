@@ -0,0 +1,276 @@
+import asyncio
+import itertools
+import time
+from collections import defaultdict, deque
+
+# Lower numbers run first
+PRIORITY_INTERACTION = 0  # Work someone is waiting on right now (button clicks, slash commands)
+PRIORITY_NORMAL = 1  # Background work such as logs and role sync
+PRIORITY_BULK = 2  # Large jobs like /loadreports that should yield to everything else
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTION: "interaction",
+    PRIORITY_NORMAL: "normal",
+    PRIORITY_BULK: "bulk",
+}
+
+# (tokens per second, burst size). Kept a little under Discord's published limits so
+# we rarely hit a 429 and discord.py's own header-based waiting stays a fallback.
+GLOBAL_LIMIT = (40, 40)
+ROUTE_LIMITS = {
+    "send": (5, 10),
+    "edit": (5, 5),
+    "delete": (5, 5),
+    "bulk_delete": (1, 2),
+    "add_roles": (2, 5),
+    "remove_roles": (2, 5),
+    "kick": (1, 3),
+    "fetch_member": (5, 10),
+}
+DEFAULT_ROUTE_LIMIT = (5, 5)
+# Discord allows 5 messages per 5 seconds in a single channel
+CHANNEL_LIMIT = (1, 5)
+
+DEFAULT_CONCURRENCY = 4
+THROUGHPUT_WINDOW = 60  # Seconds of completions used for the throughput figure
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available, 0 if one is available now."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class _Job:
+    __slots__ = ("factory", "route", "channel_id", "priority", "future", "enqueued_at")
+
+    def __init__(self, factory, route, channel_id, priority, future):
+        self.factory = factory
+        self.route = route
+        self.channel_id = channel_id
+        self.priority = priority
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class OutboundScheduler:
+    """
+    Shared queue for outbound Discord API calls.
+    Jobs run in priority order on a fixed number of workers, and each job waits for a token from
+    the global bucket, its route bucket and (for channel actions) its channel bucket before it runs.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        self.concurrency = concurrency
+        self._queue = None
+        self._workers = []
+        self._sequence = itertools.count()
+        self._global_bucket = TokenBucket(*GLOBAL_LIMIT)
+        self._route_buckets = {}
+        self._channel_buckets = {}
+        # Only one job per channel runs at a time so messages land in submission order.
+        # Jobs for a busy channel wait in its backlog instead of tying up a worker.
+        self._busy_channels = set()
+        self._channel_backlogs = {}  # channel id -> deque of (priority, sequence, job)
+        self._running = set()  # jobs a worker has taken and not finished yet
+
+        # Metrics
+        self._completed = defaultdict(int)  # route -> completed jobs
+        self._failed = defaultdict(int)  # route -> failed jobs
+        self._wait_totals = defaultdict(float)  # priority -> summed queue wait in seconds
+        self._wait_counts = defaultdict(int)  # priority -> jobs that left the queue
+        self._wait_max = defaultdict(float)  # priority -> longest queue wait in seconds
+        self._recent_completions = deque()  # monotonic timestamps within THROUGHPUT_WINDOW
+
+    def start(self):
+        if self._workers:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def close(self):
+        # Taken before the workers are cancelled, since each one drops its job from the set as it unwinds
+        running = list(self._running)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # Anything still queued or cut off mid-run will never finish, so fail it instead of leaving callers hanging
+        pending = running
+        while self._queue and not self._queue.empty():
+            pending.append(self._queue.get_nowait()[2])
+        for backlog in self._channel_backlogs.values():
+            pending.extend(entry[2] for entry in backlog)
+        self._channel_backlogs.clear()
+        self._busy_channels.clear()
+        for job in pending:
+            if not job.future.done():
+                job.future.set_exception(RuntimeError("Outbound scheduler closed before the job finished."))
+
+    async def submit(self, factory, *, route: str, channel_id: int = None, priority: int = PRIORITY_NORMAL):
+        """
+        Queues `factory` (a zero-argument callable returning an awaitable) and waits for its result.
+        Exceptions raised by the call are re-raised to the caller.
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        job = _Job(factory, route, channel_id, priority, future)
+        self._queue.put_nowait((priority, next(self._sequence), job))
+        return await future
+
+    # --- Convenience wrappers for the calls the cogs make ---
+
+    async def send(self, channel, *, priority: int = PRIORITY_NORMAL, **kwargs):
+        return await self.submit(lambda: channel.send(**kwargs), route="send", channel_id=channel.id, priority=priority)
+
+    async def edit(self, message, *, priority: int = PRIORITY_NORMAL, **kwargs):
+        return await self.submit(lambda: message.edit(**kwargs), route="edit", channel_id=message.channel.id, priority=priority)
+
+    async def delete(self, message, *, priority: int = PRIORITY_NORMAL):
+        return await self.submit(message.delete, route="delete", channel_id=message.channel.id, priority=priority)
+
+    async def delete_messages(self, channel, messages, *, priority: int = PRIORITY_BULK):
+        return await self.submit(lambda: channel.delete_messages(messages), route="bulk_delete", channel_id=channel.id, priority=priority)
+
+    async def add_roles(self, member, *roles, reason: str = None, priority: int = PRIORITY_NORMAL):
+        return await self.submit(lambda: member.add_roles(*roles, reason=reason), route="add_roles", priority=priority)
+
+    async def remove_roles(self, member, *roles, reason: str = None, priority: int = PRIORITY_NORMAL):
+        return await self.submit(lambda: member.remove_roles(*roles, reason=reason), route="remove_roles", priority=priority)
+
+    async def kick(self, member, *, reason: str = None, priority: int = PRIORITY_NORMAL):
+        return await self.submit(lambda: member.kick(reason=reason), route="kick", priority=priority)
+
+    async def fetch_member(self, guild, user_id: int, *, priority: int = PRIORITY_NORMAL):
+        return await self.submit(lambda: guild.fetch_member(user_id), route="fetch_member", priority=priority)
+
+    # --- Internals ---
+
+    def _buckets_for(self, job: _Job):
+        route_bucket = self._route_buckets.get(job.route)
+        if route_bucket is None:
+            route_bucket = self._route_buckets[job.route] = TokenBucket(*ROUTE_LIMITS.get(job.route, DEFAULT_ROUTE_LIMIT))
+        buckets = [self._global_bucket, route_bucket]
+        if job.channel_id is not None:
+            channel_bucket = self._channel_buckets.get(job.channel_id)
+            if channel_bucket is None:
+                channel_bucket = self._channel_buckets[job.channel_id] = TokenBucket(*CHANNEL_LIMIT)
+            buckets.append(channel_bucket)
+        return buckets
+
+    async def _acquire(self, job: _Job):
+        buckets = self._buckets_for(job)
+        while True:
+            now = time.monotonic()
+            delay = max(bucket.wait_time(now) for bucket in buckets)
+            if delay <= 0:
+                for bucket in buckets:
+                    bucket.consume(now)
+                return
+            await asyncio.sleep(delay)
+
+    async def _worker(self):
+        while True:
+            entry = await self._queue.get()
+            job = entry[2]
+            try:
+                if job.future.cancelled():
+                    # A cancelled job taken from a channel backlog still has to hand the channel on
+                    if job.channel_id is not None and job.channel_id not in self._busy_channels:
+                        self._release_channel(job.channel_id)
+                    continue
+                if job.channel_id is None:
+                    await self._run(job)
+                    continue
+
+                if job.channel_id in self._busy_channels:
+                    self._channel_backlogs.setdefault(job.channel_id, deque()).append(entry)
+                    continue
+
+                self._busy_channels.add(job.channel_id)
+                try:
+                    await self._run(job)
+                finally:
+                    self._busy_channels.discard(job.channel_id)
+                    self._release_channel(job.channel_id)
+            finally:
+                self._queue.task_done()
+
+    def _release_channel(self, channel_id: int):
+        # Hand the channel's next job back to the queue with its original ordering key
+        backlog = self._channel_backlogs.get(channel_id)
+        if backlog:
+            self._queue.put_nowait(backlog.popleft())
+            if not backlog:
+                del self._channel_backlogs[channel_id]
+
+    async def _run(self, job: _Job):
+        self._running.add(job)
+        try:
+            await self._execute(job)
+        finally:
+            self._running.discard(job)
+
+    async def _execute(self, job: _Job):
+        await self._acquire(job)
+
+        waited = time.monotonic() - job.enqueued_at
+        self._wait_totals[job.priority] += waited
+        self._wait_counts[job.priority] += 1
+        self._wait_max[job.priority] = max(self._wait_max[job.priority], waited)
+
+        try:
+            result = await job.factory()
+        except Exception as e:
+            self._failed[job.route] += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._completed[job.route] += 1
+            self._recent_completions.append(time.monotonic())
+
+    def metrics(self) -> dict:
+        """
+        Snapshot of queue depth, queue wait per priority and throughput over the last THROUGHPUT_WINDOW seconds.
+        """
+        now = time.monotonic()
+        while self._recent_completions and now - self._recent_completions[0] > THROUGHPUT_WINDOW:
+            self._recent_completions.popleft()
+
+        return {
+            "queued": (self._queue.qsize() if self._queue else 0) + sum(len(backlog) for backlog in self._channel_backlogs.values()),
+            "workers": len(self._workers),
+            "throughput_per_second": len(self._recent_completions) / THROUGHPUT_WINDOW,
+            "completed": dict(self._completed),
+            "failed": dict(self._failed),
+            "wait": {
+                PRIORITY_NAMES.get(priority, str(priority)): {
+                    "jobs": count,
+                    "average_seconds": self._wait_totals[priority] / count,
+                    "max_seconds": self._wait_max[priority],
+                }
+                for priority, count in self._wait_counts.items()
+            },
+        }
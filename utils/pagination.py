@@ -0,0 +1,39 @@
+from utils.loader import find_data
+
+
+def _seek_condition(sort: list, cursor: dict, forward: bool) -> dict:
+    """
+    Matches documents strictly after (or before) `cursor` in `sort` order.
+    For sort [(a, 1), (id, 1)] and forward=True this is: a > A, or a == A and id > ID.
+    """
+    clauses = []
+    for position, (field, direction) in enumerate(sort):
+        operator = "$gt" if (direction == 1) == forward else "$lt"
+        clause = {previous: cursor[previous] for previous, _ in sort[:position]}
+        clause[field] = {operator: cursor[field]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
+def sort_cursor(document: dict, sort: list) -> dict:
+    """The sort key of a document, to seek from on the next or previous page."""
+    return {field: document.get(field) for field, _ in sort}
+
+
+def fetch_page(name: str, query: dict, sort: list, limit: int, after: dict = None, before: dict = None, from_end: bool = False) -> list:
+    """
+    Keyset (seek) pagination: returns up to `limit` documents in `sort` order that come after `after`,
+    before `before`, or at the very end when `from_end` is set. Blocking; run in a thread.
+    The last sort field must be unique (e.g. the report ID) so every document has a distinct position.
+    Reads only `limit` documents from an index on the sort fields however deep the page is.
+    """
+    if after is not None:
+        return find_data(name, {"$and": [query, _seek_condition(sort, after, True)]}, sort=sort, limit=limit)
+
+    if before is not None or from_end:
+        # Walk the index backwards from the cursor (or the end), then put the page back in display order
+        reverse_sort = [(field, -direction) for field, direction in sort]
+        reverse_query = {"$and": [query, _seek_condition(sort, before, False)]} if before is not None else query
+        return list(reversed(find_data(name, reverse_query, sort=reverse_sort, limit=limit)))
+
+    return find_data(name, query, sort=sort, limit=limit)
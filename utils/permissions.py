@@ -0,0 +1,69 @@
+import discord
+from discord import app_commands
+from utils.commands import ADMINS, GROUPS, COMMANDS_REFERENCE
+
+# Built once from utils.commands
+ROLE_GROUPS = {role_id: group for group, role_id in GROUPS.items() if role_id != GROUPS["none"]}
+
+DENIED_MESSAGE = "❌ You don't have permission to use this."
+
+
+class PermissionService:
+    """
+    Answers "may this user do that" for every cog.
+    Admin actions are limited to the hard-coded ADMINS; groups come only from the member's roles
+    (being in ADMINS does not add the "admin" group).
+    Each member's groups are worked out once and cached until their roles change (see on_member_update).
+    """
+
+    def __init__(self):
+        self._member_groups = {}  # user ID -> frozenset of group names
+        self._help_lines = {}  # frozenset of group names -> /help lines
+
+    def is_admin(self, user) -> bool:
+        """Hard-coded admin acting inside the guild."""
+        return isinstance(user, discord.Member) and user.id in ADMINS
+
+    def groups_for(self, member) -> frozenset:
+        groups = self._member_groups.get(member.id)
+        if groups is None:
+            groups = {"none"}
+            groups.update(ROLE_GROUPS[role.id] for role in getattr(member, "roles", ()) if role.id in ROLE_GROUPS)
+            groups = self._member_groups[member.id] = frozenset(groups)
+        return groups
+
+    def in_group(self, member, *groups: str) -> bool:
+        """Whether the member belongs to any of the given groups."""
+        return not self.groups_for(member).isdisjoint(groups)
+
+    def invalidate(self, user_id: int):
+        self._member_groups.pop(user_id, None)
+
+    def help_lines(self, member) -> list:
+        """The /help lines for the member's groups; shared by every member with the same groups."""
+        groups = self.groups_for(member)
+        lines = self._help_lines.get(groups)
+        if lines is None:
+            lines = self._help_lines[groups] = [
+                f"• **/{cmd['name']}** — {cmd['description']}"
+                for cmd in COMMANDS_REFERENCE  # Kept in reference order
+                if cmd["group"].lower() in groups
+            ]
+        return lines
+
+    async def check_admin(self, interaction: discord.Interaction, message: str = DENIED_MESSAGE) -> bool:
+        """For buttons and selects: True for admins, otherwise tells the user and returns False."""
+        if self.is_admin(interaction.user):
+            return True
+        await interaction.response.send_message(message, ephemeral=True)
+        return False
+
+
+permissions = PermissionService()
+
+
+def admin_only(message: str = DENIED_MESSAGE):
+    """Check for app commands that only admins may run."""
+    async def predicate(interaction: discord.Interaction) -> bool:
+        return await permissions.check_admin(interaction, message)
+    return app_commands.check(predicate)
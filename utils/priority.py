@@ -0,0 +1,178 @@
+import heapq
+import itertools
+from utils.loader import find_data, increment_many, iter_data, save_data
+from utils.triage import parse_timestamp
+
+REPORTER_STATS_COLLECTION = "reporterstats"
+
+# Everything is scored in days of waiting: a report gains one point per day it stays pending,
+# so a "very high" report jumps the queue ahead of anything less than two weeks older.
+SEVERITY_BONUS_DAYS = {"very high": 14.0, "high": 7.0, "medium": 3.0, "low": 1.0, "n/a": 0.0}
+# A reporter whose reports always get approved gains up to this much; one who is always declined loses as much
+ACCURACY_BONUS_DAYS = 5.0
+ACCEPTED_STATUSES = ("approved", "fixed")
+REJECTED_STATUSES = ("declined",)
+SECONDS_PER_DAY = 86400.0
+
+
+def _outcome(status: str):
+    status = (status or "pending").lower()
+    if status in ACCEPTED_STATUSES:
+        return "accepted"
+    if status in REJECTED_STATUSES:
+        return "declined"
+    return None
+
+
+def outcome_increments(old_status: str, new_status: str) -> dict:
+    """
+    How a status change moves a reporter's accepted / declined counters. Approved then fixed counts once.
+    """
+    old_outcome, new_outcome = _outcome(old_status), _outcome(new_status)
+    if old_outcome == new_outcome:
+        return {}
+    increments = {}
+    if old_outcome:
+        increments[old_outcome] = -1
+    if new_outcome:
+        increments[new_outcome] = 1
+    return increments
+
+
+class ReporterStats:
+    """
+    Accepted and declined report counts per reporter, persisted as counters so loading does not scan the archive.
+    """
+
+    def __init__(self):
+        self.counts = {}  # reporter ID -> {"accepted": n, "declined": n}
+
+    def load(self, collections):
+        """Blocking. Builds the counters from the given report collections the first time."""
+        docs = find_data(REPORTER_STATS_COLLECTION)
+        if docs:
+            self.counts = {doc["reporterID"]: {"accepted": doc.get("accepted", 0), "declined": doc.get("declined", 0)} for doc in docs if "reporterID" in doc}
+        else:
+            self.rebuild(collections)
+
+    def rebuild(self, collections):
+        """Blocking. Recounts every report in the given collections, streamed."""
+        counts = {}
+        for name in collections:
+            for report in iter_data(name):
+                outcome = _outcome(report.get("status"))
+                if outcome and report.get("reporterID"):
+                    counts.setdefault(str(report["reporterID"]), {"accepted": 0, "declined": 0})[outcome] += 1
+        self.counts = counts
+        save_data(REPORTER_STATS_COLLECTION, [{"reporterID": reporter_id, **totals} for reporter_id, totals in counts.items()])
+        return len(counts)
+
+    def approval_ratio(self, reporter_id: str) -> float:
+        """
+        Smoothed share of the reporter's decided reports that were accepted; 0.5 for someone with no history.
+        """
+        totals = self.counts.get(str(reporter_id), {})
+        accepted, declined = totals.get("accepted", 0), totals.get("declined", 0)
+        return (accepted + 1) / (accepted + declined + 2)
+
+    def apply(self, reporter_id: str, increments: dict):
+        """Updates the in-memory counters and returns the storage update to persist."""
+        totals = self.counts.setdefault(str(reporter_id), {"accepted": 0, "declined": 0})
+        for field, amount in increments.items():
+            totals[field] = totals.get(field, 0) + amount
+        return {"reporterID": str(reporter_id)}, increments
+
+
+def persist_reporter_updates(updates: list):
+    """Blocking; applies (query, increments) pairs from ReporterStats.apply in one bulk write."""
+    increment_many(REPORTER_STATS_COLLECTION, updates)
+
+
+def submitted_days(report: dict) -> float:
+    timestamp = parse_timestamp(report.get("submittedAt")) or parse_timestamp(report.get("reportedAt"))
+    return timestamp.timestamp() / SECONDS_PER_DAY if timestamp else 0.0
+
+
+def priority_key(report: dict, approval_ratio: float) -> float:
+    """
+    Heap key for a pending report; lower is reviewed first.
+    The score at time t is bonus + (t - submitted), and since t is the same for every report the queue order
+    only depends on bonus - submitted. Keys therefore never need refreshing as reports age.
+    """
+    severity = SEVERITY_BONUS_DAYS.get((report.get("severity") or "n/a").lower(), 0.0)
+    accuracy = ACCURACY_BONUS_DAYS * (2 * approval_ratio - 1)
+    return submitted_days(report) - severity - accuracy
+
+
+class ReportPriorityQueue:
+    """
+    Min-heap of pending report IDs with lazy invalidation: updating or removing a report marks its old entry
+    dead instead of searching the heap, so every change is O(log n). Dead entries are dropped when they surface.
+    """
+
+    def __init__(self):
+        self._heap = []  # [key, tie breaker, report ID, alive]
+        self._entries = {}  # report ID -> live heap entry
+        self._groups = {}  # report ID -> reporter ID
+        self._by_group = {}  # reporter ID -> set of queued report IDs
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, report_id):
+        return report_id in self._entries
+
+    def push(self, report_id: int, key: float, group: str = None):
+        self.remove(report_id)
+        entry = [key, next(self._counter), report_id, True]
+        self._entries[report_id] = entry
+        heapq.heappush(self._heap, entry)
+        if group is not None:
+            self._groups[report_id] = group
+            self._by_group.setdefault(group, set()).add(report_id)
+
+    def remove(self, report_id: int):
+        entry = self._entries.pop(report_id, None)
+        if entry is None:
+            return
+        entry[3] = False
+        group = self._groups.pop(report_id, None)
+        if group is not None:
+            members = self._by_group.get(group)
+            if members:
+                members.discard(report_id)
+                if not members:
+                    del self._by_group[group]
+        # Rebuild once dead entries dominate so the heap does not grow without bound
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if entry[3]]
+            heapq.heapify(self._heap)
+
+    def in_group(self, group: str) -> set:
+        return set(self._by_group.get(group, ()))
+
+    def first(self, skip=None):
+        """
+        The queued report ID with the lowest key for which `skip(report_id)` is false, or None.
+        Only the entries that are skipped are popped and pushed back, so this stays O(log n) per skipped entry.
+        """
+        set_aside = []
+        found = None
+        while self._heap:
+            entry = self._heap[0]
+            if not entry[3]:
+                heapq.heappop(self._heap)
+                continue
+            if skip is not None and skip(entry[2]):
+                set_aside.append(heapq.heappop(self._heap))
+                continue
+            found = entry[2]
+            break
+        for entry in set_aside:
+            heapq.heappush(self._heap, entry)
+        return found
+
+    def ordered(self) -> list:
+        """All queued report IDs, first to be reviewed first. O(n log n); callers cache the result."""
+        return [entry[2] for entry in sorted(entry for entry in self._heap if entry[3])]
@@ -0,0 +1,202 @@
+from datetime import datetime, timedelta
+from enum import IntEnum
+
+
+class Category(IntEnum):
+    MINING = 0
+    FORAGING = 1
+    DUNGEONS = 2
+    SLAYERS = 3
+    ISLAND = 4
+    FISHING = 5
+    OTHERS = 6
+
+
+class Severity(IntEnum):
+    # In rank order, most severe first, so the value doubles as the severity sort key
+    VERY_HIGH = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+    NA = 4
+
+
+class Status(IntEnum):
+    PENDING = 0
+    APPROVED = 1
+    FIXED = 2
+    DECLINED = 3
+
+
+# Stored label -> enum member. Labels are what the commands, embeds and storage use.
+CATEGORY_LABELS = {member.name.lower(): member for member in Category}
+SEVERITY_LABELS = {"very high": Severity.VERY_HIGH, "high": Severity.HIGH, "medium": Severity.MEDIUM, "low": Severity.LOW, "n/a": Severity.NA}
+STATUS_LABELS = {member.name.lower(): member for member in Status}
+# Enum member -> label, per enum: members of different IntEnums with the same value compare equal
+_CATEGORY_NAMES = {member: label for label, member in CATEGORY_LABELS.items()}
+_SEVERITY_NAMES = {member: label for label, member in SEVERITY_LABELS.items()}
+_STATUS_NAMES = {member: label for label, member in STATUS_LABELS.items()}
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+UNKNOWN_SEVERITY_RANK = 99
+
+
+def _encode_label(labels: dict, names: dict, value):
+    """
+    The enum member for a stored label. Anything else, including a known label in other casing
+    ("Very High", "Pending" in older documents), is kept as given so it is saved back unchanged.
+    """
+    if isinstance(value, str):
+        member = labels.get(value.lower())
+        return member if member is not None and names[member] == value else value
+    return value
+
+
+def _decode_label(names: dict, value):
+    return names[value] if isinstance(value, IntEnum) else value
+
+
+def _encode_reporter(value):
+    if isinstance(value, str) and value.isdigit() and str(int(value)) == value:
+        return int(value)
+    return value
+
+
+def _decode_reporter(value):
+    return str(value) if isinstance(value, int) else value
+
+
+def _encode_day(value):
+    """YYYY-MM-DD -> days since 1970-01-01. Strings that would not come back identical are kept as strings."""
+    if not isinstance(value, str):
+        return value
+    try:
+        day = (datetime.strptime(value, "%Y-%m-%d") - EPOCH).days
+    except ValueError:
+        return value
+    return day if _decode_day(day) == value else value
+
+
+def _decode_day(value):
+    return (EPOCH + timedelta(days=value)).strftime("%Y-%m-%d") if isinstance(value, int) else value
+
+
+def _identity(value):
+    return value
+
+
+# Stored field -> (slot, encode, decode)
+FIELDS = {
+    "id": ("id", _identity, _identity),
+    "title": ("title", _identity, _identity),
+    "description": ("description", _identity, _identity),
+    "reproducesteps": ("reproducesteps", _identity, _identity),
+    "category": ("category", lambda value: _encode_label(CATEGORY_LABELS, _CATEGORY_NAMES, value), lambda value: _decode_label(_CATEGORY_NAMES, value)),
+    "severity": ("severity", lambda value: _encode_label(SEVERITY_LABELS, _SEVERITY_NAMES, value), lambda value: _decode_label(_SEVERITY_NAMES, value)),
+    "status": ("status", lambda value: _encode_label(STATUS_LABELS, _STATUS_NAMES, value), lambda value: _decode_label(_STATUS_NAMES, value)),
+    "reporterID": ("reporter_id", _encode_reporter, _decode_reporter),
+    "original_reporter": ("original_reporter", _encode_reporter, _decode_reporter),
+    "reportedAt": ("reported_day", _encode_day, _decode_day),
+    "submittedAt": ("submitted_at", _identity, _identity),
+    "statusChangedAt": ("status_changed_at", _identity, _identity),
+    "priorityKey": ("priority_key", _identity, _identity),
+}
+# Derived from other fields; written to storage for indexed sorting but never read back
+DERIVED_FIELDS = ("sortDate", "severityRank")
+
+
+class BugReport:
+    """
+    A resident bug report. Repeated strings are held as small ints (enums, the reporter ID and the report day),
+    and there is no per-instance dict. Behaves like the stored document for reading and assignment
+    (report["status"], report.get("reportedAt")), returning the same strings storage holds,
+    so code that works with documents from either collection works with records too.
+    Convert with from_document / to_document at the storage boundary.
+    """
+
+    __slots__ = tuple(slot for slot, _, _ in FIELDS.values()) + ("extra",)
+
+    def __init__(self):
+        for slot, _, _ in FIELDS.values():
+            setattr(self, slot, None)
+        self.extra = None  # Fields this class does not know about, kept so saving does not drop them
+
+    @classmethod
+    def from_document(cls, document: dict) -> "BugReport":
+        report = cls()
+        for key, value in document.items():
+            if key == "_id" or key in DERIVED_FIELDS:
+                continue
+            report[key] = value
+        return report
+
+    def to_document(self) -> dict:
+        document = {key: self[key] for key in self.keys()}
+        document["sortDate"] = self.sort_date
+        document["severityRank"] = self.severity_rank
+        return document
+
+    @property
+    def sort_date(self) -> int:
+        """reportedAt as a date ordinal; reports without a usable date sort as 1970-01-01."""
+        return EPOCH_ORDINAL + self.reported_day if isinstance(self.reported_day, int) else EPOCH_ORDINAL
+
+    @property
+    def severity_rank(self) -> int:
+        """Severity.VERY_HIGH first; a missing severity counts as n/a, an unrecognised one sorts last."""
+        if self.severity is None:
+            return int(Severity.NA)
+        if isinstance(self.severity, Severity):
+            return int(self.severity)
+        # Labels kept as strings because of their casing still rank as their severity
+        member = SEVERITY_LABELS.get(self.severity.lower()) if isinstance(self.severity, str) else None
+        return int(member) if member is not None else UNKNOWN_SEVERITY_RANK
+
+    # --- Document-style access ---
+
+    def __getitem__(self, key: str):
+        field = FIELDS.get(key)
+        if field is None:
+            if self.extra is None or key not in self.extra:
+                raise KeyError(key)
+            return self.extra[key]
+        value = getattr(self, field[0])
+        if value is None:
+            raise KeyError(key)
+        return field[2](value)
+
+    def __setitem__(self, key: str, value):
+        field = FIELDS.get(key)
+        if field:
+            setattr(self, field[0], None if value is None else field[1](value))
+        elif key not in DERIVED_FIELDS:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        field = FIELDS.get(key)
+        if field:
+            return getattr(self, field[0]) is not None
+        return bool(self.extra) and key in self.extra
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: str, default=None):
+        if key not in self:
+            self[key] = default
+        return self.get(key, default)
+
+    def keys(self) -> list:
+        return [key for key, (slot, _, _) in FIELDS.items() if getattr(self, slot) is not None] + list(self.extra or ())
+
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
+
+    def __repr__(self):
+        return f"<BugReport id={self.id} status={self.get('status')!r}>"
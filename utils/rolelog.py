@@ -0,0 +1,110 @@
+import asyncio
+import discord
+from discord import Embed
+
+ROLE_LOG_TITLE = "ROLE UPDATE:"
+ROLE_LOG_WINDOW_SECONDS = 5.0  # Events are held this long so a burst goes out together
+ROLE_LOG_MAX_BUFFERED = 50  # Flush straight away once this many are waiting
+# Discord limits for one message
+EMBEDS_PER_MESSAGE = 10
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_CHARACTERS_PER_MESSAGE = 6000
+
+
+def _summary_embeds(events: list) -> list:
+    """Runs of same-coloured events as compact embeds of one line per event."""
+    embeds, lines, color, length = [], [], None, 0
+
+    def close_embed():
+        if lines:
+            embed = Embed(title=ROLE_LOG_TITLE, description="\n".join(lines), color=color)
+            embed.set_footer(text=f"{len(lines)} update(s)")
+            embeds.append(embed)
+
+    for description, event_color in events:
+        if lines and (event_color != color or length + len(description) + 1 > EMBED_DESCRIPTION_LIMIT):
+            close_embed()
+            lines, length = [], 0
+        color = event_color
+        lines.append(description)
+        length += len(description) + 1
+    close_embed()
+    return embeds
+
+
+def pack_role_log(events: list) -> list:
+    """
+    The embeds to send for buffered (description, color) events, grouped into messages.
+    Up to 10 events keep one embed each as before; a larger burst is summarised one line per event.
+    """
+    if len(events) <= EMBEDS_PER_MESSAGE:
+        embeds = [Embed(title=ROLE_LOG_TITLE, description=description, color=color) for description, color in events]
+    else:
+        embeds = _summary_embeds(events)
+
+    messages, current, characters = [], [], 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (len(current) == EMBEDS_PER_MESSAGE or characters + size > EMBED_CHARACTERS_PER_MESSAGE):
+            messages.append(current)
+            current, characters = [], 0
+        current.append(embed)
+        characters += size
+    if current:
+        messages.append(current)
+    return messages
+
+
+class RoleLogAggregator:
+    """
+    Buffers ROLE UPDATE log lines and posts them together, so a verification wave costs a few
+    messages in the log channel instead of one per member. Flushes after ROLE_LOG_WINDOW_SECONDS,
+    as soon as ROLE_LOG_MAX_BUFFERED are waiting, and on close().
+    """
+
+    def __init__(self, bot, channel_id: int = None):
+        self.bot = bot
+        self.channel_id = channel_id
+        self._events = []  # (description, color) waiting to be sent
+        self._timer = None
+        self._flushes = set()
+        self._lock = asyncio.Lock()  # Keeps flushed batches in order
+
+    def log(self, description: str, color: discord.Color):
+        self._events.append((description, color))
+        if len(self._events) >= ROLE_LOG_MAX_BUFFERED:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            task = asyncio.create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(ROLE_LOG_WINDOW_SECONDS)
+        self._timer = None  # From here on a size-triggered flush must not cancel this one
+        await self.flush()
+
+    async def flush(self):
+        async with self._lock:
+            events, self._events = self._events, []
+            if not events:
+                return
+            channel = self.bot.get_channel(self.channel_id) if self.channel_id else None
+            if not channel:
+                return
+            for embeds in pack_role_log(events):
+                try:
+                    await self.bot.outbound.send(channel, embeds=embeds)
+                except discord.HTTPException as e:
+                    print(f"[WARN] Failed to send role update log: {e}")
+
+    async def close(self):
+        """Sends everything still buffered. Called when the cog unloads, including on shutdown."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
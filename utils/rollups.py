@@ -0,0 +1,96 @@
+from collections import defaultdict
+from utils.loader import increment_data, increment_many, find_data, iter_data, save_data, count_data
+
+ROLLUP_COLLECTION = "bugstats_daily"
+
+
+def _field_key(value) -> str:
+    # MongoDB field names cannot contain dots or start with '$'
+    return str(value).replace(".", "_").lstrip("$") or "unknown"
+
+
+def report_increments(report: dict, delta: int = 1) -> dict:
+    """
+    The rollup counters a single report contributes to its reportedAt day.
+    """
+    increments = {
+        "total": delta,
+        f"categories.{_field_key((report.get('category') or 'unknown').lower())}": delta,
+        f"statuses.{_field_key((report.get('status') or 'pending').lower())}": delta,
+    }
+    if report.get("reporterID"):
+        increments[f"reporters.{_field_key(report['reporterID'])}"] = delta
+    return increments
+
+
+def status_change_increments(old_status: str, new_status: str) -> dict:
+    old_status = (old_status or "pending").lower()
+    new_status = (new_status or "pending").lower()
+    if old_status == new_status:
+        return {}
+    return {f"statuses.{_field_key(old_status)}": -1, f"statuses.{_field_key(new_status)}": 1}
+
+
+def record_increments(date: str, increments: dict):
+    if date:
+        increment_data(ROLLUP_COLLECTION, {"date": date}, increments)
+
+
+def record_many(increments_by_date: dict):
+    """
+    Applies {date: increments} for several days in one bulk write.
+    """
+    increment_many(ROLLUP_COLLECTION, [({"date": date}, increments) for date, increments in increments_by_date.items() if date])
+
+
+def load_range(start_date: str, end_date: str) -> dict:
+    """
+    Merges the daily rollups between two inclusive YYYY-MM-DD dates into one summary.
+    Reads one document per day that had reports.
+    """
+    summary = {"days": 0, "total": 0, "reporters": defaultdict(int), "categories": defaultdict(int), "statuses": defaultdict(int)}
+    for day in find_data(ROLLUP_COLLECTION, {"date": {"$gte": start_date, "$lte": end_date}}):
+        summary["days"] += 1
+        summary["total"] += day.get("total", 0)
+        for field in ("reporters", "categories", "statuses"):
+            for key, count in (day.get(field) or {}).items():
+                summary[field][key] += count
+    return summary
+
+
+def rebuild_rollups(collections=("bugrep",)) -> int:
+    """
+    Regenerates every daily rollup from the raw reports in a single streaming pass.
+    Memory grows with the number of distinct days, not the number of reports. Returns the number of reports counted.
+    """
+    days = {}
+    counted = 0
+    for name in collections:
+        for report in iter_data(name):
+            date = report.get("reportedAt")
+            if not date:
+                continue
+            day = days.setdefault(date, {"date": date, "total": 0, "reporters": defaultdict(int), "categories": defaultdict(int), "statuses": defaultdict(int)})
+            for path, delta in report_increments(report).items():
+                if path == "total":
+                    day["total"] += delta
+                else:
+                    field, key = path.split(".", 1)
+                    day[field][key] += delta
+            counted += 1
+
+    save_data(ROLLUP_COLLECTION, [
+        {"date": day["date"], "total": day["total"], "reporters": dict(day["reporters"]), "categories": dict(day["categories"]), "statuses": dict(day["statuses"])}
+        for day in days.values()
+    ])
+    return counted
+
+
+def ensure_rollups(collections=("bugrep",)) -> int:
+    """
+    Builds the daily rollups from the raw reports the first time, when the collection is still empty.
+    Returns the number of reports counted, 0 if the rollups already existed.
+    """
+    if count_data(ROLLUP_COLLECTION):
+        return 0
+    return rebuild_rollups(collections)
@@ -0,0 +1,128 @@
+import math
+import re
+import heapq
+from collections import Counter
+
+# Words that show up in almost every report and only add noise to the ranking
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "i", "if", "in", "into",
+    "is", "it", "its", "my", "of", "on", "or", "so", "that", "the", "then", "there", "this", "to",
+    "was", "when", "with", "you", "your",
+})
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Title matches count more than matches buried in the description or steps
+FIELD_WEIGHTS = {
+    "title": 3,
+    "description": 1,
+    "reproducesteps": 1,
+}
+
+
+def _normalize_term(term: str) -> str:
+    # Very light stemming so "doors"/"door" and "crashes"/"crash" land on the same posting list
+    if len(term) > 4 and term.endswith("es") and not term.endswith("ses"):
+        return term[:-2]
+    if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+        return term[:-1]
+    return term
+
+
+def tokenize(text: str) -> list:
+    """
+    Splits text into lowercase, lightly stemmed terms with stopwords removed.
+    """
+    if not text:
+        return []
+    # reproducesteps is stored with escaped newlines
+    text = text.replace("\\n", " ").lower()
+    return [_normalize_term(term) for term in TOKEN_PATTERN.findall(text) if term not in STOPWORDS]
+
+
+class BugSearchIndex:
+    """
+    Incremental inverted index over bug report text, ranked with BM25.
+    Documents are keyed by report ID and can be added, replaced or removed one at a time.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = {}  # term -> {report_id: weighted term frequency}
+        self.doc_lengths = {}  # report_id -> weighted document length
+        self.doc_terms = {}  # report_id -> terms it was indexed under, so removal only touches its own postings
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    @staticmethod
+    def _weighted_terms(report: dict) -> Counter:
+        counts = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(report.get(field, "")):
+                counts[term] += weight
+        return counts
+
+    def add(self, report_id: int, report: dict):
+        if report_id in self.doc_lengths:
+            self.remove(report_id)
+
+        counts = self._weighted_terms(report)
+        for term, frequency in counts.items():
+            self.postings.setdefault(term, {})[report_id] = frequency
+
+        length = sum(counts.values())
+        self.doc_lengths[report_id] = length
+        self.doc_terms[report_id] = tuple(counts)
+        self.total_length += length
+
+    def remove(self, report_id: int):
+        length = self.doc_lengths.pop(report_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        # Empty posting lists are dropped so the vocabulary does not grow forever
+        for term in self.doc_terms.pop(report_id, ()):
+            docs = self.postings[term]
+            del docs[report_id]
+            if not docs:
+                del self.postings[term]
+
+    def rebuild(self, reports):
+        self.postings = {}
+        self.doc_lengths = {}
+        self.doc_terms = {}
+        self.total_length = 0
+        for report in reports:
+            self.add(report.get("id", 0), report)
+
+    def search(self, query: str, limit: int = 10, doc_filter=None) -> list:
+        """
+        Returns up to `limit` (report_id, score) pairs, best match first.
+        `doc_filter` is an optional callable taking a report ID that decides whether a hit is kept.
+        """
+        doc_count = len(self.doc_lengths)
+        if not doc_count:
+            return []
+
+        average_length = self.total_length / doc_count or 1
+        base_norm = self.k1 * (1 - self.b)
+        length_norm = self.k1 * self.b / average_length
+        doc_lengths = self.doc_lengths
+        scores = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            boost = idf * (self.k1 + 1)
+            for report_id, frequency in docs.items():
+                norm = base_norm + length_norm * doc_lengths[report_id]
+                scores[report_id] = scores.get(report_id, 0.0) + boost * frequency / (frequency + norm)
+
+        if doc_filter is not None:
+            scores = {report_id: score for report_id, score in scores.items() if doc_filter(report_id)}
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
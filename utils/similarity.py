@@ -0,0 +1,103 @@
+import hashlib
+import random
+from utils.search import tokenize
+
+# 20 bands of 3 rows puts the LSH threshold at roughly 37% Jaccard similarity over word pairs,
+# which is where reworded duplicates of the same bug tend to sit
+NUM_PERMUTATIONS = 60
+BANDS = 20
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 61) - 1
+
+# Fixed seed: stored signatures are only comparable if every process uses the same permutations
+_rng = random.Random(0xB06)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+
+def _hash_shingle(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big") & _MAX_HASH
+
+
+def shingles(report: dict) -> set:
+    """
+    Word 2-grams over the report title, description and reproduce steps.
+    Falls back to single words for very short reports.
+    """
+    terms = []
+    for field in ("title", "description", "reproducesteps"):
+        terms.extend(tokenize(report.get(field, "")))
+    if len(terms) < 2:
+        return set(terms)
+    return {f"{a} {b}" for a, b in zip(terms, terms[1:])}
+
+
+def minhash_signature(report: dict) -> list:
+    """
+    Computes the MinHash signature of a report. Reports without any text get an all-max signature.
+    """
+    hashes = [_hash_shingle(shingle) for shingle in shingles(report)]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERMUTATIONS
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def estimate_similarity(signature_a, signature_b) -> float:
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / NUM_PERMUTATIONS
+
+
+class DuplicateIndex:
+    """
+    Locality-sensitive hashing index over MinHash signatures.
+    Looking up a signature only compares it against reports that share at least one band bucket.
+    """
+
+    def __init__(self):
+        self.buckets = {}  # (band number, band values) -> set of report IDs
+        self.signatures = {}  # report ID -> signature tuple
+
+    def __len__(self):
+        return len(self.signatures)
+
+    @staticmethod
+    def _band_keys(signature):
+        for band in range(BANDS):
+            start = band * ROWS_PER_BAND
+            yield band, tuple(signature[start:start + ROWS_PER_BAND])
+
+    def add(self, report_id: int, signature):
+        if report_id in self.signatures:
+            self.remove(report_id)
+        signature = tuple(signature)
+        self.signatures[report_id] = signature
+        for key in self._band_keys(signature):
+            self.buckets.setdefault(key, set()).add(report_id)
+
+    def remove(self, report_id: int):
+        signature = self.signatures.pop(report_id, None)
+        if signature is None:
+            return
+        for key in self._band_keys(signature):
+            bucket = self.buckets.get(key)
+            if bucket:
+                bucket.discard(report_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def find_similar(self, signature, threshold: float = 0.4, limit: int = 5) -> list:
+        """
+        Returns up to `limit` (report_id, estimated similarity) pairs at or above `threshold`, most similar first.
+        """
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+
+        scored = []
+        for report_id in candidates:
+            similarity = estimate_similarity(signature, self.signatures[report_id])
+            if similarity >= threshold:
+                scored.append((report_id, similarity))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
@@ -0,0 +1,161 @@
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from utils.loader import find_data, upsert_data, delete_data
+
+TIMERS_COLLECTION = "timers"
+# Due jobs run on this many workers, so a backlog after downtime cannot flood the outbound queue
+TIMER_CONCURRENCY = int(os.getenv("TIMER_CONCURRENCY", "2"))
+MAX_ATTEMPTS = 5
+RETRY_DELAY_SECONDS = 60.0
+
+
+class TimerScheduler:
+    """
+    Persistent one-shot timers. Each timer is a document in the "timers" collection
+    ({"id", "kind", "dueAt", "payload", "attempts"}, dueAt in Unix seconds) mirrored in an in-memory
+    min-heap. A single sleeper waits exactly until the earliest due time (or until an earlier timer
+    is scheduled) and hands due timers to a small worker pool, which calls the handler registered
+    for the timer's kind. Timers are only deleted from storage once their handler has finished, so
+    anything pending or due while the bot was offline runs after load(). Those deletes match on dueAt
+    too, so they never remove a replacement scheduled under the same ID in the meantime.
+
+    Scheduling a timer with an existing ID replaces it; superseded heap entries are skipped when popped.
+    """
+
+    def __init__(self, concurrency: int = TIMER_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self._handlers = {}  # kind -> async callable taking the timer document
+        self._timers = {}  # timer ID -> (heap sequence, document) for every pending timer
+        self._heap = []  # (dueAt, sequence, timer ID)
+        self._sequence = itertools.count()
+        self._wake = None
+        self._sleeper = None
+        self._queue = None
+        self._workers = []
+        self._loaded = False
+
+    def register(self, kind: str, handler):
+        """Sets the coroutine function that runs timers of this kind. Re-registering replaces it (cog reloads)."""
+        self._handlers[kind] = handler
+
+    def start(self):
+        if self._sleeper:
+            return
+        self._wake = asyncio.Event()
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._sleeper = asyncio.create_task(self._sleep_until_due())
+
+    async def close(self):
+        tasks = self._workers + ([self._sleeper] if self._sleeper else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._sleeper = None
+
+    async def load(self) -> int:
+        """Reads pending timers back from storage after a restart. Only the first call does anything."""
+        if self._loaded:
+            return len(self._timers)
+        self._loaded = True
+        documents = await asyncio.to_thread(find_data, TIMERS_COLLECTION)
+        for document in documents:
+            if document.get("id") not in self._timers:
+                self._push(document)
+        self.start()
+        self._wake.set()
+        print(f"⏰ Loaded {len(documents)} pending timer(s)")
+        return len(documents)
+
+    async def schedule(self, timer_id: str, kind: str, due_at: float, payload: dict = None):
+        """Stores a timer and arms it. `due_at` is Unix time in seconds; a time in the past runs right away."""
+        document = {"id": timer_id, "kind": kind, "dueAt": float(due_at), "payload": payload or {}, "attempts": 0}
+        await asyncio.to_thread(upsert_data, TIMERS_COLLECTION, document)
+        self._push(document)
+
+    async def cancel(self, timer_id: str) -> bool:
+        """Removes a pending timer. Returns False if there was none."""
+        if self._timers.pop(timer_id, None) is None:
+            return False
+        await asyncio.to_thread(delete_data, TIMERS_COLLECTION, {"id": timer_id})
+        return True
+
+    def get(self, timer_id: str):
+        """The pending timer document, or None."""
+        entry = self._timers.get(timer_id)
+        return entry[1] if entry else None
+
+    def pending(self) -> int:
+        return len(self._timers)
+
+    def _push(self, document: dict):
+        sequence = next(self._sequence)
+        self._timers[document["id"]] = (sequence, document)
+        heapq.heappush(self._heap, (document["dueAt"], sequence, document["id"]))
+        self.start()
+        if self._heap[0][1] == sequence:
+            self._wake.set()  # New earliest timer; the sleeper re-arms for it
+
+    def _is_current(self, sequence: int, timer_id: str) -> bool:
+        entry = self._timers.get(timer_id)
+        return entry is not None and entry[0] == sequence
+
+    async def _sleep_until_due(self):
+        while True:
+            # Drop entries for timers that were cancelled or rescheduled
+            while self._heap and not self._is_current(self._heap[0][1], self._heap[0][2]):
+                heapq.heappop(self._heap)
+
+            self._wake.clear()
+            if not self._heap:
+                await self._wake.wait()
+                continue
+            delay = self._heap[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, sequence, timer_id = heapq.heappop(self._heap)
+            self._queue.put_nowait((sequence, timer_id))
+
+    async def _worker(self):
+        while True:
+            sequence, timer_id = await self._queue.get()
+            if not self._is_current(sequence, timer_id):
+                continue  # Cancelled or rescheduled while it waited for a worker
+            document = self._timers[timer_id][1]
+            try:
+                handler = self._handlers.get(document["kind"])
+                if handler is None:
+                    raise LookupError(f"no handler registered for '{document['kind']}' timers")
+                await handler(document)
+            except Exception as e:
+                await self._retry_or_drop(sequence, document, e)
+                continue
+            if self._is_current(sequence, timer_id):
+                # Not rescheduled by the handler itself
+                del self._timers[timer_id]
+                await asyncio.to_thread(delete_data, TIMERS_COLLECTION, {"id": timer_id, "dueAt": document["dueAt"]})
+
+    async def _retry_or_drop(self, sequence: int, document: dict, error: Exception):
+        timer_id = document["id"]
+        if not self._is_current(sequence, timer_id):
+            return
+        attempts = document.get("attempts", 0) + 1
+        if attempts >= MAX_ATTEMPTS:
+            print(f"[ERROR] Timer {timer_id} failed {attempts} times, dropping it: {error}")
+            del self._timers[timer_id]
+            await asyncio.to_thread(delete_data, TIMERS_COLLECTION, {"id": timer_id, "dueAt": document["dueAt"]})
+            return
+        print(f"[WARN] Timer {timer_id} failed ({error}); retrying in {RETRY_DELAY_SECONDS:.0f}s")
+        document = dict(document, dueAt=time.time() + RETRY_DELAY_SECONDS, attempts=attempts)
+        await asyncio.to_thread(upsert_data, TIMERS_COLLECTION, document)
+        if self._is_current(sequence, timer_id):
+            self._push(document)
@@ -0,0 +1,156 @@
+import bisect
+from datetime import datetime, timezone
+from utils.loader import find_data, increment_many, insert_data
+
+EVENTS_COLLECTION = "bugevents"
+PROJECTION_COLLECTION = "triagestats"
+
+# Upper bounds (in seconds) of the latency histogram buckets; the last bucket is open-ended
+BUCKET_BOUNDS = [
+    60, 5 * 60, 15 * 60, 30 * 60,
+    3600, 3 * 3600, 6 * 3600, 12 * 3600,
+    86400, 2 * 86400, 4 * 86400, 7 * 86400, 14 * 86400, 30 * 86400, 60 * 86400,
+]
+BUCKET_COUNT = len(BUCKET_BOUNDS) + 1
+
+# The latency of a transition is the time spent in the state it leaves
+METRIC_NAMES = {
+    "pending": "Time to triage",
+    "approved": "Time to fix",
+}
+DIMENSIONS = ("category", "severity")
+
+
+def utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_timestamp(value: str):
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def format_duration(seconds: float) -> str:
+    if seconds == float("inf"):
+        return f"> {format_duration(BUCKET_BOUNDS[-1])}"
+    if seconds < 3600:
+        return f"{round(seconds / 60)}m"
+    if seconds < 86400:
+        return f"{round(seconds / 3600, 1)}h"
+    return f"{round(seconds / 86400, 1)}d"
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "total", "total_seconds")
+
+    def __init__(self, counts=None, total_seconds: float = 0.0):
+        self.counts = list(counts) if counts else [0] * BUCKET_COUNT
+        self.total = sum(self.counts)
+        self.total_seconds = total_seconds
+
+    def add(self, seconds: float) -> int:
+        bucket = bisect.bisect_left(BUCKET_BOUNDS, seconds)
+        self.counts[bucket] += 1
+        self.total += 1
+        self.total_seconds += seconds
+        return bucket
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Upper bound of the bucket holding the given percentile (0-1), so the real value is at most this.
+        """
+        if not self.total:
+            return 0.0
+        target = fraction * self.total
+        running = 0
+        for bucket, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return BUCKET_BOUNDS[bucket] if bucket < len(BUCKET_BOUNDS) else float("inf")
+        return float("inf")
+
+    @property
+    def mean(self) -> float:
+        return self.total_seconds / self.total if self.total else 0.0
+
+
+class TriageProjection:
+    """
+    Latency histograms per metric and per category / severity, kept up to date one event at a time.
+    Every update is also written to storage as counter increments, so loading it back reads one
+    document per histogram rather than replaying the event log.
+    """
+
+    def __init__(self):
+        self.histograms = {}  # (metric, dimension, value) -> LatencyHistogram
+
+    def load(self):
+        self.histograms = {
+            (doc["metric"], doc["dimension"], doc["value"]): LatencyHistogram(
+                [doc.get("counts", {}).get(str(bucket), 0) for bucket in range(BUCKET_COUNT)],
+                doc.get("total_seconds", 0.0),
+            )
+            for doc in find_data(PROJECTION_COLLECTION)
+            if {"metric", "dimension", "value"} <= doc.keys()
+        }
+
+    def get(self, metric: str, dimension: str = "all", value: str = "all"):
+        return self.histograms.get((metric, dimension, value))
+
+    def apply(self, report: dict, old_status: str, entered_at: datetime, left_at: datetime):
+        """
+        Records time spent in `old_status` for the report and returns the storage updates to persist.
+        """
+        metric = (old_status or "pending").lower()
+        if metric not in METRIC_NAMES or entered_at is None:
+            return []
+
+        seconds = max(0.0, (left_at - entered_at).total_seconds())
+        keys = [(metric, "all", "all")]
+        keys += [(metric, dimension, (report.get(dimension) or "n/a").lower()) for dimension in DIMENSIONS]
+
+        updates = []
+        for key in keys:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            bucket = histogram.add(seconds)
+            updates.append((
+                {"metric": key[0], "dimension": key[1], "value": key[2]},
+                {f"counts.{bucket}": 1, "total_seconds": seconds},
+            ))
+        return updates
+
+
+def entered_state_at(report: dict):
+    """
+    When the report entered its current status. Reports from before the event log only have a day.
+    """
+    timestamp = parse_timestamp(report.get("statusChangedAt") or report.get("submittedAt"))
+    if timestamp is None and report.get("reportedAt"):
+        timestamp = parse_timestamp(report["reportedAt"])
+    return timestamp
+
+
+def persist_transition(event: dict, projection_updates: list):
+    """
+    Appends the event to the log and applies the projection counter increments. Blocking; run in a thread.
+    """
+    persist_transitions([event], projection_updates)
+
+
+def persist_transitions(events: list, projection_updates: list):
+    """
+    Same as persist_transition for a batch: one insert for the events and one bulk write for the counters.
+    """
+    insert_data(EVENTS_COLLECTION, events)
+    merged = {}
+    for query, increments in projection_updates:
+        key = (query["metric"], query["dimension"], query["value"])
+        totals = merged.setdefault(key, (query, {}))[1]
+        for field, amount in increments.items():
+            totals[field] = totals.get(field, 0) + amount
+    increment_many(PROJECTION_COLLECTION, list(merged.values()))
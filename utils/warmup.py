@@ -0,0 +1,89 @@
+import asyncio
+import time
+import discord
+
+# How long an interaction waits for its cog to finish warming up before it is turned away.
+# Kept under Discord's 3 second window for the first response.
+READY_WAIT_SECONDS = 2.5
+STARTING_MESSAGE = "⏳ The bot is still starting up. Please try again in a few seconds."
+FAILED_MESSAGE = "❌ This part of the bot failed to load. Please tell an admin."
+
+
+class WarmUp:
+    """
+    Startup loading of cog state. A cog that needs state from storage before it can answer defines
+    `async def warm_up(self)`. Warm-ups of all cogs run concurrently once the cogs are loaded (and again for
+    a cog after /reload), so startup costs the slowest load rather than the sum of them and the
+    event loop stays free. Interactions that need a cog wait on its readiness via check() / wait().
+    """
+
+    def __init__(self):
+        self._events = {}  # cog name -> asyncio.Event, set once its warm-up has finished (or failed)
+        self._tasks = set()
+        self.timings = {}  # cog name -> seconds its last warm-up took
+        self.failed = {}  # cog name -> error from its last warm-up
+
+    def start(self, cogs) -> list:
+        """Starts warm-up tasks for the given cogs that define warm_up(); returns the tasks."""
+        started = []
+        for cog in cogs:
+            if not hasattr(cog, "warm_up"):
+                continue
+            self._events[cog.qualified_name] = asyncio.Event()
+            task = asyncio.create_task(self._warm(cog))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            started.append(task)
+        return started
+
+    def run_in_background(self, cogs):
+        """run() without waiting for it, so the bot can connect while the cogs load."""
+        task = asyncio.create_task(self.run(list(cogs)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def run(self, cogs):
+        """Warms the given cogs concurrently, waits for all of them and prints the timings."""
+        started = time.perf_counter()
+        tasks = self.start(cogs)
+        if not tasks:
+            return
+        await asyncio.gather(*tasks)
+        timings = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in sorted(self.timings.items(), key=lambda item: -item[1]))
+        print(f"🔥 Warm-up finished in {time.perf_counter() - started:.2f}s ({timings})")
+
+    async def _warm(self, cog):
+        name = cog.qualified_name
+        started = time.perf_counter()
+        try:
+            await cog.warm_up()
+            self.failed.pop(name, None)
+        except Exception as e:
+            self.failed[name] = e
+            print(f"❌ Warm-up of {name} failed: {e}")
+        finally:
+            self.timings[name] = time.perf_counter() - started
+            # Set even on failure so nothing waits forever; is_ready() stays False
+            self._events[name].set()
+
+    def is_ready(self, name: str = None) -> bool:
+        """Whether one cog (or, without a name, every cog started so far) has warmed up without errors."""
+        names = [name] if name else list(self._events)
+        return all(n not in self._events or (self._events[n].is_set() and n not in self.failed) for n in names)
+
+    async def wait(self, name: str, timeout: float = None) -> bool:
+        """Waits until the cog has warmed up. Returns False on timeout or if its warm-up failed."""
+        event = self._events.get(name)
+        if event is not None and not event.is_set():
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return self.is_ready(name)
+
+    async def check(self, interaction: discord.Interaction, name: str) -> bool:
+        """For interaction checks: True once the cog is ready, otherwise tells the user to retry and returns False."""
+        if await self.wait(name, READY_WAIT_SECONDS):
+            return True
+        await interaction.response.send_message(FAILED_MESSAGE if name in self.failed else STARTING_MESSAGE, ephemeral=True)
+        return False